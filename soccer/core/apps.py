@@ -7,8 +7,22 @@ class CoreConfig(AppConfig):
     def ready(self):
         from django.db.models.signals import post_migrate
         post_migrate.connect(_register_schedules_after_migrate, sender=self)
+        post_migrate.connect(_create_cache_table_after_migrate, sender=self)
+
+        from core import checks  # noqa: F401 — registers the system checks
+
+        from core.signals import signals_image_thumbnails, signals_response_cache, signals_search_keys
+        signals_image_thumbnails.connect()
+        signals_response_cache.connect()
+        signals_search_keys.connect()
 
             
 def _register_schedules_after_migrate(sender, **kwargs):
     from core.schedule import register_schedules
-    register_schedules()
\ No newline at end of file
+    register_schedules()
+
+
+def _create_cache_table_after_migrate(sender, using='default', **kwargs):
+    # settings.CACHES: the database cache's table (no-op for other backends)
+    from django.core.management import call_command
+    call_command('createcachetable', database=using)
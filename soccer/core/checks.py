@@ -0,0 +1,22 @@
+# core/checks.py
+
+from django.core.checks import Tags, Warning, register
+
+from core import response_cache
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if response_cache.shared_cache():
+        return []
+    return [
+        Warning(
+            'The default cache is per process (LocMemCache).',
+            hint=(
+                'Response / report versions, replica pins and search index versions are '
+                'bumped in one process and must be read by all the others — configure a '
+                'shared backend in settings.CACHES (REDIS_URL or the database cache).'
+            ),
+            id='core.W001',
+        )
+    ]
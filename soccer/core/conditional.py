@@ -0,0 +1,64 @@
+# core/conditional.py
+
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Conditional GET helpers — ETag / If-None-Match for JSON responses.
+#
+# A client that sends back the ETag it already holds gets an empty
+# 304 Not Modified instead of the body.
+# ─────────────────────────────────────────────────────────────────────────────
+
+LAYOUT_PARAM = 'layout'
+
+
+def etag_for(data) -> str:
+    """Strong ETag of the JSON representation of data."""
+    payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, separators=(',', ':'))
+    return '"%s"' % hashlib.md5(payload.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def not_modified(request, etag: str) -> bool:
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    # Weak comparison (RFC 9110 §13.1.2) — gzip middlewares weaken ETags on the way out
+    return '*' in candidates or etag.removeprefix('W/') in {c.removeprefix('W/') for c in candidates}
+
+
+def conditional_response(request, data, etag: str | None = None, headers: dict | None = None, **kwargs) -> Response:
+    """
+    Response(data) carrying an ETag; 304 with no body when the client's copy is current.
+    headers (Vary…) go on both — a 304 carries what the 200 would (RFC 9110 §15.4.5).
+    """
+    etag = etag or etag_for(data)
+    if not_modified(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    else:
+        response = Response(data, headers=headers, **kwargs)
+    response['ETag'] = etag
+    return response
+
+
+def requested_layout(request, default: str = 'full') -> str:
+    """
+    Response layout the client opted into —
+      ?layout=compact   or   Accept: application/json; layout=compact
+    """
+    layout = request.query_params.get(LAYOUT_PARAM)
+    if layout:
+        return layout
+    for media_range in request.headers.get('Accept', '').split(','):
+        for param in media_range.split(';')[1:]:
+            key, _, value = param.strip().partition('=')
+            if key == LAYOUT_PARAM and value:
+                return value.strip('"')
+    return default
@@ -0,0 +1,72 @@
+# core/face_detection.py
+
+import io
+from functools import lru_cache
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Face counting for profile images — the CPU-bound half of
+# core.utils.validate_profile_image.
+#
+# Kept free of Django imports: it is what the detection pool's worker
+# processes import, so a spawned worker starts with cv2 + numpy only.
+# ─────────────────────────────────────────────────────────────────────────────
+
+DETECT_WIDTH = 640
+
+# IMREAD_REDUCED_GRAYSCALE_n decodes straight to grey at 1/n scale — for JPEG
+# the scaling happens inside the decoder (DCT), so a phone photo is never
+# expanded to full-size BGR just to be shrunk again.
+_REDUCED_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+
+@lru_cache(maxsize=None)
+def face_cascade():
+    """Loaded once per process — the Haar XML is ~1 MB of parsing."""
+    return cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+
+
+def _decode_flag(data: bytes) -> int:
+    """Largest reduction that still leaves the image at least DETECT_WIDTH wide."""
+    try:
+        width = Image.open(io.BytesIO(data)).size[0]      # header only, no pixel decode
+    except Exception:
+        return cv2.IMREAD_GRAYSCALE
+    for factor, flag in _REDUCED_FLAGS:
+        if width // factor >= DETECT_WIDTH:
+            return flag
+    return cv2.IMREAD_GRAYSCALE
+
+
+def count_faces(data: bytes) -> int | None:
+    """Number of faces in the encoded image, or None when it cannot be decoded."""
+    buffer = np.frombuffer(data, np.uint8)
+    gray = cv2.imdecode(buffer, _decode_flag(data))
+    if gray is None:
+        return None
+
+    if gray.shape[1] > DETECT_WIDTH:
+        scale = DETECT_WIDTH / gray.shape[1]
+        gray = cv2.resize(gray, (DETECT_WIDTH, int(gray.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+
+    faces = face_cascade().detectMultiScale(
+        gray,
+        scaleFactor=1.1,
+        minNeighbors=5,
+        minSize=(30, 30),
+    )
+    return len(faces)
+
+
+def warm_up() -> None:
+    """Pool initializer — pay for the classifier before the first request does."""
+    cv2.setNumThreads(1)        # one detection per worker process; no oversubscription
+    face_cascade()
@@ -0,0 +1,116 @@
+"""
+Postman collection loader for the load-test harness.
+
+The shipped ``soccer.postman_collection.json`` is the source of truth for the
+request shapes (method, path, query, body).  Scenarios look a request up by its
+folder path, e.g. ``"User/Booking/create booking"``, and render it with the ids
+of the synthetic fixtures instead of the hard-coded ids saved in Postman.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode
+
+_UUID_RE     = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_VAR_RE      = re.compile(r"\{\{(\w+)\}\}")
+_COMMENT_RE  = re.compile(r"^\s*//.*$|(?<=[,\[{\s])//[^\n\"]*$", re.MULTILINE)
+_TRAILING_RE = re.compile(r",(\s*[}\]])")
+
+
+def _parse_body(raw: str | None) -> dict | None:
+    """Postman bodies contain ``//`` comments and trailing commas — strip them."""
+    if not raw or not raw.strip():
+        return None
+    cleaned = _COMMENT_RE.sub("", raw)
+    cleaned = _TRAILING_RE.sub(r"\1", cleaned)
+    try:
+        return json.loads(cleaned)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class RequestTemplate:
+    name:   str
+    method: str
+    path:   str
+    query:  dict = field(default_factory=dict)
+    body:   dict | None = None
+
+    @property
+    def label(self) -> str:
+        """Stable stats key — ids in the saved path collapse to ``{id}``."""
+        return f"{self.method} {_UUID_RE.sub('{id}', self.path)}"
+
+    def render(self, path_ids=(), query=None, body=None, variables=None) -> tuple[str, dict, dict | None]:
+        """
+        Returns ``(path, query, body)`` ready to send.
+
+        - ``path_ids``  replace the UUID segments of the saved path, in order.
+        - ``query``     is merged over the saved query string.
+        - ``body``      is merged over the saved JSON body.
+        - ``variables`` fill Postman ``{{var}}`` placeholders in the path.
+        """
+        ids  = iter(str(i) for i in path_ids)
+        path = _UUID_RE.sub(lambda m: next(ids, m.group(0)), self.path)
+        if variables:
+            path = _VAR_RE.sub(lambda m: str(variables.get(m.group(1), m.group(0))), path)
+        if not path.endswith("/"):
+            path += "/"
+
+        merged_query = {**self.query, **(query or {})}
+        merged_body  = {**(self.body or {}), **(body or {})} if (self.body or body) else None
+        return path, merged_query, merged_body
+
+
+class PostmanCollection:
+
+    def __init__(self, templates: dict[str, RequestTemplate]):
+        self._templates = templates
+
+    @classmethod
+    def load(cls, file_path) -> "PostmanCollection":
+        with open(file_path, encoding="utf-8") as fh:
+            data = json.load(fh)
+
+        templates: dict[str, RequestTemplate] = {}
+        cls._walk(data.get("item", []), "", templates)
+        return cls(templates)
+
+    @classmethod
+    def _walk(cls, items, prefix, templates):
+        for item in items:
+            name = f"{prefix}{item['name']}"
+            if "item" in item:
+                cls._walk(item["item"], f"{name}/", templates)
+                continue
+
+            request = item["request"]
+            url     = request["url"]["raw"] if isinstance(request["url"], dict) else request["url"]
+            url     = url.replace("{{BaseURL}}", "")
+            path, _, qs = url.partition("?")
+
+            templates[name] = RequestTemplate(
+                name   = name,
+                method = request["method"].upper(),
+                path   = path,
+                query  = dict(parse_qsl(qs)),
+                body   = _parse_body((request.get("body") or {}).get("raw")),
+            )
+
+    def __getitem__(self, name) -> RequestTemplate:
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise KeyError(f"Request '{name}' is not in the Postman collection.") from None
+
+    def __contains__(self, name) -> bool:
+        return name in self._templates
+
+    def names(self) -> list[str]:
+        return sorted(self._templates)
+
+
+def build_url(base_url: str, path: str, query: dict) -> str:
+    url = f"{base_url.rstrip('/')}{path}"
+    return f"{url}?{urlencode(query)}" if query else url
@@ -0,0 +1,157 @@
+"""
+Synthetic users, teams and JWTs for the load-test harness.
+
+Tokens are minted in-process with ``MyTokenObtainPairSerializer.get_token`` so
+the run never goes through the login endpoints (and their password hashing),
+and carry exactly the claims the API reads (``role``, ``club_id``).
+"""
+from dataclasses import dataclass, field
+from datetime import date
+
+from django.db import transaction
+
+from core.models import User, FootPreference
+from core.services.service_authentication import MyTokenObtainPairSerializer
+from dashboard_manage.models import Club, Pitch, ClubEquipment
+from player_team.models import Team, TeamImage, TeamMember, MemberStatus
+
+LOADTEST_PREFIX = "loadtest_"
+_PHONE_BASE     = 980000000      # 09 8xxxxxxx — kept apart from real numbers
+
+
+def _access_token(user) -> str:
+    return str(MyTokenObtainPairSerializer.get_token(user).access_token)
+
+
+@dataclass
+class SyntheticPlayer:
+    user_id: str
+    token:   str
+
+
+@dataclass
+class SyntheticTeamPair:
+    team_id:            str
+    challenged_team_id: str
+    captain:            SyntheticPlayer
+    challenged_captain: SyntheticPlayer
+
+
+@dataclass
+class ClubTarget:
+    club_id:       str
+    owner_token:   str
+    open_time:     object
+    close_time:    object
+    pitch_ids:     list = field(default_factory=list)
+    equipment_ids: list = field(default_factory=list)
+
+
+@dataclass
+class Fixtures:
+    players: list
+    clubs:   list
+    teams:   list
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Builders
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _get_or_create_player(index: int) -> User:
+    username = f"{LOADTEST_PREFIX}{index}"
+    user = User.objects.filter(username=username).first()
+    if user:
+        return user
+    return User.objects.create_user(
+        phone=f"0{_PHONE_BASE + index}",
+        username=username,
+        full_name=f"Load Test {index}",
+        role=1,
+        governorate=1,
+        birthday=date(2000, 1, 1),
+        height=175,
+        weight=70,
+        foot_preference=FootPreference.RIGHT,
+    )
+
+
+def _build_clubs(club_ids) -> list[ClubTarget]:
+    qs = Club.objects.filter(is_active=True).select_related("manager")
+    if club_ids:
+        qs = qs.filter(id__in=club_ids)
+
+    targets = []
+    for club in qs:
+        pitch_ids = list(
+            Pitch.objects
+            .filter(club_id=club.id, is_active=True, is_deteted=False)
+            .values_list("id", flat=True)
+        )
+        if not pitch_ids:
+            continue
+        equipment_ids = list(
+            ClubEquipment.objects
+            .filter(club_id=club.id, is_active=True, is_deteted=False)
+            .values_list("id", flat=True)
+        )
+        targets.append(ClubTarget(
+            club_id=str(club.id),
+            owner_token=_access_token(club.manager),
+            open_time=club.open_time,
+            close_time=club.close_time,
+            pitch_ids=[str(p) for p in pitch_ids],
+            equipment_ids=[str(e) for e in equipment_ids],
+        ))
+    return targets
+
+
+def _build_team_pairs(players: list[User]) -> list[SyntheticTeamPair]:
+    """Pairs of one-member teams (captain only) in challenge mode."""
+    logo = TeamImage.objects.first()
+    if logo is None:
+        return []
+
+    pairs = []
+    for i in range(0, len(players) - 1, 2):
+        teams = []
+        for captain in (players[i], players[i + 1]):
+            team, _ = Team.objects.get_or_create(
+                name=f"{LOADTEST_PREFIX}{captain.username}",
+                defaults={
+                    "captain": captain,
+                    "logo": logo,
+                    "governorate": captain.governorate,
+                    "challenge_mode": True,
+                },
+            )
+            TeamMember.objects.get_or_create(
+                team=team, player=captain,
+                defaults={"status": MemberStatus.ACTIVE, "is_captain": True},
+            )
+            teams.append(team)
+
+        pairs.append(SyntheticTeamPair(
+            team_id=str(teams[0].id),
+            challenged_team_id=str(teams[1].id),
+            captain=SyntheticPlayer(str(players[i].id), _access_token(players[i])),
+            challenged_captain=SyntheticPlayer(str(players[i + 1].id), _access_token(players[i + 1])),
+        ))
+    return pairs
+
+
+@transaction.atomic
+def build_fixtures(num_players: int, club_ids=None) -> Fixtures:
+    users   = [_get_or_create_player(i) for i in range(num_players)]
+    players = [SyntheticPlayer(str(u.id), _access_token(u)) for u in users]
+    return Fixtures(
+        players=players,
+        clubs=_build_clubs(club_ids),
+        teams=_build_team_pairs(users),
+    )
+
+
+def delete_fixtures() -> int:
+    """Removes every synthetic user (bookings, teams and challenges cascade)."""
+    deleted, _ = User.objects.filter(username__startswith=LOADTEST_PREFIX).delete()
+    return deleted
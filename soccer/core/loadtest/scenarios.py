@@ -0,0 +1,210 @@
+"""
+Async scenarios replayed against a running server.
+
+Each virtual user loops over its scenario until the run deadline:
+
+  booking   : show clubs → club detail → consolidated booking → calculate price
+              → create booking → (owner) list pitch bookings → accept (PAY)
+  challenge : captain creates a challenge → challenged captain accepts it
+
+Slots are drawn from a deliberately small pool per club (``slot_pool``) so
+concurrent users collide on the same (pitch, date, start_time) — that is the
+contention the booking flow has to survive on match-day peaks.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import httpx
+from django.conf import settings
+from django.utils import timezone
+
+from player_booking.models import BookingStatus
+from .collection import PostmanCollection, build_url
+from .fixtures import Fixtures, ClubTarget
+from .stats import StatsCollector
+
+
+@dataclass(frozen=True)
+class Slot:
+    pitch_id:   str
+    date:       str
+    start_time: str
+    end_time:   str
+
+
+def build_slot_pool(club: ClubTarget, size: int, duration_minutes: int = 60) -> list[Slot]:
+    today      = timezone.localdate()
+    open_hour  = club.open_time.hour
+    close_hour = club.close_time.hour if club.close_time.hour > open_hour else 23
+    max_days   = max(1, settings.MAX_NUM_DAY_BEFORE_BOOKING - 1)
+
+    pool = []
+    for _ in range(size):
+        day   = today + timedelta(days=random.randint(1, max_days))
+        hour  = random.randint(open_hour, max(open_hour, close_hour - 1))
+        start = datetime.combine(day, datetime.min.time()).replace(hour=hour)
+        end   = start + timedelta(minutes=duration_minutes)
+        pool.append(Slot(
+            pitch_id=random.choice(club.pitch_ids),
+            date=day.isoformat(),
+            start_time=start.strftime("%H:%M"),
+            end_time=end.strftime("%H:%M"),
+        ))
+    return pool
+
+
+class LoadRunner:
+
+    def __init__(self, base_url: str, collection: PostmanCollection, fixtures: Fixtures,
+                 slot_pool_size: int = 20, think_time: float = 0.0, timeout: float = 30.0):
+        self.base_url   = base_url
+        self.collection = collection
+        self.fixtures   = fixtures
+        self.think_time = think_time
+        self.timeout    = timeout
+        self.stats      = StatsCollector()
+        self.slot_pools = {
+            club.club_id: build_slot_pool(club, slot_pool_size)
+            for club in fixtures.clubs
+        }
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Transport
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def _send(self, client: httpx.AsyncClient, name: str, token: str,
+                    path_ids=(), query=None, body=None) -> httpx.Response | None:
+        template          = self.collection[name]
+        path, qs, payload = template.render(path_ids=path_ids, query=query, body=body)
+        url               = build_url(self.base_url, path, qs)
+        endpoint          = template.label
+
+        started = time.perf_counter()
+        try:
+            response = await client.request(
+                template.method, url,
+                json=payload,
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        except httpx.HTTPError:
+            self.stats.record(endpoint, (time.perf_counter() - started) * 1000, None)
+            return None
+
+        self.stats.record(endpoint, (time.perf_counter() - started) * 1000, response.status_code)
+        return response
+
+    async def _think(self):
+        if self.think_time:
+            await asyncio.sleep(random.uniform(0, self.think_time))
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Scenarios
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def booking_flow(self, client: httpx.AsyncClient, player, club: ClubTarget):
+        slot  = random.choice(self.slot_pools[club.club_id])
+        token = player.token
+        equipments = (
+            [{"id": random.choice(club.equipment_ids), "quantity": 1}]
+            if club.equipment_ids else []
+        )
+        booking_body = {
+            "club":       club.club_id,
+            "pitch":      slot.pitch_id,
+            "date":       slot.date,
+            "start_time": slot.start_time,
+            "end_time":   slot.end_time,
+            "equipments": equipments,
+        }
+
+        await self._send(client, "User/show clubs", token)
+        await self._think()
+        await self._send(client, "User/show club detail (pitches price and opening time)", token,
+                         query={"club_id": club.club_id})
+        await self._send(client, "User/Booking/show consolidated-booking", token,
+                         query={"club": club.club_id, "pitch": slot.pitch_id, "date": slot.date})
+        await self._think()
+        await self._send(client, "User/Booking/calculate-price", token, body=booking_body)
+
+        created = await self._send(client, "User/Booking/create booking", token, body=booking_body)
+        if created is None or created.status_code != 201:
+            return
+
+        await self._think()
+        listing = await self._send(
+            client, "Owner/Booking/show Booking base on pitch and date and time", club.owner_token,
+            query={"date": slot.date, "pitch_id": slot.pitch_id,
+                   "time_from": slot.start_time, "time_to": slot.end_time},
+        )
+        if listing is None or listing.status_code != 200:
+            return
+
+        pending_label = str(BookingStatus.PENDING_MANAGER.label)
+        for row in listing.json():
+            if row.get("status_display") == pending_label and row.get("start_time", "").startswith(slot.start_time):
+                await self._send(
+                    client, "Owner/Booking/convert booking status/convert-booking", club.owner_token,
+                    path_ids=[row["id"]], body={"status": BookingStatus.PAY.value},
+                )
+                break
+
+    async def challenge_flow(self, client: httpx.AsyncClient, pair, club: ClubTarget):
+        slot = random.choice(self.slot_pools[club.club_id])
+        created = await self._send(
+            client, "User/competition/create challenge", pair.captain.token,
+            body={
+                "team_id":            pair.team_id,
+                "challenged_team_id": pair.challenged_team_id,
+                "club_id":            club.club_id,
+                "pitch_id":           slot.pitch_id,
+                "date":               slot.date,
+                "start_time":         slot.start_time,
+                "end_time":           slot.end_time,
+            },
+        )
+        if created is None or created.status_code != 201:
+            return
+
+        await self._think()
+        await self._send(
+            client, "User/competition/show requested challenges to team", pair.challenged_captain.token,
+            path_ids=[pair.challenged_team_id],
+        )
+        await self._send(
+            client, "User/competition/reply to requested challenges", pair.challenged_captain.token,
+            path_ids=[created.json()["challenge_id"]], body={"action": "accept"},
+        )
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Driver
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def _virtual_user(self, client, index: int, deadline: float, challenge_ratio: float):
+        players = self.fixtures.players
+        teams   = self.fixtures.teams
+        clubs   = self.fixtures.clubs
+
+        while time.perf_counter() < deadline:
+            club = random.choice(clubs)
+            if teams and random.random() < challenge_ratio:
+                await self.challenge_flow(client, teams[index % len(teams)], club)
+            else:
+                await self.booking_flow(client, players[index % len(players)], club)
+
+    async def run(self, concurrency: int, duration_s: float, challenge_ratio: float = 0.2) -> float:
+        if not self.fixtures.clubs:
+            raise RuntimeError("No active club with active pitches to run against.")
+
+        limits   = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        started  = time.perf_counter()
+        deadline = started + duration_s
+
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            await asyncio.gather(*(
+                self._virtual_user(client, i, deadline, challenge_ratio)
+                for i in range(concurrency)
+            ))
+        return time.perf_counter() - started
@@ -0,0 +1,83 @@
+"""
+Per-endpoint latency / throughput / error-rate collection for the harness.
+
+Status codes are split into three buckets:
+  - ok        : 2xx
+  - rejected  : 4xx — business-rule refusals (slot taken, equipment exhausted…)
+                are expected under contention and reported apart from errors
+  - errors    : 5xx and transport failures (timeouts, connection resets)
+"""
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: list = field(default_factory=list)
+    ok:           int  = 0
+    rejected:     int  = 0
+    errors:       int  = 0
+    status_codes: dict = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def count(self) -> int:
+        return self.ok + self.rejected + self.errors
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank    = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[rank]
+
+
+class StatsCollector:
+
+    def __init__(self):
+        self._endpoints: dict[str, EndpointStats] = defaultdict(EndpointStats)
+
+    def record(self, endpoint: str, latency_ms: float, status_code: int | None):
+        stats = self._endpoints[endpoint]
+        stats.latencies_ms.append(latency_ms)
+        stats.status_codes[status_code or "transport"] += 1
+
+        if status_code is None or status_code >= 500:
+            stats.errors += 1
+        elif status_code >= 400:
+            stats.rejected += 1
+        else:
+            stats.ok += 1
+
+    def rows(self, elapsed_s: float) -> list[dict]:
+        elapsed_s = elapsed_s or 1.0
+        rows = []
+        for endpoint in sorted(self._endpoints):
+            s = self._endpoints[endpoint]
+            rows.append({
+                "endpoint":      endpoint,
+                "requests":      s.count,
+                "rps":           round(s.count / elapsed_s, 2),
+                "p50_ms":        round(s.percentile(50), 1),
+                "p95_ms":        round(s.percentile(95), 1),
+                "p99_ms":        round(s.percentile(99), 1),
+                "max_ms":        round(max(s.latencies_ms, default=0.0), 1),
+                "rejected_pct":  round(s.rejected / s.count * 100, 2) if s.count else 0.0,
+                "error_pct":     round(s.errors / s.count * 100, 2) if s.count else 0.0,
+                "status_codes":  dict(s.status_codes),
+            })
+        return rows
+
+    def format_table(self, elapsed_s: float) -> str:
+        header = (
+            f"{'endpoint':<42} {'reqs':>6} {'rps':>8} {'p50':>8} {'p95':>8} "
+            f"{'p99':>8} {'max':>8} {'4xx%':>7} {'err%':>7}"
+        )
+        lines = [header, "─" * len(header)]
+        for r in self.rows(elapsed_s):
+            lines.append(
+                f"{r['endpoint']:<42} {r['requests']:>6} {r['rps']:>8} {r['p50_ms']:>8} "
+                f"{r['p95_ms']:>8} {r['p99_ms']:>8} {r['max_ms']:>8} "
+                f"{r['rejected_pct']:>7} {r['error_pct']:>7}"
+            )
+        return "\n".join(lines)
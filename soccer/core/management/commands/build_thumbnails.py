@@ -0,0 +1,49 @@
+"""
+python manage.py build_thumbnails [--sync] [--force]
+
+Builds the missing thumbnails of every image in core.thumbnails.THUMBNAIL_FIELDS
+— for images uploaded before the derivative pipeline, or after a size change.
+Queues one core.tasks.build_thumbnail per image on the django-q cluster;
+--sync builds them in this process instead.
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from django_q.tasks import async_task
+
+from core import thumbnails
+from core.tasks import build_thumbnail
+
+
+class Command(BaseCommand):
+    help = "Build missing image thumbnails (logos, pitch / equipment photos, avatars)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sync", action="store_true", help="Build in this process instead of queueing.")
+        parser.add_argument("--force", action="store_true", help="Rebuild thumbnails that already exist.")
+
+    def handle(self, *args, **options):
+        queued = 0
+        for label, (field, size) in thumbnails.THUMBNAIL_FIELDS.items():
+            names = (
+                apps.get_model(label).objects
+                .exclude(**{field: ""})
+                .exclude(**{f"{field}__isnull": True})
+                .values_list(field, flat=True)
+                .distinct()
+            )
+            for name in names.iterator(chunk_size=1000):
+                if not options["force"] and thumbnails.is_ready(name, size):
+                    continue
+                if options["sync"]:
+                    try:
+                        build_thumbnail(name, size)
+                    except Exception as e:
+                        self.stderr.write(f"  {name}: {e}")
+                        continue
+                else:
+                    async_task("core.tasks.build_thumbnail", name, size)
+                queued += 1
+
+        verb = "Built" if options["sync"] else "Queued"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {queued} thumbnails."))
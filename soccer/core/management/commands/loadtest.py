@@ -0,0 +1,75 @@
+"""
+python manage.py loadtest --base-url http://127.0.0.1:8000 --users 50 --duration 60
+
+Replays the Postman collection flows (player booking → owner accept, team
+challenges) against a running server with synthetic players and prints
+per-endpoint throughput, latency percentiles and error rates.
+"""
+import asyncio
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadtest.collection import PostmanCollection
+from core.loadtest.fixtures import build_fixtures, delete_fixtures
+from core.loadtest.scenarios import LoadRunner
+
+DEFAULT_COLLECTION = Path(settings.BASE_DIR).parent / "soccer.postman_collection.json"
+
+
+class Command(BaseCommand):
+    help = "Load-test the booking and challenge flows derived from the Postman collection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url",        default="http://127.0.0.1:8000")
+        parser.add_argument("--collection",      default=str(DEFAULT_COLLECTION))
+        parser.add_argument("--users",           type=int,   default=20,  help="Concurrent virtual users.")
+        parser.add_argument("--duration",        type=float, default=30,  help="Run length in seconds.")
+        parser.add_argument("--club",            action="append", dest="clubs", help="Restrict to club id (repeatable).")
+        parser.add_argument("--slot-pool",       type=int,   default=20,  help="Distinct slots per club — smaller means more contention.")
+        parser.add_argument("--challenge-ratio", type=float, default=0.2, help="Share of iterations running the challenge flow.")
+        parser.add_argument("--think-time",      type=float, default=0.0, help="Max random pause between steps, seconds.")
+        parser.add_argument("--json",            dest="json_out", help="Also write the per-endpoint report to this file.")
+        parser.add_argument("--cleanup",         action="store_true", help="Delete the synthetic users and exit.")
+
+    def handle(self, *args, **options):
+        if options["cleanup"]:
+            deleted = delete_fixtures()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} synthetic rows."))
+            return
+
+        try:
+            collection = PostmanCollection.load(options["collection"])
+        except OSError as exc:
+            raise CommandError(f"Cannot read Postman collection: {exc}")
+
+        fixtures = build_fixtures(max(2, options["users"]), options["clubs"])
+        if not fixtures.clubs:
+            raise CommandError("No active club with active pitches found.")
+
+        self.stdout.write(
+            f"▶ {options['users']} users × {options['duration']}s against {options['base_url']} "
+            f"({len(fixtures.clubs)} clubs, {len(fixtures.teams)} team pairs)"
+        )
+
+        runner  = LoadRunner(
+            base_url=options["base_url"],
+            collection=collection,
+            fixtures=fixtures,
+            slot_pool_size=options["slot_pool"],
+            think_time=options["think_time"],
+        )
+        elapsed = asyncio.run(runner.run(
+            concurrency=options["users"],
+            duration_s=options["duration"],
+            challenge_ratio=options["challenge_ratio"],
+        ))
+
+        self.stdout.write(runner.stats.format_table(elapsed))
+
+        if options["json_out"]:
+            with open(options["json_out"], "w", encoding="utf-8") as fh:
+                json.dump({"elapsed_s": elapsed, "endpoints": runner.stats.rows(elapsed)}, fh, indent=2, default=str)
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['json_out']}"))
@@ -0,0 +1,29 @@
+"""
+python manage.py rebuild_search_keys
+
+Recomputes search_name for every model in core.search.SEARCH_FIELDS. Needed
+after bulk .update() / bulk_create() calls, which bypass the signals, or
+after a change to core.search.search_key. Club cards have their own
+command: rebuild_club_cards.
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the normalized search keys of users and teams."
+
+    def handle(self, *args, **options):
+        for label, source in search.SEARCH_FIELDS.items():
+            model = apps.get_model(label)
+            max_length = model._meta.get_field("search_name").max_length
+            stale = []
+            for pk, value, current in model._default_manager.values_list("pk", source, "search_name").iterator(chunk_size=2000):
+                key = search.search_key(value)[:max_length]
+                if key != current:
+                    stale.append(model(pk=pk, search_name=key))
+            model._default_manager.bulk_update(stale, ["search_name"], batch_size=1000)
+            search.changed(model)
+            self.stdout.write(self.style.SUCCESS(f"{label}: updated {len(stale)} search keys."))
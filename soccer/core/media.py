@@ -0,0 +1,63 @@
+# core/media.py
+
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Absolute media URLs for list responses.
+#
+# request.build_absolute_uri() re-validates the host against ALLOWED_HOSTS
+# and re-joins the URL on every call, and default_storage.url() re-quotes
+# the path; a schedule of pitches × days paid for both once per cell.
+# MediaURLBuilder resolves scheme://host once per request and each storage
+# name once, then serves repeats from a dict.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class MediaURLBuilder:
+
+    def __init__(self, request=None):
+        self._origin = f'{request.scheme}://{request.get_host()}' if request is not None else ''
+        self._urls: dict[str, str] = {}
+
+    def __call__(self, name) -> str | None:
+        """name — a storage name or a FieldFile; None when empty."""
+        name = str(name or '')
+        if not name:
+            return None
+        url = self._urls.get(name)
+        if url is None:
+            url = default_storage.url(name)
+            if url.startswith('/'):          # remote storages already return absolute URLs
+                url = self._origin + url
+            self._urls[name] = url
+        return url
+
+
+def media_urls(request) -> MediaURLBuilder:
+    """The request's builder — created on first use, shared by every serializer and service after."""
+    if request is None:
+        return MediaURLBuilder()
+    # DRF's Request proxies reads to the HttpRequest but keeps its own
+    # attributes; store on the HttpRequest so both see the same builder
+    http_request = getattr(request, '_request', request)
+    builder = getattr(http_request, '_media_urls', None)
+    if builder is None:
+        builder = http_request._media_urls = MediaURLBuilder(request)
+    return builder
+
+
+def media_url(name, request=None) -> str | None:
+    return media_urls(request)(name)
+
+
+class MediaURLField(serializers.Field):
+    """Read-only absolute URL of an image / file field, through the request's builder."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return media_url(value, self.context.get('request'))
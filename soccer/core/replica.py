@@ -0,0 +1,196 @@
+# core/replica.py
+
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest
+from rest_framework.request import Request
+
+from core import response_cache
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Read replica for reporting and history endpoints.
+#
+# Reads go to the 'replica' alias (settings: DB_REPLICA_HOST / DB_REPLICA_NAME)
+# only inside views that opt in — @use_replica on a function view or view
+# method, UseReplicaMixin on a DRF class view. Everything else, every write,
+# and every read inside a transaction stays on the primary.
+#
+# The view falls back to the primary when
+#   • the user wrote something in the last REPLICA_STICKY_SECONDS
+#     (ReplicaPinMiddleware pins them after each successful unsafe request) —
+#     they see their own booking / payout at once
+#   • the default cache is per process — the pins are kept there and must
+#     reach every worker (settings.CACHES)
+#   • the replica is behind by more than REPLICA_MAX_LAG_SECONDS, or down
+#     (measured at most once per REPLICA_LAG_CHECK_SECONDS)
+# ─────────────────────────────────────────────────────────────────────────────
+
+REPLICA = 'replica'
+
+_read_alias: contextvars.ContextVar[str | None] = contextvars.ContextVar('replica_read_alias', default=None)
+
+# Replay lag; 0 while the replica has applied everything it received (an idle
+# primary would otherwise look further behind every second)
+_PG_LAG_SQL = (
+    'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END'
+)
+
+
+def _pin_key(user_id):
+    return f'replica:pin:{user_id}'
+
+
+def pin(user_id) -> None:
+    """Keep user_id's reads on the primary for REPLICA_STICKY_SECONDS."""
+    cache.set(_pin_key(user_id), True, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def is_pinned(user_id) -> bool:
+    return bool(cache.get(_pin_key(user_id)))
+
+
+def replica_lag() -> float:
+    """Seconds the replica is behind; inf when it cannot be reached."""
+    lag = cache.get('replica:lag')
+    if lag is None:
+        try:
+            connection = connections[REPLICA]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(_PG_LAG_SQL)
+                    lag = float(cursor.fetchone()[0] or 0)
+            else:
+                connection.ensure_connection()
+                lag = 0.0
+        except DatabaseError:
+            lag = float('inf')
+        cache.set('replica:lag', lag, timeout=settings.REPLICA_LAG_CHECK_SECONDS)
+    return lag
+
+
+def read_alias_for(request=None) -> str | None:
+    """REPLICA when this request may read from it, None for the primary."""
+    if REPLICA not in settings.DATABASES:
+        return None
+    if not response_cache.shared_cache():
+        return None     # a pin set by another worker would not be seen (check core.W001)
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and is_pinned(user.pk):
+        return None
+    if replica_lag() > settings.REPLICA_MAX_LAG_SECONDS:
+        return None
+    return REPLICA
+
+
+@contextmanager
+def replica_reads(request=None):
+    token = _read_alias.set(read_alias_for(request))
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Reads inside go to the primary, even in a view that opted into the replica."""
+    token = _read_alias.set(None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def use_replica(view):
+    """For function views and view methods — the request is taken from the arguments."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        request = next((arg for arg in args if isinstance(arg, (HttpRequest, Request))), None)
+        with replica_reads(request):
+            return view(*args, **kwargs)
+
+    return wrapper
+
+
+class UseReplicaMixin:
+    """DRF class views — decided after authentication, so the user's pin is known."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._replica_token = _read_alias.set(read_alias_for(request))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = self.__dict__.pop('_replica_token', None)
+        if token is not None:
+            _read_alias.reset(token)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+def keep_reads(rows):
+    """
+    rows consumed after the view has returned (streamed exports) —
+    read from the database the view was reading from.
+
+    Not a generator itself: the context must be copied now, while the view's
+    alias is set, not on the first next() after finalize_response reset it.
+    """
+    context = contextvars.copy_context()
+    iterator = context.run(iter, rows)
+
+    def reads():
+        while True:
+            try:
+                yield context.run(next, iterator)
+            except StopIteration:
+                return
+
+    return reads()
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == 'django_cache':
+            return None     # the database cache (settings.CACHES) must see the latest version bumps
+        alias = _read_alias.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Explicit: otherwise an instance read from the replica is saved back to it
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA:
+            return False
+        return None
+
+
+class ReplicaPinMiddleware:
+    """After a successful POST / PUT / PATCH / DELETE, pin the user to the primary."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+            # DRF copies the authenticated user onto the HttpRequest
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                pin(user.pk)
+        return response
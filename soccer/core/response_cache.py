@@ -0,0 +1,147 @@
+# core/response_cache.py
+
+import hashlib
+import time
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from .conditional import etag_for, not_modified
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Response cache for read-mostly catalog endpoints (governorates, pitch
+# types, equipment catalogue, team logos, club durations / deposits…).
+#
+#   server   the response data is cached per (view, key parts, host) under
+#            the current versions of the models it is built from
+#   client   ETag + Last-Modified + Cache-Control; a revalidation with a
+#            current ETag gets an empty 304
+#
+# A model's version is the time (ms) of its last committed write, bumped by
+# core/signals/signals_response_cache.py — only models listed in
+# VERSIONED_MODELS are tracked. Versions and entries live in the shared
+# default cache (settings.CACHES), so a bump reaches every worker at once;
+# with a per-process cache (check core.W001) another worker may serve the
+# old body until CACHE_TIMEOUT. Bulk .update() calls bypass the signals;
+# the server-side entries then expire after CACHE_TIMEOUT too.
+# ─────────────────────────────────────────────────────────────────────────────
+
+VERSIONED_MODELS = (
+    'core.AppVersion',
+    'dashboard_manage.Equipment',
+    'dashboard_manage.BookingDuration',
+    'dashboard_manage.ClubDeposit',
+    'player_team.TeamImage',
+)
+
+CACHE_TIMEOUT = 60 * 60
+
+
+def shared_cache() -> bool:
+    """False for a per-process backend — a bump made here never reaches the other workers."""
+    return not isinstance(caches['default'], LocMemCache)
+
+
+def _version_key(label):
+    return f'response:v:{label}'
+
+
+def versions(labels) -> dict:
+    if not labels:
+        return {}
+    keys = {_version_key(label): label for label in labels}
+    found = cache.get_many(keys)
+    missing = {k: int(time.time() * 1000) for k in keys if k not in found}
+    for key, value in missing.items():
+        # Seeded from the clock: an evicted version never comes back as an older one
+        cache.add(key, value, timeout=CACHE_TIMEOUT)
+    found.update(cache.get_many(list(missing)) if missing else {})
+    return {keys[k]: v for k, v in found.items()}
+
+
+def bump(label) -> None:
+    """Call after a write to `label` has committed."""
+    cache.set(_version_key(label), int(time.time() * 1000), timeout=CACHE_TIMEOUT)
+
+
+def bump_on_commit(label) -> None:
+    transaction.on_commit(lambda: bump(label))
+
+
+def get_or_build(name: str, parts: tuple, labels, build, with_etag: bool = True):
+    """
+    (data, etag, last_modified) of build() under the current versions of
+    `labels`; last_modified is None for data that depends on code only.
+    with_etag=False for data that is not JSON (model instances…) — etag is None.
+    """
+    current = versions(labels)
+    stamp = ','.join(f'{label}={current[label]}' for label in sorted(current))
+    digest = hashlib.md5(repr((parts, stamp)).encode('utf-8'), usedforsecurity=False).hexdigest()
+    key = f'response:{name}:{digest}'
+
+    entry = cache.get(key)
+    if entry is None:
+        data = build()
+        entry = (data, etag_for(data) if with_etag else None)
+        cache.set(key, entry, timeout=CACHE_TIMEOUT)
+
+    last_modified = max(current.values()) / 1000 if current else None
+    return entry[0], entry[1], last_modified
+
+
+class CachedResponseMixin:
+    """
+    For DRF views whose GET response changes only when `cache_models` change.
+
+        class TeamImageListAPIView(CachedResponseMixin, generics.ListAPIView):
+            cache_models = ('player_team.TeamImage',)
+
+    ListAPIView subclasses are covered as is; an APIView builds its
+    response through self.cached_response(request, build, *key_parts).
+    """
+
+    cache_models: tuple = ()
+    cache_max_age = 300         # seconds a client may reuse its copy without asking
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        untracked = set(cls.cache_models) - set(VERSIONED_MODELS)
+        if untracked:
+            raise ImproperlyConfigured(
+                f'{cls.__name__}.cache_models: add {sorted(untracked)} to core.response_cache.VERSIONED_MODELS'
+            )
+
+    def cached_response(self, request, build, *key_parts) -> Response:
+        # Media URLs are absolute — one entry per host the API is reached through
+        parts = (request.scheme, request.get_host(), *map(str, key_parts))
+        data, etag, last_modified = get_or_build(
+            f'{self.__module__}.{type(self).__name__}', parts, self.cache_models, build,
+        )
+
+        if not_modified(request, etag) or (
+            'If-None-Match' not in request.headers
+            and last_modified is not None
+            and (parse_http_date_safe(request.headers.get('If-Modified-Since', '')) or 0) >= int(last_modified)
+        ):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        response['Cache-Control'] = f'private, max-age={self.cache_max_age}'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(
+            request,
+            lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs).data,
+            *sorted(request.query_params.items()),
+        )
@@ -78,4 +78,13 @@ def register_schedules():
             'schedule_type': Schedule.MINUTES,
             'minutes': 5,
         }
-    )
\ No newline at end of file
+    )
+
+    Schedule.objects.get_or_create(
+        name='reconcile_payments',
+        defaults={
+            'func': 'management.services.PaymentReconciliationService.reconcile_payments',
+            'schedule_type': Schedule.MINUTES,
+            'minutes': 1,
+        }
+    )
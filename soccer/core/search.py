@@ -0,0 +1,153 @@
+# core/search.py
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+from django.db import connections
+from django.db.models import Case, Count, IntegerField, Max, Q, Value, When
+
+from core import response_cache
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Name search for users, teams and clubs.
+#
+# Every searchable model keeps a normalized copy of its name in `search_name`
+# (search_key below) — Arabic letter variants folded, diacritics dropped,
+# case folded, separators collapsed to single spaces — so "أحمد_Ali" and
+# "احمد ali" meet on the same key.
+#
+#   PostgreSQL   substring match on search_name, served by a pg_trgm GIN
+#                index (migrations: *_search_trgm)
+#   elsewhere    word-prefix match, served by an in-memory PrefixIndex of
+#                each model's keys — LIKE '%…%' cannot use a B-tree; a
+#                process rebuilds it when the model's version in the shared
+#                cache moves (search.changed). A prefix shorter than
+#                INDEX_MIN_PREFIX, or matching more than INDEX_MAX_MATCHES
+#                rows, is matched in SQL instead of as a pk IN (…) list.
+#
+# Results are ranked: exact key, key prefix, word prefix, anywhere — then the
+# queryset's own order. LIMIT / OFFSET stay in the database.
+#
+# SEARCH_FIELDS maps each model to the field its key is built from;
+# core/signals/signals_search_keys.py keeps search_name current.
+# ─────────────────────────────────────────────────────────────────────────────
+
+SEARCH_FIELDS = {
+    'core.User': 'username',
+    'player_team.Team': 'name',
+    # ClubCard.search_name is written by ClubCardService
+}
+
+RANK = 'search_rank'
+
+INDEX_MIN_PREFIX  = 2
+INDEX_MAX_MATCHES = 500     # pk IN (…) parameters — SQLite caps bound variables
+
+# Harakat, Quranic annotation marks, superscript alef, tatweel
+_ARABIC_MARKS = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+_ARABIC_FOLD = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ئ': 'ي', 'ؤ': 'و', 'ة': 'ه',
+})
+_SEPARATORS = re.compile(r'[\W_]+')
+
+
+def search_key(text) -> str:
+    text = unicodedata.normalize('NFKC', str(text or ''))
+    text = _ARABIC_MARKS.sub('', text).translate(_ARABIC_FOLD).casefold()
+    return ' '.join(word for word in _SEPARATORS.split(text) if word)
+
+
+# ── in-memory word-prefix index (non-PostgreSQL backends) ────────────────────
+
+class PrefixIndex:
+    """Sorted (word, pk) pairs of one model's search keys — word-prefix lookups by bisect."""
+
+    def __init__(self, rows):
+        entries = sorted({(word, pk) for pk, key in rows for word in (key or '').split()})
+        self._words = [word for word, _ in entries]
+        self._pks = [pk for _, pk in entries]
+
+    def match(self, prefix: str, limit: int | None = None) -> set | None:
+        """pks with a key word starting with prefix; None past `limit` of them."""
+        i = bisect_left(self._words, prefix)
+        pks = set()
+        while i < len(self._words) and self._words[i].startswith(prefix):
+            pks.add(self._pks[i])
+            if limit is not None and len(pks) > limit:
+                return None
+            i += 1
+        return pks
+
+
+_indexes: dict[tuple, tuple[object, PrefixIndex]] = {}
+
+
+def _version_label(model) -> str:
+    return f'search:{model._meta.label}'
+
+
+def changed(model) -> None:
+    """Call when search_name values of `model` were written — rebuilds the prefix indexes on commit."""
+    response_cache.bump_on_commit(_version_label(model))
+
+
+def _index_version(model, label):
+    """
+    The shared-cache version of label. A per-process cache (core.W001) never
+    sees another worker's bump, so the rows' own watermark is used instead —
+    an aggregate over the table on every search.
+    """
+    if response_cache.shared_cache():
+        return response_cache.versions([label])[label]
+    return tuple(model._default_manager.aggregate(count=Count('pk'), last=Max('updated_at')).values())
+
+
+def prefix_index(model, field: str = 'search_name') -> PrefixIndex:
+    label = _version_label(model)
+    version = _index_version(model, label)
+    cached = _indexes.get((label, field))
+    if cached is None or cached[0] != version:
+        rows = model._default_manager.values_list('pk', field).iterator(chunk_size=5000)
+        cached = _indexes[(label, field)] = (version, PrefixIndex(rows))
+    return cached[1]
+
+
+# ── queryset filter ──────────────────────────────────────────────────────────
+
+def ranked_search(queryset, term, field: str = 'search_name'):
+    """
+    queryset narrowed to rows whose `field` matches term, annotated with
+    search_rank (0 exact … 3 elsewhere) and ordered by it first.
+    A term with no letters or digits matches nothing.
+    """
+    key = search_key(term)
+    if not key:
+        return queryset.none()
+
+    if connections[queryset.db].vendor == 'postgresql':
+        queryset = queryset.filter(**{f'{field}__contains': key})
+    else:
+        first, *rest = key.split()
+        pks = None
+        if len(first) >= INDEX_MIN_PREFIX:
+            pks = prefix_index(queryset.model, field).match(first, limit=INDEX_MAX_MATCHES)
+        if pks is None:
+            # Short or broad prefix — the same word-prefix match as a scan
+            queryset = queryset.filter(Q(**{f'{field}__startswith': first}) | Q(**{f'{field}__contains': f' {first}'}))
+        else:
+            queryset = queryset.filter(pk__in=pks)
+        if rest:
+            queryset = queryset.filter(**{f'{field}__contains': key})
+
+    rank = Case(
+        When(**{field: key}, then=Value(0)),
+        When(**{f'{field}__startswith': key}, then=Value(1)),
+        When(**{f'{field}__contains': f' {key}'}, then=Value(2)),
+        default=Value(3),
+        output_field=IntegerField(),
+    )
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return queryset.annotate(**{RANK: rank}).order_by(RANK, *ordering)
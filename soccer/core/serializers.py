@@ -3,10 +3,11 @@ import re
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 
-from .utils import validate_profile_image
+from .utils import validate_profile_image, profile_image_validation_deferred
 from .models import Notification, User, UserDevice, Note
 
 from .validators import validate_phone_format
+from .services.UserServices import UserService
 
 
 class CheckAvailabilityInputSerializer(serializers.Serializer):
@@ -91,6 +92,8 @@ class UpdateUserSerializer(serializers.ModelSerializer):
         validate_password(value)
         return value
     def validate_image(self, value):
+        if profile_image_validation_deferred():
+            return value        # checked after save — core.tasks.check_profile_image
         is_valid, error = validate_profile_image(value)
         if not is_valid:
             raise serializers.ValidationError(error)
@@ -190,8 +193,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         }
 
     def validate_image(self, value):
-        if not value:
-            return value
+        if not value or profile_image_validation_deferred():
+            return value        # deferred: checked after save — core.tasks.check_profile_image
         is_valid, error = validate_profile_image(value)
         if not is_valid:
             raise serializers.ValidationError(error)
@@ -200,6 +203,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         password = validated_data.pop('password')
         user = User.objects.create_user(password=password, **validated_data)
+        if validated_data.get('image'):
+            UserService.schedule_image_check(user)
         return user
 
 
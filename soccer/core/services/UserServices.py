@@ -1,6 +1,8 @@
 import os
-from ..utils import DEFAULT_USER_IMAGE
+from ..utils import DEFAULT_USER_IMAGE, profile_image_validation_deferred
 from django.conf import settings
+from django.db import transaction
+from django_q.tasks import async_task
 from ..models import User, UserDevice
 from django.utils import timezone
 from datetime import timedelta
@@ -28,6 +30,18 @@ class UserService:
         user.image = DEFAULT_USER_IMAGE
         user.save(update_fields=['image'])         
 
+    @staticmethod
+    def schedule_image_check(user) -> None:
+        """Deferred validation mode: queue the face check once the new image is committed."""
+        if not profile_image_validation_deferred():
+            return
+        image_name = str(user.image)
+        if not image_name or image_name == DEFAULT_USER_IMAGE:
+            return
+        transaction.on_commit(
+            lambda: async_task('core.tasks.check_profile_image', user.id, image_name)
+        )
+
     
     @staticmethod
     def update_user(user, validated_data):
@@ -61,6 +75,8 @@ class UserService:
             user.set_password(password)
 
         user.save()
+        if new_image:
+            UserService.schedule_image_check(user)
         return user
 
 
@@ -0,0 +1,63 @@
+"""
+Keeps the thumbnails of core.thumbnails.THUMBNAIL_FIELDS in step with the originals.
+
+  image uploaded / replaced  → queue core.tasks.build_thumbnail after commit,
+                               drop the old image's thumbnail
+  row deleted                → drop its thumbnail
+
+Saves whose update_fields leave the image out (last_login, counters…)
+cost nothing here.
+"""
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django_q.tasks import async_task
+
+from core import thumbnails
+
+
+def _touches(field, update_fields):
+    return update_fields is None or field in update_fields
+
+
+def thumbnail_pre_save(sender, instance, field, update_fields=None, **kwargs):
+    if not _touches(field, update_fields) or instance._state.adding:
+        instance._thumb_old = None
+        return
+    instance._thumb_old = (
+        sender.objects
+        .filter(pk=instance.pk)
+        .values_list(field, flat=True)
+        .first()
+    )
+
+
+def thumbnail_post_save(sender, instance, field, size, update_fields=None, **kwargs):
+    if not _touches(field, update_fields):
+        return
+    old = getattr(instance, '_thumb_old', None) or ''
+    new = str(getattr(instance, field) or '')
+    if old == new:
+        return
+
+    if old:
+        transaction.on_commit(partial(thumbnails.delete, old, size))
+    if new and not thumbnails.is_ready(new, size):
+        transaction.on_commit(lambda: async_task('core.tasks.build_thumbnail', new, size))
+
+
+def thumbnail_post_delete(sender, instance, field, size, **kwargs):
+    name = str(getattr(instance, field) or '')
+    if name:
+        transaction.on_commit(partial(thumbnails.delete, name, size))
+
+
+def connect():
+    for label, (field, size) in thumbnails.THUMBNAIL_FIELDS.items():
+        model = apps.get_model(label)
+        uid = f'image_thumbnails_{label}'
+        pre_save.connect(partial(thumbnail_pre_save, field=field), sender=model, weak=False, dispatch_uid=f'{uid}_pre_save')
+        post_save.connect(partial(thumbnail_post_save, field=field, size=size), sender=model, weak=False, dispatch_uid=f'{uid}_post_save')
+        post_delete.connect(partial(thumbnail_post_delete, field=field, size=size), sender=model, weak=False, dispatch_uid=f'{uid}_post_delete')
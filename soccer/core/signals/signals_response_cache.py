@@ -0,0 +1,21 @@
+"""
+Bumps the core.response_cache version of every VERSIONED_MODELS model on
+save / delete, once the write commits — every cached response and ETag
+built from that model goes stale together.
+"""
+from functools import partial
+
+from django.db.models.signals import post_delete, post_save
+
+from core import response_cache
+
+
+def response_cache_bump(sender, label, **kwargs):
+    response_cache.bump_on_commit(label)
+
+
+def connect():
+    for label in response_cache.VERSIONED_MODELS:
+        receiver = partial(response_cache_bump, label=label)
+        post_save.connect(receiver, sender=label, weak=False, dispatch_uid=f'response_cache_{label}_post_save')
+        post_delete.connect(receiver, sender=label, weak=False, dispatch_uid=f'response_cache_{label}_post_delete')
@@ -0,0 +1,42 @@
+"""
+Keeps search_name (core.search) in step with the field it is built from —
+User.username, Team.name — and marks the model's prefix index stale once
+the write commits.
+
+save(update_fields=[...]) naming the source field but not search_name still
+gets its key written, by a follow-up UPDATE of that one column.
+"""
+from functools import partial
+
+from django.db.models.signals import post_save, pre_save
+
+from core import search
+
+
+def search_key_pre_save(sender, instance, source, update_fields=None, **kwargs):
+    if update_fields is not None and source not in update_fields:
+        return
+    key = search.search_key(getattr(instance, source))[:sender._meta.get_field('search_name').max_length]
+    if 'search_name' in instance.get_deferred_fields() or instance.search_name != key:
+        instance.search_name = key
+        instance._search_key_changed = True
+
+
+def search_key_post_save(sender, instance, update_fields=None, **kwargs):
+    if not instance.__dict__.pop('_search_key_changed', False):
+        return
+    if update_fields is not None and 'search_name' not in update_fields:
+        sender._default_manager.filter(pk=instance.pk).update(search_name=instance.search_name)
+    search.changed(sender)
+
+
+def connect():
+    for label, source in search.SEARCH_FIELDS.items():
+        pre_save.connect(
+            partial(search_key_pre_save, source=source),
+            sender=label, weak=False, dispatch_uid=f'search_key_{label}_pre_save',
+        )
+        post_save.connect(
+            search_key_post_save,
+            sender=label, weak=False, dispatch_uid=f'search_key_{label}_post_save',
+        )
@@ -0,0 +1,50 @@
+from django.core.files.storage import default_storage
+
+from core.models import User
+from core.services.notification_service import NotificationService
+from core.services.UserServices import UserService
+from core.utils import DEFAULT_USER_IMAGE, profile_image_error
+from core import face_detection, thumbnails
+
+
+# ── tasks ─────────────────────────────────────────────────────────────────────
+
+def check_profile_image(user_id, image_name: str):
+    """
+    Deferred half of validate_profile_image (PROFILE_IMAGE_VALIDATION = 'deferred').
+    Runs on the django-q cluster — detection inline, the cluster worker is
+    already off the request path. A rejected image is deleted and the user
+    falls back to DEFAULT_USER_IMAGE.
+    """
+    user = User.objects.filter(id=user_id).only('id', 'image').first()
+    # Replaced or removed since the task was queued — nothing left to check
+    if not user or str(user.image) != image_name or image_name == DEFAULT_USER_IMAGE:
+        return
+
+    try:
+        with default_storage.open(image_name, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return
+
+    error = profile_image_error(face_detection.count_faces(data))
+    if not error:
+        return
+
+    UserService.delete_user_image(user)
+    try:
+        NotificationService.send_notification(
+            user=user,
+            title='تم رفض صورة الملف الشخصي',
+            body=error,
+            notification_type='profile_image_rejected',
+        )
+    except Exception as e:
+        print(f'  profile image notification failed for {user_id}: {e}')
+
+
+def build_thumbnail(name: str, size: int):
+    """Queued by signals_image_thumbnails on upload, and by build_thumbnails."""
+    if not default_storage.exists(name):
+        return          # replaced or deleted since it was queued
+    thumbnails.build(name, size)
@@ -1,3 +1,30 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from core.replica import REPLICA, ReplicaRouter, UseReplicaMixin, _read_alias
+from management.exports import export_response
+from player_booking.models import Booking
+
+
+class _ExportView(UseReplicaMixin, APIView):
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        # Each row is routed when it is streamed — after finalize_response
+        rows = ([ReplicaRouter().db_for_read(Booking) or 'default'] for _ in range(2))
+        return export_response('csv', 'aliases', ['alias'], rows)
+
+
+@mock.patch('core.replica.read_alias_for', return_value=REPLICA)
+class KeepReadsTests(SimpleTestCase):
+
+    def test_streamed_export_reads_from_the_replica(self, read_alias_for):
+        response = _ExportView.as_view()(APIRequestFactory().get('/export/'))
+        self.assertIsNone(_read_alias.get())
+
+        body = b''.join(response.streaming_content).decode('utf-8-sig')
+        self.assertEqual(body.split(), ['alias', REPLICA, REPLICA])
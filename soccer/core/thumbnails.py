@@ -0,0 +1,117 @@
+# core/thumbnails.py
+
+import io
+import os
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+from rest_framework import serializers
+
+from .media import media_url
+from .utils import DEFAULT_USER_IMAGE
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Image derivatives — one downscaled copy of every uploaded logo / photo.
+#
+#   original   club/2026/05/<uuid>name.png
+#   thumbnail  thumbs/256/club/2026/05/<uuid>name.webp
+#
+# The thumbnail name is derived from the original name alone, so a list
+# endpoint builds *_thumb_url without a column or a query. Thumbnails are
+# written by core.tasks.build_thumbnail on the django-q cluster
+# (signals_image_thumbnails queues it on upload); until one exists the URL
+# falls back to the original.
+# ─────────────────────────────────────────────────────────────────────────────
+
+LOGO  = 256     # longest side, px — logos and avatars
+PHOTO = 640     # pitch / equipment photos
+
+# "app_label.Model": (image field, size)
+THUMBNAIL_FIELDS = {
+    'dashboard_manage.Club':      ('logo',  LOGO),
+    'dashboard_manage.Pitch':     ('image', PHOTO),
+    'dashboard_manage.Equipment': ('image', PHOTO),
+    'player_team.TeamImage':      ('logo',  LOGO),
+    'core.User':                  ('image', LOGO),
+}
+
+THUMBNAIL_FORMAT = 'WEBP' if features.check('webp') else 'JPEG'
+_EXTENSION = '.webp' if THUMBNAIL_FORMAT == 'WEBP' else '.jpg'
+
+# Thumbnails only ever appear (names are unique per upload), so a positive
+# exists() answer is kept for the life of the process
+_ready: set[str] = set()
+
+
+def thumb_name(name: str, size: int) -> str:
+    stem, _ = os.path.splitext(name)
+    return f'thumbs/{size}/{stem}{_EXTENSION}'
+
+
+def is_ready(name: str, size: int) -> bool:
+    thumb = thumb_name(name, size)
+    if thumb in _ready:
+        return True
+    if default_storage.exists(thumb):
+        _ready.add(thumb)
+        return True
+    return False
+
+
+def thumb_url(name, size: int, request=None) -> str | None:
+    """URL of the thumbnail of `name` (a storage name or FieldFile); the original until it is built."""
+    name = str(name or '')
+    if not name:
+        return None
+    return media_url(thumb_name(name, size) if is_ready(name, size) else name, request)
+
+
+def build(name: str, size: int) -> str:
+    """Write the thumbnail of `name`; returns its storage name."""
+    thumb = thumb_name(name, size)
+    with default_storage.open(name, 'rb') as f:
+        image = Image.open(f)
+        image = ImageOps.exif_transpose(image)       # phone photos: bake in the rotation
+        image.thumbnail((size, size), Image.LANCZOS)
+
+        if THUMBNAIL_FORMAT == 'JPEG':
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA'):
+            transparent = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if transparent else 'RGB')
+
+        out = io.BytesIO()
+        image.save(out, THUMBNAIL_FORMAT, quality=80)
+
+    if default_storage.exists(thumb):
+        default_storage.delete(thumb)      # storage.save would pick a new name instead
+    default_storage.save(thumb, ContentFile(out.getvalue()))
+    _ready.add(thumb)
+    return thumb
+
+
+def delete(name: str, size: int) -> None:
+    if name == DEFAULT_USER_IMAGE:
+        return          # shared by every user without a photo
+    thumb = thumb_name(name, size)
+    _ready.discard(thumb)
+    if default_storage.exists(thumb):
+        default_storage.delete(thumb)
+
+
+class ThumbnailURLField(serializers.Field):
+    """
+    Read-only *_thumb_url field:
+
+        logo_thumb_url = ThumbnailURLField(source='logo', size=LOGO)
+    """
+
+    def __init__(self, size: int, **kwargs):
+        kwargs['read_only'] = True
+        self.size = size
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return thumb_url(value, self.size, self.context.get('request'))
@@ -1,10 +1,15 @@
+import multiprocessing
 import os
+import threading
 import uuid
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-import cv2
-import numpy as np
+from django.conf import settings
 from django.utils import timezone
 
+from . import face_detection
+
 DEFAULT_USER_IMAGE = 'users/images/Default/avatar.png'
 
 
@@ -24,42 +29,112 @@ def user_image_upload_path(instance, filename):
     new_filename = f"{uuid.uuid4()}.{ext}"
     return f"users/images/{instance.id}/{new_filename}"
 
-def validate_profile_image(image_file) -> tuple[bool, str]:
-    """
-    Validate that image contains exactly one human face.
-    Returns (is_valid, error_message).
-    """
-    face_cascade = cv2.CascadeClassifier(
-        cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-    )
+# ─────────────────────────────────────────────────────────────────────────────
+# Profile image validation — exactly one human face.
+#
+# Detection (core.face_detection.count_faces) runs in a bounded process pool,
+# so a request thread waits on it without holding the GIL and at most
+# FACE_DETECTION_WORKERS detections run at once per web process. At most
+# FACE_DETECTION_QUEUE more may wait; past that an upload is answered "busy"
+# without being submitted, and one that times out is cancelled if not started.
+#
+# settings.PROFILE_IMAGE_VALIDATION
+#   'sync'      serializers reject a bad image in the request (default)
+#   'deferred'  serializers accept it; core.tasks.check_profile_image runs
+#               after commit on the django-q cluster and resets a bad image
+#               to DEFAULT_USER_IMAGE with a notification
+# ─────────────────────────────────────────────────────────────────────────────
 
-    image_bytes = np.frombuffer(image_file.read(), np.uint8)
-    image = cv2.imdecode(image_bytes, cv2.IMREAD_COLOR)
-    image_file.seek(0)
+_IMAGE_UNREADABLE = 'تعذر قراءة الصورة، يرجى رفع صورة صحيحة.'
+_IMAGE_NO_FACE    = 'يجب أن تحتوي الصورة على وجه بشري واضح.'
+_IMAGE_BUSY       = 'تعذر التحقق من الصورة حالياً، يرجى المحاولة لاحقاً.'
 
-    if image is None:
-        return False, 'تعذر قراءة الصورة، يرجى رفع صورة صحيحة.'
+_pool = None
+_slots = None       # one per submitted detection until it finishes — running or queued
+_pool_lock = threading.Lock()
 
-    # ✅ resize goes here — after decode, before detection
-    if image.shape[1] > 640:
-        scale = 640 / image.shape[1]
-        image = cv2.resize(image, (640, int(image.shape[0] * scale)))
 
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+def _detection_pool():
+    global _pool, _slots
+    workers = getattr(settings, 'FACE_DETECTION_WORKERS', 2)
+    if workers <= 0:
+        return None, None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                # spawn: workers import core.face_detection only, not a forked
+                # copy of the Django process and its open DB connections
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=face_detection.warm_up,
+            )
+            _slots = threading.BoundedSemaphore(workers + getattr(settings, 'FACE_DETECTION_QUEUE', 4))
+        return _pool, _slots
 
-    faces = face_cascade.detectMultiScale(
-        gray,
-        scaleFactor=1.1,
-        minNeighbors=5,
-        minSize=(30, 30)
-    )
 
-    face_count = len(faces)
+def _reset_pool():
+    global _pool, _slots
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = _slots = None
 
-    if face_count == 0:
-        return False, 'يجب أن تحتوي الصورة على وجه بشري واضح.'
 
+def count_faces(data: bytes) -> int | None:
+    """
+    count_faces in the detection pool; inline when the pool is disabled.
+    Raises FuturesTimeoutError when the pool is full or the result is late.
+    """
+    pool, slots = _detection_pool()
+    if pool is None:
+        return face_detection.count_faces(data)
+    if not slots.acquire(blocking=False):
+        raise FuturesTimeoutError('face detection queue is full')
+    try:
+        try:
+            future = pool.submit(face_detection.count_faces, data)
+        except BaseException:
+            slots.release()
+            raise
+        # Released when the detection ends — a timed-out one still holds its worker
+        future.add_done_callback(lambda _future: slots.release())
+        try:
+            return future.result(timeout=getattr(settings, 'FACE_DETECTION_TIMEOUT', 10))
+        except FuturesTimeoutError:
+            future.cancel()     # still queued → never runs
+            raise
+    except BrokenProcessPool:
+        # A worker died (OOM on a huge upload…) — start a fresh pool next call
+        _reset_pool()
+        return face_detection.count_faces(data)
+
+
+def profile_image_error(face_count: int | None) -> str:
+    if face_count is None:
+        return _IMAGE_UNREADABLE
+    if face_count == 0:
+        return _IMAGE_NO_FACE
     if face_count > 1:
-        return False, f'تم اكتشاف {face_count} وجوه، يرجى رفع صورة تحتوي على وجه واحد فقط.'
+        return f'تم اكتشاف {face_count} وجوه، يرجى رفع صورة تحتوي على وجه واحد فقط.'
+    return ''
+
+
+def profile_image_validation_deferred() -> bool:
+    return getattr(settings, 'PROFILE_IMAGE_VALIDATION', 'sync') == 'deferred'
+
+
+def validate_profile_image(image_file) -> tuple[bool, str]:
+    """
+    Validate that image contains exactly one human face.
+    Returns (is_valid, error_message).
+    """
+    data = image_file.read()
+    image_file.seek(0)
+
+    try:
+        face_count = count_faces(data)
+    except FuturesTimeoutError:
+        return False, _IMAGE_BUSY
 
-    return True, ''
+    error = profile_image_error(face_count)
+    return not error, error
@@ -8,6 +8,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from core.governorates import SyrianGovernorate
+from core.media import media_url
+from core.response_cache import CachedResponseMixin, get_or_build
 
 from .services.notification_service import NotificationService
 from .serializers import NotificationSerializer, UserDeviceSerializer, UserRegistrationSerializer, LoginSerializer, NoteSerializer
@@ -22,13 +24,14 @@ from .permission import IsPlayerPermission, IsClubStaffOrOwnerPermission ,IsClub
 from .pagination import NotificationPagination
 
 
-class SyrianGovernorateListAPI(APIView):
+class SyrianGovernorateListAPI(CachedResponseMixin, APIView):
+    cache_max_age = 60 * 60 * 24
+
     def get(self, request):
-        data = [
+        return self.cached_response(request, lambda: [
                 {"value": choice.value, "label": choice.label}
                 for choice in SyrianGovernorate
-            ]
-        return Response(data)
+            ])
 
 
 class NotificationListView(generics.ListAPIView):
@@ -302,6 +305,15 @@ class VersionCheckView(GenericApiView):
 
     
     def get_latest_version(self, app_type: str, platform: str) -> Optional[AppVersion]:
+        # Every app launch asks; the answer changes only when a release is published
+        latest, _, _ = get_or_build(
+            "version-check", (app_type, platform), ("core.AppVersion",),
+            lambda: self._query_latest_version(app_type, platform),
+            with_etag=False,
+        )
+        return latest
+
+    def _query_latest_version(self, app_type: str, platform: str) -> Optional[AppVersion]:
         try:
             return AppVersion.objects.filter(
                 app_type=app_type,
@@ -400,7 +412,7 @@ class UserLoginAPIView(APIView):
             'booking_time': user.booking_time,
             'challenge_time': user.challenge_time,
             'cancel_time': user.cancel_time,
-            'image': request.build_absolute_uri(user.image.url) if user.image else None,
+            'image': media_url(user.image, request),
             'governorate': user.get_governorate_display()
 
             # 'user_id': user.id,
@@ -7,4 +7,6 @@ class DashboardBookingConfig(AppConfig):
     
     def ready(self):
         import dashboard_booking.signals.signals_booking_notifications
-        import dashboard_booking.signals.signals_booking_status_history
\ No newline at end of file
+        import dashboard_booking.signals.signals_booking_status_history
+        import dashboard_booking.signals.signals_pitch_occupancy
+        import dashboard_booking.signals.signals_equipment_reservation
\ No newline at end of file
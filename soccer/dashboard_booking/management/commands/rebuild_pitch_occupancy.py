@@ -0,0 +1,43 @@
+"""
+python manage.py rebuild_pitch_occupancy [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+
+Recomputes PitchOccupancy rows from the bookings table. Needed after bulk
+Booking.objects...update(status=...) calls, which bypass the signals.
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from dashboard_booking.models import PitchOccupancy
+from dashboard_booking.services.OccupancyService import OccupancyService
+from player_booking.models import Booking
+
+
+class Command(BaseCommand):
+    help = "Rebuild pitch occupancy bitmaps from the bookings table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="date_from", help="First day (default: today).")
+        parser.add_argument("--to", dest="date_to", help="Last day (default: no limit).")
+
+    def handle(self, *args, **options):
+        try:
+            date_from = date.fromisoformat(options["date_from"]) if options["date_from"] else timezone.localdate()
+            date_to = date.fromisoformat(options["date_to"]) if options["date_to"] else None
+        except ValueError:
+            raise CommandError("Dates must be YYYY-MM-DD.")
+
+        bookings = Booking.objects.filter(date__gte=date_from)
+        rows = PitchOccupancy.objects.filter(date__gte=date_from)
+        if date_to:
+            bookings = bookings.filter(date__lte=date_to)
+            rows = rows.filter(date__lte=date_to)
+
+        # Every (pitch, date) that has a booking or an existing row
+        keys = set(bookings.values_list("pitch_id", "date").distinct())
+        keys |= set(rows.values_list("pitch_id", "date"))
+
+        OccupancyService.rebuild_many(keys)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(keys)} pitch/day rows."))
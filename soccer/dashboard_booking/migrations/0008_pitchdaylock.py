@@ -0,0 +1,31 @@
+# Generated by Django 5.2.10 on 2026-10-19 12:00
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_booking', '0007_bookingnotification_created_at'),
+        ('dashboard_manage', '0020_alter_club_governorate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PitchDayLock',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('locked_at', models.DateTimeField(auto_now=True)),
+                ('pitch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dashboard_manage.pitch')),
+            ],
+            options={
+                'verbose_name': 'Pitch Day Lock',
+                'verbose_name_plural': 'Pitch Day Locks',
+                'db_table': 'pitch_day_locks',
+                'constraints': [models.UniqueConstraint(fields=('pitch', 'date'), name='unique_pitch_day_lock')],
+            },
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.10 on 2026-10-19 12:30
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+from django.utils import timezone
+
+ACTIVE_STATUSES = [3, 11, 12, 4, 2, 10, 8]   # soccer.enm.BOOKING_STATUS_DENIED
+
+
+def _mask(start_time, end_time):
+    start_slot = (start_time.hour * 60 + start_time.minute) // 5
+    end_minutes = end_time.hour * 60 + end_time.minute + (1 if end_time.second or end_time.microsecond else 0)
+    end_slot = min(-(-end_minutes // 5), 288)
+    if end_slot <= start_slot:
+        return 0
+    return ((1 << (end_slot - start_slot)) - 1) << start_slot
+
+
+def _aligned(t):
+    return t.minute % 5 == 0 and t.second == 0 and t.microsecond == 0
+
+
+def backfill_occupancy(apps, schema_editor):
+    """Bitmaps for the active bookings from today on — later ones come from the signals."""
+    Booking = apps.get_model('player_booking', 'Booking')
+    PitchOccupancy = apps.get_model('dashboard_booking', 'PitchOccupancy')
+
+    rows = {}
+    bookings = (
+        Booking.objects
+        .filter(date__gte=timezone.localdate(), status__in=ACTIVE_STATUSES)
+        .values_list('pitch_id', 'date', 'start_time', 'end_time')
+    )
+    for pitch_id, date, start_time, end_time in bookings.iterator():
+        bitmap, unaligned = rows.get((pitch_id, date), (0, 0))
+        bitmap |= _mask(start_time, end_time)
+        if not (_aligned(start_time) and _aligned(end_time)):
+            unaligned += 1
+        rows[(pitch_id, date)] = (bitmap, unaligned)
+
+    PitchOccupancy.objects.bulk_create([
+        PitchOccupancy(pitch_id=pitch_id, date=date, bitmap=bitmap.to_bytes(36, 'big'), unaligned_count=unaligned)
+        for (pitch_id, date), (bitmap, unaligned) in rows.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_booking', '0008_pitchdaylock'),
+        ('dashboard_manage', '0020_alter_club_governorate'),
+        ('player_booking', '0018_booking_booking_player_created_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PitchOccupancy',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('bitmap', models.BinaryField(max_length=36)),
+                ('unaligned_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('pitch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dashboard_manage.pitch')),
+            ],
+            options={
+                'verbose_name': 'Pitch Occupancy',
+                'verbose_name_plural': 'Pitch Occupancies',
+                'db_table': 'pitch_occupancy',
+                'indexes': [models.Index(fields=['date'], name='pitch_occup_date_1d5974_idx')],
+                'constraints': [models.UniqueConstraint(fields=('pitch', 'date'), name='unique_pitch_occupancy')],
+            },
+        ),
+        migrations.RunPython(backfill_occupancy, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.10 on 2026-10-19 13:10
+
+import django.db.models.deletion
+from collections import defaultdict
+from django.db import migrations, models
+from django.utils import timezone
+
+ACTIVE_STATUSES = [3, 11, 12, 4, 2, 10, 8]   # soccer.enm.BOOKING_STATUS_DENIED
+
+
+def _slots(start_time, end_time):
+    start_slot = (start_time.hour * 60 + start_time.minute) // 5
+    end_minutes = end_time.hour * 60 + end_time.minute + (1 if end_time.second or end_time.microsecond else 0)
+    return range(start_slot, min(-(-end_minutes // 5), 288))
+
+
+def backfill_reservations(apps, schema_editor):
+    """Ledger rows for the equipment of active bookings from today on."""
+    BookingEquipment = apps.get_model('player_booking', 'BookingEquipment')
+    EquipmentReservation = apps.get_model('dashboard_booking', 'EquipmentReservation')
+
+    reserved = defaultdict(int)
+    items = (
+        BookingEquipment.objects
+        .filter(booking__date__gte=timezone.localdate(), booking__status__in=ACTIVE_STATUSES)
+        .values_list('equipment_id', 'quantity', 'booking__date', 'booking__start_time', 'booking__end_time')
+    )
+    for equipment_id, quantity, date, start_time, end_time in items.iterator():
+        for slot in _slots(start_time, end_time):
+            reserved[(equipment_id, date, slot)] += quantity
+
+    EquipmentReservation.objects.bulk_create([
+        EquipmentReservation(club_equipment_id=equipment_id, date=date, slot=slot, reserved=quantity)
+        for (equipment_id, date, slot), quantity in reserved.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_booking', '0009_pitchoccupancy'),
+        ('dashboard_manage', '0020_alter_club_governorate'),
+        ('player_booking', '0018_booking_booking_player_created_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EquipmentReservation',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('slot', models.PositiveSmallIntegerField()),
+                ('reserved', models.IntegerField(default=0)),
+                ('club_equipment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dashboard_manage.clubequipment')),
+            ],
+            options={
+                'verbose_name': 'Equipment Reservation',
+                'verbose_name_plural': 'Equipment Reservations',
+                'db_table': 'equipment_reservations',
+                'constraints': [models.UniqueConstraint(fields=('club_equipment', 'date', 'slot'), name='unique_equipment_reservation_slot')],
+            },
+        ),
+        migrations.RunPython(backfill_reservations, migrations.RunPython.noop),
+    ]
@@ -2,7 +2,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from player_booking.models import Booking, BookingStatus
 from core.models import User
-from dashboard_manage.models import Club
+from dashboard_manage.models import Club, Pitch, ClubEquipment
 import uuid
 
 # class BookingNotificationStatus(models.IntegerChoices):
@@ -65,3 +65,68 @@ class BookingNotification(models.Model):
             models.Index(fields=['send_to']),
         ]
 
+
+
+class PitchDayLock(models.Model):
+    """
+    One row per (pitch, date), used as a mutex for slot reservation on
+    backends without advisory locks (see SlotReservationService).
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    pitch = models.ForeignKey(Pitch, on_delete=models.CASCADE)
+    date = models.DateField()
+    locked_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'pitch_day_locks'
+        verbose_name = _('Pitch Day Lock')
+        verbose_name_plural = _('Pitch Day Locks')
+        constraints = [
+            models.UniqueConstraint(fields=['pitch', 'date'], name='unique_pitch_day_lock'),
+        ]
+
+
+class PitchOccupancy(models.Model):
+    """
+    288-bit occupancy bitmap (5-minute slots) of the active bookings
+    (BOOKING_STATUS_DENIED) of one pitch on one day — see OccupancyService.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    pitch = models.ForeignKey(Pitch, on_delete=models.CASCADE)
+    date = models.DateField()
+    bitmap = models.BinaryField(max_length=36)
+    # active bookings whose times are not on the 5-minute grid — while > 0 the
+    # bitmap is only a coarse filter and exact checks fall back to the bookings table
+    unaligned_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'pitch_occupancy'
+        verbose_name = _('Pitch Occupancy')
+        verbose_name_plural = _('Pitch Occupancies')
+        constraints = [
+            models.UniqueConstraint(fields=['pitch', 'date'], name='unique_pitch_occupancy'),
+        ]
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+
+class EquipmentReservation(models.Model):
+    """
+    Quantity of a club equipment held by active bookings in one 5-minute
+    slot of a day — see EquipmentLedgerService.
+    """
+    id = models.BigAutoField(primary_key=True)
+    club_equipment = models.ForeignKey(ClubEquipment, on_delete=models.CASCADE)
+    date = models.DateField()
+    slot = models.PositiveSmallIntegerField()
+    reserved = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'equipment_reservations'
+        verbose_name = _('Equipment Reservation')
+        verbose_name_plural = _('Equipment Reservations')
+        constraints = [
+            models.UniqueConstraint(fields=['club_equipment', 'date', 'slot'], name='unique_equipment_reservation_slot'),
+        ]
@@ -1,12 +1,14 @@
 from rest_framework import serializers
+from core.media import MediaURLField
 from django.contrib.auth import get_user_model
 from .models import  BookingNotification
 from  player_booking.models import Booking, BookingStatus, Coupon, PayStatus, BookingEquipment
 from dashboard_manage.models import Pitch
 from dashboard_booking.services.PricingService import PricingService
 from .services.EquipmentBookingService import EquipmentBookingService
-from soccer.enm import BOOKING_STATUS_DENIED
+from .services.SlotReservationService import SlotReservationService
 from django.db import transaction
+from django.conf import settings
 
 
 User = get_user_model()
@@ -70,30 +72,15 @@ class ClosedBookingCreateSerializer(serializers.ModelSerializer):
         if attrs['start_time'] >= attrs['end_time']:
             raise serializers.ValidationError({"error": "وقت النهاية يجب أن يكون بعد وقت البداية."})
 
-        # Check for overlapping bookings
-        pitch = attrs['pitch']
-        date = attrs['date']
-        start_time = attrs['start_time']
-        end_time = attrs['end_time']
-
-        overlapping = Booking.objects.filter(
-            pitch=pitch,
-            date=date,
-            status__in=BOOKING_STATUS_DENIED
-        ).filter(
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        ).exists()
-
-        if overlapping:
-            raise serializers.ValidationError({"error": "هذا الوقت يتداخل مع حجز موجود."})
-
         return attrs
 
     def create(self, validated_data):
         club_id = self.context['request'].auth.get('club_id')
 
         with transaction.atomic():
+            # Overlap check runs under the (pitch, date) lock, right before the insert
+            SlotReservationService.ensure_slot_free(validated_data['pitch'].id, validated_data['date'],
+                                                    validated_data['start_time'], validated_data['end_time'])
             booking = Booking.objects.create(
                 club_id=club_id,
                 price=0,
@@ -172,7 +159,7 @@ class BookingListSerializer(serializers.ModelSerializer):
 
 class BookingEquipmentDetailSerializer(serializers.ModelSerializer):
     name = serializers.CharField(source='equipment_def.name', read_only=True)
-    image = serializers.ImageField(source='equipment_def.image', read_only=True)
+    image = MediaURLField(source='equipment_def.image')
 
     class Meta:
         model = BookingEquipment
@@ -349,24 +336,6 @@ class BookingCreateSerializer(serializers.ModelSerializer):
         if has_phone == has_username:
             raise serializers.ValidationError({"error": "رجاء تقديم إما رقم هاتف أو اسم مستخدم، وليس كلاهما."})
 
-        # Check for overlapping bookings
-        pitch = attrs['pitch']
-        date = attrs['date']
-        start_time = attrs['start_time']
-        end_time = attrs['end_time']
-
-        overlapping = Booking.objects.filter(
-            pitch=pitch,
-            date=date,
-            status__in=BOOKING_STATUS_DENIED
-        ).filter(
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        ).exists()
-
-        if overlapping:
-            raise serializers.ValidationError({"error": "هذا الوقت يتداخل مع حجز موجود."})
-
         return attrs
 
     def create(self, validated_data):
@@ -384,6 +353,8 @@ class BookingCreateSerializer(serializers.ModelSerializer):
         equipments = validated_data.pop("equipments",[])
 
         with transaction.atomic():
+            SlotReservationService.ensure_slot_free(validated_data['pitch'].id, validated_data['date'],
+                                                    validated_data['start_time'], validated_data['end_time'])
             booking = Booking.objects.create(
                 club_id=club_id,
                 player=user,
@@ -513,6 +484,33 @@ class BookingSlotFilterSerializer(serializers.Serializer):
         return data
 
 
+class CalendarFilterSerializer(serializers.Serializer):
+    date_from = serializers.DateField(
+        format='%Y-%m-%d',
+        error_messages={
+            'required': 'هذا الحقل مطلوب.',
+            'invalid':  'أدخل تاريخاً صحيحاً.',
+            'null':     'لا يمكن أن تكون هذه القيمة فارغة.',
+        }
+    )
+    date_to = serializers.DateField(
+        format='%Y-%m-%d',
+        required=False,
+        error_messages={
+            'invalid': 'أدخل تاريخاً صحيحاً.',
+        }
+    )
+    active = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, data):
+        data.setdefault('date_to', data['date_from'])
+        if data['date_to'] < data['date_from']:
+            raise serializers.ValidationError({"error": "تاريخ النهاية يجب أن يكون بعد تاريخ البداية."})
+        if (data['date_to'] - data['date_from']).days >= settings.CALENDAR_MAX_DAYS:
+            raise serializers.ValidationError({"error": f"لا يمكن أن تتجاوز الفترة {settings.CALENDAR_MAX_DAYS} يوماً."})
+        return data
+
+
 class BookingPriceRequestSerializer(serializers.ModelSerializer):
     equipments = EquipmentBookingSerializer(many=True, required=False)
 
@@ -1,17 +1,18 @@
 from django.db import IntegrityError, transaction
 from dashboard_booking.models import  BookingNotification
-from  player_booking.models import Booking, BookingStatus, BookingEquipment
+from collections import defaultdict
+from  player_booking.models import Booking, BookingStatus, BookingEquipment, PayStatus
 from dashboard_manage.models import Pitch, ClubEquipment 
 from rest_framework.exceptions import ValidationError 
 from django.shortcuts import get_object_or_404
 from core.models import User
 from core.services.notification_service import NotificationService
-from soccer.enm import BOOKING_STATUS_DENIED
 from django.db.models import Prefetch, QuerySet
 from django.db.models import Q
 from player_competition.models import Challenge, ChallengePlayerBooking, ChallengeStatus
 from player_team.models import MemberStatus, TeamMember
 from .EquipmentBookingService import EquipmentBookingService
+from .SlotReservationService import SlotReservationService
 from django.db.models import F
 
 class BookingService:
@@ -252,6 +253,41 @@ class BookingService:
 
         return booking
     
+    @classmethod
+    @transaction.atomic
+    def confirm_online_payments(cls, payments: dict):
+        """
+        PAY / CHECK_PAY → paid, for bookings matched to a ShamCash transfer.
+        payments = {booking_id: paid_in_full}
+          DEPOSIT_ONLINE booking, deposit paid → PENDING_PAY (rest paid at the club)
+          otherwise                            → COMPLETED
+        Bookings that already left PAY / CHECK_PAY are skipped.
+        Returns the updated bookings.
+        """
+        bookings = list(
+            Booking.objects.select_for_update()
+            .filter(pk__in=payments, status__in=[BookingStatus.PAY, BookingStatus.CHECK_PAY])
+            .order_by('pk')
+        )
+
+        challenge_bookings = defaultdict(list)
+        for booking in bookings:
+            if booking.payment_status == PayStatus.DEPOSIT_ONLINE and not payments[booking.pk]:
+                booking.status = BookingStatus.PENDING_PAY
+                challenge_status = ChallengeStatus.PENDING_PAY
+            else:
+                booking.status = BookingStatus.COMPLETED
+                challenge_status = ChallengeStatus.ACCEPTED
+            # save() per row — statistics / status history signals need it
+            booking.save(update_fields=['status', 'updated_at'])
+            if booking.is_challenge:
+                challenge_bookings[challenge_status].append(booking.pk)
+
+        for challenge_status, booking_ids in challenge_bookings.items():
+            Challenge.objects.filter(booking_id__in=booking_ids).update(status=challenge_status)
+
+        return bookings
+
     @classmethod
     @transaction.atomic
     def convert_to_pending_player(cls, booking, club_id, new_date, new_start_time, new_end_time):
@@ -285,16 +321,11 @@ class BookingService:
     @classmethod
     def _check_if_has_overlap_booking(cls, booking:Booking):
         
-        has_overlap = Booking.objects.select_for_update().filter(
-            pitch=booking.pitch,
-            date=booking.date,
-            status__in=BOOKING_STATUS_DENIED,
-            start_time__lt=booking.end_time,
-            end_time__gt=booking.start_time
-        ).exclude(pk=booking.pk).exists() 
-        
-        if has_overlap:
-            raise ValidationError({"error": "لا يمكن تأكيد هذا الحجز بسبب وجود حجز آخر يتداخل مع نفس الملعب في نفس الوقت."})
+        SlotReservationService.ensure_slot_free(
+            booking.pitch_id, booking.date, booking.start_time, booking.end_time,
+            exclude_booking_id=booking.pk,
+            error_message="لا يمكن تأكيد هذا الحجز بسبب وجود حجز آخر يتداخل مع نفس الملعب في نفس الوقت.",
+        )
         
         equipments = list(BookingEquipment.objects.values('equipment_id', 'quantity').filter(booking_id=booking.id))
 
@@ -302,6 +333,10 @@ class BookingService:
             equipment_ids = [ equipment['equipment_id'] for equipment in equipments]
 
             
+            club_equipments = list(ClubEquipment.objects.select_for_update().values('id', 'quantity', 'price', 'equipment_id').filter(
+                club_id=booking.club_id, is_active=True, id__in=equipment_ids, is_deteted=False
+            ))
+
             equipment_quantities = EquipmentBookingService.Get_booking_equipment_quantities(booking.club_id, booking.date, booking.start_time, booking.end_time, equipment_ids)
 
             old_booked_map = {
@@ -317,9 +352,6 @@ class BookingService:
             print(new_booked_map)
             print("equipment_quantities")
             print(equipment_quantities)
-            club_equipments = list(ClubEquipment.objects.select_for_update().values('id', 'quantity', 'price', 'equipment_id').filter(
-                club_id=booking.club_id, is_active=True, id__in=equipment_ids, is_deteted=False
-            ))
             print(club_equipments)
             print(":::::::::::::::::::::::::::::::::")
             print(equipment_ids)
@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from dashboard_manage.models import Pitch
+from player_booking.models import Booking, BookingStatus
+from soccer.enm import BOOKING_STATUS_DENIED
+from dashboard_booking.services.ClubTimeForOwnerService import ClubTimeForOwnerService
+
+# by_day_time_pitch shows these too; ?active=true keeps BOOKING_STATUS_DENIED only
+CALENDAR_STATUSES = BOOKING_STATUS_DENIED + [
+    BookingStatus.PENDING_MANAGER.value,
+    BookingStatus.CANCELED.value,
+    BookingStatus.NO_SHOW.value,
+    BookingStatus.EXPIRED.value,
+]
+
+BOOKING_FIELDS = [
+    'id', 'start_time', 'end_time', 'price', 'deposit', 'status',
+    'is_challenge', 'by_owner', 'player_name', 'phone',
+]
+
+
+class CalendarService:
+    """
+    Club-wide booking grid for the owner dashboard — every pitch over a date
+    range in one response, instead of by_day_time_pitch once per pitch per day.
+
+    Four queries whatever the range: the pitches, the club hours, the hour
+    exceptions, and the bookings (index booking_club_date).
+    """
+
+    @classmethod
+    def get_calendar(cls, club_id, date_from, date_to, active_only=False):
+        """
+            {
+              'date_from': '2026-10-19', 'date_to': '2026-10-25',
+              'pitches':  [{id, name, type, is_active}],
+              'days':     [{date, start_time, end_time}]     — null times: closed
+              'statuses': {status: label},
+              'fields':   BOOKING_FIELDS,
+              'bookings': {pitch_id: {date: [[…BOOKING_FIELDS values], …]}}
+            }
+
+        Each booking is a row in BOOKING_FIELDS order; pitches and days
+        without bookings are left out of 'bookings'.
+        """
+        number_of_day = (date_to - date_from).days + 1
+        dates = [date_from + timedelta(days=i) for i in range(number_of_day)]
+
+        pitches = list(
+            Pitch.objects.filter(club_id=club_id, is_deteted=False)
+            .values('id', 'name', 'type', 'is_active')
+            .order_by('type', 'name')
+        )
+        opening = ClubTimeForOwnerService.get_opening_time_with_percent(club_id, number_of_day, date_from)
+
+        statuses = BOOKING_STATUS_DENIED if active_only else CALENDAR_STATUSES
+        rows = (
+            Booking.objects
+            .filter(
+                club_id=club_id,
+                date__range=(date_from, date_to),
+                status__in=statuses,
+                pitch_id__in=[pitch['id'] for pitch in pitches],
+            )
+            .order_by('pitch_id', 'date', 'start_time')
+            .values_list(
+                'pitch_id', 'date',
+                'id', 'start_time', 'end_time', 'final_price', 'deposit', 'status',
+                'is_challenge', 'by_owner', 'player__username', 'phone',
+            )
+        )
+
+        bookings = {}
+        for pitch_id, day, booking_id, start_time, end_time, price, deposit, status, *rest in rows:
+            bookings.setdefault(str(pitch_id), {}).setdefault(str(day), []).append([
+                str(booking_id),
+                start_time.isoformat(),
+                end_time.isoformat(),
+                float(price),
+                float(deposit) if deposit is not None else None,
+                status,
+                *rest,
+            ])
+
+        days = []
+        for day in dates:
+            hours = opening.get(str(day))
+            days.append({
+                'date': str(day),
+                'start_time': hours['start_time'].isoformat() if hours else None,
+                'end_time': hours['end_time'].isoformat() if hours else None,
+            })
+
+        return {
+            'date_from': str(date_from),
+            'date_to': str(date_to),
+            'pitches': [
+                {'id': str(pitch['id']), 'name': pitch['name'], 'type': pitch['type'], 'is_active': pitch['is_active']}
+                for pitch in pitches
+            ],
+            'days': days,
+            'statuses': {str(status): str(BookingStatus(status).label) for status in statuses},
+            'fields': BOOKING_FIELDS,
+            'bookings': bookings,
+        }
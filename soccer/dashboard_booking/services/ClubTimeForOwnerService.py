@@ -3,7 +3,9 @@ from dashboard_manage.models import ClubPricing, Pitch, Club
 from django.db.models import Q
 from datetime import date, timedelta
 from rest_framework.exceptions import ValidationError
-from django.core.files.storage import default_storage
+from core.media import media_url
+from core.thumbnails import PHOTO, thumb_url
+from player_booking.services.ClubTimeService import ClubTimeService
 from django.utils import timezone
 
 
@@ -38,10 +40,7 @@ class ClubTimeForOwnerService:
             - pitches: List of pitch dictionaries with adjusted prices
         """
         # Fetch all pitches for this club (ordered by type, then name)
-        pitches = Pitch.objects.filter(club_id=club_id, is_deteted=False).values('id', 'name', 'price_first',
-                                                                'price_second', 'time_interval', 'type',
-                                                                'size_high', 'size_width', 'image','is_active'
-                                                                ).order_by('type', 'name')  
+        pitches = cls._pitches(club_id)
         
         # Get daily configurations: for each date, get the pricing multiplier (percent) 
         # and opening/closing times based on club defaults and any exceptions
@@ -82,7 +81,8 @@ class ClubTimeForOwnerService:
                     'type': pitch['type'],
                     'size_high': pitch['size_high'],
                     'size_width': pitch['size_width'],
-                    'image': request.build_absolute_uri(default_storage.url(pitch['image'])) ,
+                    'image': media_url(pitch['image'], request),
+                    'image_thumb_url': thumb_url(pitch['image'], PHOTO, request),
                     'is_active': pitch['is_active']
                 }
                 
@@ -90,7 +90,31 @@ class ClubTimeForOwnerService:
 
             opening_with_prices.append(day_opening_with_prices)
         return opening_with_prices
- 
+
+    @classmethod
+    def get_opening_time_with_pitches_prices_compact(cls, club_id, number_of_day, request):
+        """
+        The same schedule with every pitch sent once (?layout=compact):
+
+            {
+              'pitches': {pitch_id: {name, type, sizes, image, base prices, ...}},
+              'days':    [{date, start_time, end_time, percent,
+                           prices: {pitch_id: [price_first, price_second]}}]
+            }
+        """
+        return ClubTimeService.build_compact_schedule(
+            cls._pitches(club_id),
+            cls.get_opening_time_with_percent(club_id, number_of_day),
+            request,
+        )
+
+    @classmethod
+    def _pitches(cls, club_id):
+        return Pitch.objects.filter(club_id=club_id, is_deteted=False).values('id', 'name', 'price_first',
+                                                                'price_second', 'time_interval', 'type',
+                                                                'size_high', 'size_width', 'image','is_active'
+                                                                ).order_by('type', 'name')
+
     @classmethod
     def get_club_general_time(cls, club_id):
         """
@@ -114,7 +138,7 @@ class ClubTimeForOwnerService:
         return club['open_time'], club['close_time'], club['working_days']
 
     @classmethod
-    def get_exception_day(cls, club_id, number_of_day):
+    def get_exception_day(cls, club_id, number_of_day, start=None):
         """
         Fetches pricing exceptions (special rules) for the date range.
         
@@ -130,6 +154,7 @@ class ClubTimeForOwnerService:
         Args:
             club_id: ID of the club
             number_of_day: Number of days from today to include
+            start: First day of the range instead of today (calendar grid)
             
         Returns:
             Tuple of:
@@ -138,7 +163,7 @@ class ClubTimeForOwnerService:
             - day_indices: List of weekday indices corresponding to dates
         """
         # Generate date range: today, today+1, today+2, ..., today+(number_of_day-1)
-        today = timezone.localtime(timezone.now()).date()
+        today = start or timezone.localtime(timezone.now()).date()
         dates = [today + timedelta(days=i) for i in range(number_of_day)]
         
         # Convert Python weekday (0=Monday, 6=Sunday) to custom weekday index
@@ -156,7 +181,7 @@ class ClubTimeForOwnerService:
         return exception_days, dates, day_indices
 
     @classmethod
-    def get_opening_time_with_percent(cls, club_id, number_of_day):
+    def get_opening_time_with_percent(cls, club_id, number_of_day, start=None):
         """
         Determines the pricing multiplier and opening hours for each day in the range.
         
@@ -171,6 +196,7 @@ class ClubTimeForOwnerService:
         Args:
             club_id: ID of the club
             number_of_day: Number of days from today to include
+            start: First day of the range instead of today (calendar grid)
             
         Returns:
             Dictionary mapping date strings to configuration dicts:
@@ -188,7 +214,7 @@ class ClubTimeForOwnerService:
         open_time, close_time, working_days = cls.get_club_general_time(club_id)
         
         # Get all exceptions and date range information
-        exception_days, dates, day_indices = cls.get_exception_day(club_id, number_of_day)
+        exception_days, dates, day_indices = cls.get_exception_day(club_id, number_of_day, start)
         
         # Build lookup dictionaries for O(1) access instead of linear search
         # This optimization allows fast rule lookup by date or weekday
@@ -1,10 +1,12 @@
 from decimal import Decimal, ROUND_HALF_UP
 from dashboard_manage.models import ClubEquipment, Equipment
 from player_booking.models import BookingEquipment, Booking, BookingStatus
-from django.db.models import Q, Sum, F
+from django.db.models import Q, F
 from rest_framework.exceptions import ValidationError
-from django.core.files.storage import default_storage
+from core.media import media_url
+from core.thumbnails import PHOTO, thumb_url
 from soccer.enm import BOOKING_STATUS_DENIED
+from .EquipmentLedgerService import EquipmentLedgerService
 from django.db.models import F
 from django.conf import settings
 from django.db import transaction
@@ -19,10 +21,13 @@ class EquipmentBookingService:
         
         final_price = booking.price
         equipment_ids = [ equipment['id'] for equipment in equipments]
-        
+
+        # Lock the equipment rows first so the ledger read below can't race another booking
+        club_equipments = list(ClubEquipment.objects.select_for_update().values('id', 'quantity', 'price', 'equipment_id').filter(club_id=club_id, is_active=True, id__in=equipment_ids, is_deteted=False))
+        if len(club_equipments) != len(equipment_ids):  
+            raise ValidationError({"error": "العدة يجب أن تكون نشطة."})
+
         equipment_quantities = cls.Get_booking_equipment_quantities(club_id, booking.date, booking.start_time, booking.end_time, equipment_ids)
-        print(equipment_quantities)
-        print("equipment_quantities")
         old_booked_map = {
             item['equipment_id']: item['total_booked_quantity'] 
             for item in equipment_quantities
@@ -42,13 +47,6 @@ class EquipmentBookingService:
             for item in equipments
         }
 
-        club_equipments = list(ClubEquipment.objects.select_for_update().values('id', 'quantity', 'price', 'equipment_id').filter(club_id=club_id, is_active=True, id__in=equipment_ids, is_deteted=False))
-        print(club_equipments)
-        print(":::::::::::::::::::::::::::::::::")
-        print(equipment_ids)
-        if len(club_equipments) != len(equipment_ids):  
-            raise ValidationError({"error": "العدة يجب أن تكون نشطة."})
-
         BookingEquipment_list = list()
         for equipment in club_equipments:
             quantity = (equipment['quantity'] - old_booked_map.get(equipment['id'],0)) - new_booked_map.get(equipment['id'],0)
@@ -71,6 +69,10 @@ class EquipmentBookingService:
 
         equipments=BookingEquipment.objects.bulk_create(BookingEquipment_list)
 
+        # bulk_create skips signals — reserve in the ledger if the booking already holds the slot
+        if booking.status in BOOKING_STATUS_DENIED:
+            EquipmentLedgerService.apply(booking.date, booking.start_time, booking.end_time, new_booked_map)
+
         return final_price
 
         
@@ -133,34 +135,21 @@ class EquipmentBookingService:
             equipment['quantity'] = max(equipment['quantity'] - old_booked_map.get(equipment['id'],0), 0) 
            
            
-            equipment['image'] = request.build_absolute_uri(default_storage.url(equipment['image']))
+            equipment['image_thumb_url'] = thumb_url(equipment['image'], PHOTO, request)
+            equipment['image'] = media_url(equipment['image'], request)
             print(equipment)
         
         return club_equipments
 
     @classmethod
     def Get_booking_equipment_quantities(cls, club_id, booking_date, start_time, end_time, equipment_ids=None):
-
-        queryset = BookingEquipment.objects.select_related('booking').filter(
-                booking__club_id=club_id,
-                booking__date=booking_date,
-                booking__status__in=BOOKING_STATUS_DENIED,
-                booking__start_time__lt=end_time,
-                booking__end_time__gt=start_time
-            )
-        
-        print(queryset)
-        # Apply equipment filter if provided
-        if equipment_ids:
-            queryset = queryset.filter(equipment_id__in=equipment_ids)
-        
-        # Execute query with values and annotation - RETURNS LIST OF DICTS
-        equipment_quantities = queryset.values('equipment_id').annotate(total_booked_quantity=Sum('quantity'))
-        
-        print("equipment_quantities")
-        print(equipment_quantities)
-        print("equipment_quantities")
-        
-        return list(equipment_quantities)
-
-
+        """
+        Peak quantity held by active bookings during [start_time, end_time),
+        read from the EquipmentReservation ledger:
+        [{'equipment_id': ..., 'total_booked_quantity': ...}, ...]
+        """
+        peaks = EquipmentLedgerService.peak_reserved(club_id, booking_date, start_time, end_time, equipment_ids)
+        return [
+            {'equipment_id': equipment_id, 'total_booked_quantity': quantity}
+            for equipment_id, quantity in peaks.items()
+        ]
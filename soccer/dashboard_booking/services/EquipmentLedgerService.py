@@ -0,0 +1,79 @@
+from collections import defaultdict
+
+from django.db.models import F, Max
+
+from dashboard_booking.models import EquipmentReservation
+from player_booking.models import BookingEquipment
+from .OccupancyService import OccupancyService
+
+
+class EquipmentLedgerService:
+    """
+    Equipment reservation ledger — one row per (club_equipment, date, slot)
+    on the 5-minute grid of OccupancyService, holding the quantity reserved
+    by active bookings (BOOKING_STATUS_DENIED) during that slot.
+
+      available(equipment, window) = quantity − max(reserved over the window's slots)
+
+    Rows are changed with F() increments inside the caller's transaction;
+    callers that check-then-reserve lock the ClubEquipment rows with
+    select_for_update first (see EquipmentBookingService).
+    """
+
+    @classmethod
+    def apply(cls, date, start_time, end_time, quantities: dict, multiplier: int = 1):
+        """
+        quantities = {club_equipment_id: quantity}
+        multiplier = +1 → reserve,  -1 → release
+        2 queries per call + 1 UPDATE per equipment.
+        """
+        quantities = {eq_id: qty for eq_id, qty in quantities.items() if qty}
+        slots = OccupancyService.slot_range(start_time, end_time)
+        if not quantities or not slots:
+            return
+
+        # Make sure every bucket exists, then shift the whole window at once
+        EquipmentReservation.objects.bulk_create(
+            [
+                EquipmentReservation(club_equipment_id=eq_id, date=date, slot=slot, reserved=0)
+                for eq_id in quantities
+                for slot in slots
+            ],
+            ignore_conflicts=True,
+        )
+        for eq_id, qty in quantities.items():
+            (
+                EquipmentReservation.objects
+                .filter(club_equipment_id=eq_id, date=date, slot__gte=slots.start, slot__lt=slots.stop)
+                .update(reserved=F('reserved') + qty * multiplier)
+            )
+
+    @classmethod
+    def apply_booking(cls, booking_id, date, start_time, end_time, multiplier: int = 1):
+        """Reserve / release every BookingEquipment row of a booking."""
+        quantities = defaultdict(int)
+        for eq_id, qty in BookingEquipment.objects.filter(booking_id=booking_id).values_list('equipment_id', 'quantity'):
+            quantities[eq_id] += qty
+        cls.apply(date, start_time, end_time, quantities, multiplier)
+
+    @classmethod
+    def peak_reserved(cls, club_id, date, start_time, end_time, equipment_ids=None) -> dict:
+        """{club_equipment_id: max reserved quantity over the window} — 1 query."""
+        slots = OccupancyService.slot_range(start_time, end_time)
+        if not slots:
+            return {}
+
+        qs = EquipmentReservation.objects.filter(
+            club_equipment__club_id=club_id,
+            date=date,
+            slot__gte=slots.start,
+            slot__lt=slots.stop,
+        )
+        if equipment_ids:
+            qs = qs.filter(club_equipment_id__in=equipment_ids)
+
+        return {
+            row['club_equipment_id']: row['peak']
+            for row in qs.values('club_equipment_id').annotate(peak=Max('reserved')).order_by()
+            if row['peak']
+        }
@@ -0,0 +1,215 @@
+from datetime import time
+
+from django.db import IntegrityError, transaction
+
+from dashboard_booking.models import PitchOccupancy
+from player_booking.models import Booking
+from soccer.enm import BOOKING_STATUS_DENIED
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES      # 288
+BITMAP_BYTES = SLOTS_PER_DAY // 8             # 36
+
+
+class OccupancyService:
+    """
+    Per-(pitch, date) occupancy bitmaps — bit i set  ⇔  the 5-minute slot
+    [i*5, i*5+5) minutes is covered by an active booking (BOOKING_STATUS_DENIED).
+
+    Intervals are rounded outward to the grid (start floored, end ceiled), so:
+      - no common bit            → the intervals cannot overlap (exact)
+      - common bit, all aligned  → they overlap (exact)
+      - common bit, any unaligned → undecided, ask the bookings table
+
+    Rows are maintained by signals_pitch_occupancy; a missing row means the
+    pitch has no active booking that day.
+    """
+
+    # ── Bit helpers (no DB) ────────────────────────────────────────────────
+
+    @staticmethod
+    def _minutes(t: time) -> float:
+        return t.hour * 60 + t.minute + t.second / 60 + t.microsecond / 60_000_000
+
+    @staticmethod
+    def is_aligned(t: time) -> bool:
+        return t.minute % SLOT_MINUTES == 0 and t.second == 0 and t.microsecond == 0
+
+    @classmethod
+    def slot_range(cls, start_time: time, end_time: time) -> range:
+        """Grid slots touched by [start_time, end_time) — start floored, end ceiled."""
+        start_slot = int(cls._minutes(start_time) // SLOT_MINUTES)
+        end_slot = -int(-cls._minutes(end_time) // SLOT_MINUTES)          # ceil
+        return range(start_slot, min(end_slot, SLOTS_PER_DAY))
+
+    @classmethod
+    def mask(cls, start_time: time, end_time: time) -> int:
+        slots = cls.slot_range(start_time, end_time)
+        if not slots:
+            return 0
+        return ((1 << len(slots)) - 1) << slots.start
+
+    @staticmethod
+    def to_bytes(bitmap: int) -> bytes:
+        return bitmap.to_bytes(BITMAP_BYTES, 'big')
+
+    @staticmethod
+    def from_bytes(raw) -> int:
+        return int.from_bytes(bytes(raw), 'big') if raw else 0
+
+    @classmethod
+    def to_intervals(cls, bitmap: int) -> list[tuple[time, time]]:
+        """Runs of set bits → merged (start, end) intervals."""
+        intervals = []
+        slot = 0
+        while bitmap >> slot:
+            if not (bitmap >> slot) & 1:
+                slot += 1
+                continue
+            run_start = slot
+            while slot < SLOTS_PER_DAY and (bitmap >> slot) & 1:
+                slot += 1
+            intervals.append((cls._slot_time(run_start), cls._slot_time(slot)))
+        return intervals
+
+    @staticmethod
+    def _slot_time(slot: int) -> time:
+        if slot >= SLOTS_PER_DAY:
+            return time.max
+        minutes = slot * SLOT_MINUTES
+        return time(minutes // 60, minutes % 60)
+
+    # ── Maintenance (called from signals, under the pitch/day lock) ────────
+
+    @classmethod
+    def _active_bookings(cls, pitch_id, date):
+        return Booking.objects.filter(
+            pitch_id=pitch_id,
+            date=date,
+            status__in=BOOKING_STATUS_DENIED,
+        )
+
+    @classmethod
+    def _save(cls, pitch_id, date, bitmap: int, unaligned_count: int):
+        values = {'bitmap': cls.to_bytes(bitmap), 'unaligned_count': unaligned_count}
+        if PitchOccupancy.objects.filter(pitch_id=pitch_id, date=date).update(**values):
+            return
+        try:
+            with transaction.atomic():
+                PitchOccupancy.objects.create(pitch_id=pitch_id, date=date, **values)
+        except IntegrityError:
+            PitchOccupancy.objects.filter(pitch_id=pitch_id, date=date).update(**values)
+
+    @classmethod
+    def rebuild(cls, pitch_id, date):
+        """Recompute the row from the bookings table — used when a booking leaves."""
+        bitmap, unaligned = 0, 0
+        for start_time, end_time in cls._active_bookings(pitch_id, date).values_list('start_time', 'end_time'):
+            bitmap |= cls.mask(start_time, end_time)
+            if not (cls.is_aligned(start_time) and cls.is_aligned(end_time)):
+                unaligned += 1
+        cls._save(pitch_id, date, bitmap, unaligned)
+
+    @classmethod
+    def rebuild_many(cls, keys):
+        """Rebuild each (pitch_id, date) — for callers that bypass the signals (bulk .update())."""
+        from .SlotReservationService import SlotReservationService
+
+        for pitch_id, date in keys:
+            with transaction.atomic():
+                SlotReservationService.lock_pitch_day(pitch_id, date)
+                cls.rebuild(pitch_id, date)
+
+    @classmethod
+    def add(cls, pitch_id, date, start_time, end_time):
+        """OR a newly active booking into the row — no scan of the bookings table."""
+        row = (
+            PitchOccupancy.objects
+            .filter(pitch_id=pitch_id, date=date)
+            .values('bitmap', 'unaligned_count')
+            .first()
+        )
+        if row is None:
+            return cls.rebuild(pitch_id, date)
+
+        unaligned = row['unaligned_count']
+        if not (cls.is_aligned(start_time) and cls.is_aligned(end_time)):
+            unaligned += 1
+        cls._save(pitch_id, date, cls.from_bytes(row['bitmap']) | cls.mask(start_time, end_time), unaligned)
+
+    # ── Reads ──────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _exact_overlap(cls, pitch_ids, date, start_time, end_time, exclude_booking_id=None) -> set:
+        qs = Booking.objects.filter(
+            pitch_id__in=pitch_ids,
+            date=date,
+            status__in=BOOKING_STATUS_DENIED,
+            start_time__lt=end_time,
+            end_time__gt=start_time,
+        )
+        if exclude_booking_id is not None:
+            qs = qs.exclude(pk=exclude_booking_id)
+        return set(qs.values_list('pitch_id', flat=True).distinct())
+
+    @classmethod
+    def has_conflict(cls, pitch_id, date, start_time, end_time, exclude_booking_id=None) -> bool:
+        row = (
+            PitchOccupancy.objects
+            .filter(pitch_id=pitch_id, date=date)
+            .values('bitmap', 'unaligned_count')
+            .first()
+        )
+        if row is None:
+            return False
+        if not cls.from_bytes(row['bitmap']) & cls.mask(start_time, end_time):
+            return False
+
+        exact = (
+            exclude_booking_id is None
+            and row['unaligned_count'] == 0
+            and cls.is_aligned(start_time) and cls.is_aligned(end_time)
+        )
+        if exact:
+            return True
+        return bool(cls._exact_overlap([pitch_id], date, start_time, end_time, exclude_booking_id))
+
+    @classmethod
+    def busy_pitch_ids(cls, date, start_time, end_time) -> list:
+        """Pitches with an active booking overlapping [start_time, end_time) on date."""
+        request_mask = cls.mask(start_time, end_time)
+        request_aligned = cls.is_aligned(start_time) and cls.is_aligned(end_time)
+
+        busy, undecided = [], []
+        rows = PitchOccupancy.objects.filter(date=date).values_list('pitch_id', 'bitmap', 'unaligned_count')
+        for pitch_id, raw, unaligned_count in rows:
+            if not cls.from_bytes(raw) & request_mask:
+                continue
+            if request_aligned and unaligned_count == 0:
+                busy.append(pitch_id)
+            else:
+                undecided.append(pitch_id)
+
+        if undecided:
+            busy.extend(cls._exact_overlap(undecided, date, start_time, end_time))
+        return busy
+
+    @classmethod
+    def booked_intervals(cls, pitch_id, date) -> list[tuple[time, time]]:
+        """Merged active intervals of the pitch on date, ordered by start."""
+        row = (
+            PitchOccupancy.objects
+            .filter(pitch_id=pitch_id, date=date)
+            .values('bitmap', 'unaligned_count')
+            .first()
+        )
+        if row is None:
+            return []
+        if row['unaligned_count'] == 0:
+            return cls.to_intervals(cls.from_bytes(row['bitmap']))
+
+        return list(
+            cls._active_bookings(pitch_id, date)
+            .order_by('start_time')
+            .values_list('start_time', 'end_time')
+        )
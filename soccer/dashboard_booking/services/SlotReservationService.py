@@ -0,0 +1,63 @@
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from dashboard_booking.models import PitchDayLock
+from .OccupancyService import OccupancyService
+
+SLOT_CONFLICT_ERROR = "هذا الوقت يتداخل مع حجز موجود."
+
+
+class SlotReservationService:
+    """
+    Serializes reservations per (pitch, date) so the overlap check and the
+    write that follows it cannot interleave with another request.
+
+    - PostgreSQL : pg_advisory_xact_lock on (pitch, date) — no table writes,
+                   released automatically at COMMIT/ROLLBACK.
+    - Others     : UPDATE of the PitchDayLock row — the row lock (or SQLite's
+                   database write lock) is held until the transaction ends.
+
+    Only requests for the same pitch on the same day wait for each other;
+    the rest of the club is untouched.
+    Must be called inside transaction.atomic().
+    """
+
+    @staticmethod
+    def _advisory_key(pitch_id, date) -> tuple[int, int]:
+        # Two signed int4 keys: pitch uuid folded to 32 bits + the day ordinal
+        pitch_key = (int(str(pitch_id).replace('-', ''), 16) % 2**32) - 2**31
+        return pitch_key, date.toordinal()
+
+    @classmethod
+    def lock_pitch_day(cls, pitch_id, date):
+        if not connection.in_atomic_block:
+            raise RuntimeError("lock_pitch_day() must be called inside transaction.atomic().")
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s, %s)", cls._advisory_key(pitch_id, date))
+            return
+
+        now = timezone.now()
+        if PitchDayLock.objects.filter(pitch_id=pitch_id, date=date).update(locked_at=now):
+            return
+        try:
+            with transaction.atomic():
+                PitchDayLock.objects.create(pitch_id=pitch_id, date=date)
+        except IntegrityError:
+            PitchDayLock.objects.filter(pitch_id=pitch_id, date=date).update(locked_at=now)
+
+    @classmethod
+    def ensure_slot_free(cls, pitch_id, date, start_time, end_time,
+                         exclude_booking_id=None, error_message=SLOT_CONFLICT_ERROR):
+        """
+        Locks the (pitch, date) and raises the conflict error if an active
+        booking overlaps [start_time, end_time) — checked against the pitch's
+        occupancy bitmap. The caller's insert/update must run in the same
+        transaction, after this call.
+        """
+        cls.lock_pitch_day(pitch_id, date)
+
+        if OccupancyService.has_conflict(pitch_id, date, start_time, end_time, exclude_booking_id):
+            raise ValidationError({"error": error_message})
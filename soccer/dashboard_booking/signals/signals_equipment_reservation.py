@@ -0,0 +1,93 @@
+"""
+Keeps the EquipmentReservation ledger in sync.
+
+  Booking enters BOOKING_STATUS_DENIED         → reserve its equipment
+  Booking leaves it                            → release its equipment
+  Active booking moves date / time             → release old window, reserve new
+  BookingEquipment saved / deleted while the
+  booking is active                            → apply the quantity difference
+
+BookingEquipment.objects.bulk_create() skips signals —
+EquipmentBookingService.Create_Equipment_Booking reserves explicitly.
+
+Reuses the Booking snapshot taken by signals_pitch_occupancy.occupancy_pre_save
+(imported before this module in DashboardBookingConfig.ready).
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from dashboard_booking.services.EquipmentLedgerService import EquipmentLedgerService
+from player_booking.models import Booking, BookingEquipment
+from soccer.enm import BOOKING_STATUS_DENIED
+
+
+# ─────────────────────────────────────────────────────────────
+# 1.  Booking transitions
+# ─────────────────────────────────────────────────────────────
+
+@receiver(post_save, sender=Booking, dispatch_uid="equipment_reservation_booking_post_save")
+def equipment_reservation_booking_saved(sender, instance, created, **kwargs):
+    old = getattr(instance, "_occupancy_old", None)        # (status, pitch_id, date, start_time, end_time)
+    was_active = old is not None and old[0] in BOOKING_STATUS_DENIED
+    is_active = instance.status in BOOKING_STATUS_DENIED
+
+    window_changed = old is not None and (old[2], old[3], old[4]) != (instance.date, instance.start_time, instance.end_time)
+    if was_active == is_active and not (is_active and window_changed):
+        return
+
+    with transaction.atomic():
+        if was_active:
+            EquipmentLedgerService.apply_booking(instance.pk, old[2], old[3], old[4], multiplier=-1)
+        if is_active:
+            EquipmentLedgerService.apply_booking(instance.pk, instance.date, instance.start_time, instance.end_time)
+
+
+# ─────────────────────────────────────────────────────────────
+# 2.  Individual BookingEquipment writes (admin edits, cascades)
+# ─────────────────────────────────────────────────────────────
+
+def _active_booking_window(booking_id):
+    return (
+        Booking.objects
+        .filter(pk=booking_id, status__in=BOOKING_STATUS_DENIED)
+        .values_list("date", "start_time", "end_time")
+        .first()
+    )
+
+
+@receiver(pre_save, sender=BookingEquipment, dispatch_uid="equipment_reservation_item_pre_save")
+def equipment_reservation_item_pre_save(sender, instance, **kwargs):
+    instance._ledger_old = None
+    if instance.pk:
+        instance._ledger_old = (
+            BookingEquipment.objects
+            .filter(pk=instance.pk)
+            .values_list("equipment_id", "quantity")
+            .first()
+        )
+
+
+@receiver(post_save, sender=BookingEquipment, dispatch_uid="equipment_reservation_item_post_save")
+def equipment_reservation_item_saved(sender, instance, created, **kwargs):
+    old = getattr(instance, "_ledger_old", None)
+    if old == (instance.equipment_id, instance.quantity):
+        return
+
+    window = _active_booking_window(instance.booking_id)
+    if window is None:
+        return
+
+    with transaction.atomic():
+        if old:
+            EquipmentLedgerService.apply(*window, {old[0]: old[1]}, multiplier=-1)
+        EquipmentLedgerService.apply(*window, {instance.equipment_id: instance.quantity})
+
+
+@receiver(post_delete, sender=BookingEquipment, dispatch_uid="equipment_reservation_item_post_delete")
+def equipment_reservation_item_deleted(sender, instance, **kwargs):
+    # On a Booking cascade delete the parent row is still there (children go first)
+    window = _active_booking_window(instance.booking_id)
+    if window is None:
+        return
+    EquipmentLedgerService.apply(*window, {instance.equipment_id: instance.quantity}, multiplier=-1)
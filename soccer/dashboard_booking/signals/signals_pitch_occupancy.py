@@ -0,0 +1,68 @@
+"""
+Keeps PitchOccupancy in sync with Booking status transitions.
+
+  • enters BOOKING_STATUS_DENIED            → OR the booking's bits into its row
+  • leaves it / moves pitch, date or time   → rebuild the old row from the table
+  • deleted while active                    → rebuild the row
+
+Runs inside the save's transaction and under the (pitch, date) lock, so a
+concurrent reservation always sees an up-to-date bitmap.
+Bulk .update() calls bypass signals — run `rebuild_pitch_occupancy` after them.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from dashboard_booking.services.OccupancyService import OccupancyService
+from dashboard_booking.services.SlotReservationService import SlotReservationService
+from player_booking.models import Booking
+from soccer.enm import BOOKING_STATUS_DENIED
+
+_SLOT_FIELDS = ("status", "pitch_id", "date", "start_time", "end_time")
+
+
+def _slot_key(obj):
+    return tuple(getattr(obj, f) for f in _SLOT_FIELDS)
+
+
+@receiver(pre_save, sender=Booking, dispatch_uid="pitch_occupancy_pre_save")
+def occupancy_pre_save(sender, instance, **kwargs):
+    old = None
+    if instance.pk:
+        old = Booking.objects.only(*_SLOT_FIELDS).filter(pk=instance.pk).first()
+    instance._occupancy_old = _slot_key(old) if old else None
+
+
+@receiver(post_save, sender=Booking, dispatch_uid="pitch_occupancy_post_save")
+def occupancy_post_save(sender, instance, created, **kwargs):
+    old = getattr(instance, "_occupancy_old", None)
+    new = _slot_key(instance)
+    if old == new:
+        return
+
+    was_active = old is not None and old[0] in BOOKING_STATUS_DENIED
+    is_active = new[0] in BOOKING_STATUS_DENIED
+    if not (was_active or is_active):
+        return
+
+    with transaction.atomic():
+        if was_active:
+            _, pitch_id, date, _, _ = old
+            SlotReservationService.lock_pitch_day(pitch_id, date)
+            OccupancyService.rebuild(pitch_id, date)
+
+        if is_active:
+            _, pitch_id, date, start_time, end_time = new
+            SlotReservationService.lock_pitch_day(pitch_id, date)
+            if was_active and (old[1], old[2]) == (pitch_id, date):
+                return          # same row, already rebuilt with the new times
+            OccupancyService.add(pitch_id, date, start_time, end_time)
+
+
+@receiver(post_delete, sender=Booking, dispatch_uid="pitch_occupancy_post_delete")
+def occupancy_post_delete(sender, instance, **kwargs):
+    if instance.status not in BOOKING_STATUS_DENIED:
+        return
+    with transaction.atomic():
+        SlotReservationService.lock_pitch_day(instance.pitch_id, instance.date)
+        OccupancyService.rebuild(instance.pitch_id, instance.date)
@@ -20,7 +20,8 @@ from .serializers import (
     BookingConvertStatusSerializer,
     BookingListPitchSerializer,
     EquipmentAvailabilityQuerySerializer,
-    ClosedBookingCreateSerializer
+    ClosedBookingCreateSerializer,
+    CalendarFilterSerializer,
 )
 from django.conf import settings
 
@@ -28,10 +29,12 @@ from django.conf import settings
 from dashboard_booking.services.BookingService import BookingService
 from dashboard_booking.services.PricingService import PricingService
 from dashboard_booking.services.ClubTimeForOwnerService import ClubTimeForOwnerService
+from dashboard_booking.services.CalendarService import CalendarService
 from dashboard_booking.services.EquipmentBookingService import EquipmentBookingService
 from django.db.models import Prefetch
 from rest_framework import generics 
 from core.permission import IsPlayerPermission, IsClubOwnerPermission, IsClubStaffOrOwnerPermission
+from core.conditional import conditional_response, requested_layout
 
 
 class ClosedBookingCreateView(generics.CreateAPIView):
@@ -181,6 +184,25 @@ class BookingViewSet(viewsets.ModelViewSet):
     
 
 
+    @action(detail=False, methods=['get'], url_path='calendar')
+    def calendar(self, request):
+        """
+        GET: Bookings of every pitch of the club over a date range, grouped by pitch and day
+        ?date_from=YYYY-MM-DD  &date_to=YYYY-MM-DD (default date_from)  &active=true (active bookings only)
+        """
+        input_serializer = CalendarFilterSerializer(data=request.query_params)
+        input_serializer.is_valid(raise_exception=True)
+        params = input_serializer.validated_data
+
+        data = CalendarService.get_calendar(
+            request.auth.get('club_id'),
+            params['date_from'],
+            params['date_to'],
+            active_only=params['active'],
+        )
+        return conditional_response(request, data)
+    
+
     @action(detail=True, methods=['patch'], url_path='convert-booking')
     def convert_booking(self, request, pk=None):
         """
@@ -328,8 +350,11 @@ class BookingstatusAPIView(APIView):
 class ClubOpeningPrices(APIView):
     permission_classes = [IsClubOwnerPermission]
     def get(self, request):
-        opening_time_with_pitches_prices = ClubTimeForOwnerService.get_opening_time_with_pitches_prices(request.auth.get('club_id'), settings.MAX_NUM_DAY_BEFORE_BOOKING, request)
-        return Response(opening_time_with_pitches_prices)
+        if requested_layout(request) == 'compact':
+            opening_time_with_pitches_prices = ClubTimeForOwnerService.get_opening_time_with_pitches_prices_compact(request.auth.get('club_id'), settings.MAX_NUM_DAY_BEFORE_BOOKING, request)
+        else:
+            opening_time_with_pitches_prices = ClubTimeForOwnerService.get_opening_time_with_pitches_prices(request.auth.get('club_id'), settings.MAX_NUM_DAY_BEFORE_BOOKING, request)
+        return conditional_response(request, opening_time_with_pitches_prices, headers={'Vary': 'Accept'})
 
 
 
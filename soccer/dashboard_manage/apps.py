@@ -10,4 +10,5 @@ class DashboardManageConfig(AppConfig):
         import dashboard_manage.signals.signals_booking_statistics 
         import dashboard_manage.signals.signals_booking_equipment_statistics
         import dashboard_manage.signals.signals_booking_equipment_statistics_fromBooking
-        import dashboard_manage.signals.signals_log_opening_time_change
\ No newline at end of file
+        import dashboard_manage.signals.signals_log_opening_time_change
+        import dashboard_manage.signals.signals_report_cache
\ No newline at end of file
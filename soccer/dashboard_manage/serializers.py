@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.media import media_url
 from .models import Club, ClubPricing, Pitch, Equipment, ClubEquipment, BookingDuration, ClubDeposit
 from .services import EquipmentManageService
 
@@ -103,9 +104,7 @@ class ShowClubEquipmentSerializer(serializers.ModelSerializer):
         if obj.equipment.image:
             image = obj.equipment.image
             request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(image.url)
-            return image.url
+            return media_url(image, request)
         return None
 
 
@@ -180,7 +179,7 @@ class ClubManagerSerializer(serializers.ModelSerializer):
             return None
 
         request = self.context.get('request')
-        return request.build_absolute_uri(obj.logo.url) if request else obj.logo.url
+        return media_url(obj.logo, request)
 
     def validate(self, attrs):
 
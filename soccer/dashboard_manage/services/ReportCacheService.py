@@ -0,0 +1,118 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from core.replica import primary_reads
+
+
+class ReportCacheService:
+    """
+    Result cache for the owner dashboard reports (revenue / bookings /
+    hourly / equipment), keyed by (club, report, date_from, date_to).
+
+    Every report is a sum of per-day statistics rows, so a range splits into
+
+      history  [date_from, yesterday]  → cached for TIMEOUT, computed on the
+                                         primary (a lagging replica would cache
+                                         pre-write totals under the new version)
+      live     [today,     date_to]    → recomputed on every request
+
+    and the two partial results are added together (merge).
+
+    Invalidation: the statistics writers call invalidate(club, report, day)
+    for every row they touch. Only a day before today can be inside a cached
+    slice; it bumps the (club, report) version on commit, which orphans
+    every cached slice of that club's report.
+
+    The cache is the shared default alias (settings.CACHES), so a bump from
+    a django-q task or another worker reaches every web worker. TIMEOUT
+    bounds what a missed invalidation (a bulk .update()) can serve.
+    """
+
+    REVENUE   = "revenue"
+    BOOKINGS  = "bookings"
+    HOURLY    = "hourly"
+    EQUIPMENT = "equipment"
+
+    TIMEOUT = 60 * 60 * 6
+
+    @classmethod
+    def get(cls, club_id, report: str, date_from, date_to, compute):
+        """
+        compute(club_id, date_from, date_to) → partial result: a dict whose numeric
+        leaves can be summed (nested dicts allowed, other leaves kept).
+        """
+        today = timezone.localdate()
+        parts = []
+
+        if date_from < today:
+            history_to = min(date_to, today - timedelta(days=1))
+            key = cls._key(club_id, report, date_from, history_to)
+            history = cache.get(key)
+            if history is None:
+                with primary_reads():
+                    history = compute(club_id, date_from, history_to)
+                cache.set(key, history, timeout=cls.TIMEOUT)
+            parts.append(history)
+
+        if date_to >= today:
+            parts.append(compute(club_id, max(date_from, today), date_to))
+
+        result = {}
+        for part in parts:
+            cls.merge(result, part)
+        return result
+
+    @classmethod
+    def invalidate(cls, club_id, report: str, day=None):
+        """
+        Call from the statistics writers. day=None → the change may touch
+        any day (e.g. opening hours edited).
+        """
+        if day is not None and day >= timezone.localdate():
+            return   # today and later are never cached
+
+        vkey = cls._version_key(club_id, report)
+        transaction.on_commit(lambda: cls._bump(vkey))
+
+    # ── helpers ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def merge(target: dict, source: dict) -> dict:
+        """target += source, leaf by leaf."""
+        for key, value in source.items():
+            if isinstance(value, dict):
+                ReportCacheService.merge(target.setdefault(key, {}), value)
+            elif isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+                target[key] = target.get(key, 0) + value
+            else:
+                target.setdefault(key, value)
+        return target
+
+    @staticmethod
+    def _version_key(club_id, report):
+        return f"report:v:{club_id}:{report}"
+
+    @classmethod
+    def _version(cls, club_id, report):
+        vkey = cls._version_key(club_id, report)
+        # Seeded from the clock: if the version key is ever evicted the new
+        # one never collides with a version that older slices were stored under
+        cache.add(vkey, int(time.time() * 1000), timeout=cls.TIMEOUT)
+        return cache.get(vkey)
+
+    @classmethod
+    def _bump(cls, vkey):
+        try:
+            cache.incr(vkey)
+            cache.touch(vkey, cls.TIMEOUT)
+        except ValueError:          # evicted meanwhile
+            cache.add(vkey, int(time.time() * 1000), timeout=cls.TIMEOUT)
+
+    @classmethod
+    def _key(cls, club_id, report, date_from, date_to):
+        return f"report:{club_id}:{report}:{cls._version(club_id, report)}:{date_from}:{date_to}"
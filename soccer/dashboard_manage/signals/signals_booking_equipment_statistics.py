@@ -36,6 +36,7 @@ from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
 from dashboard_manage.models import ClubEquipmentStatistics
+from dashboard_manage.services.ReportCacheService import ReportCacheService
 from player_booking.models import (
     Booking,
     BookingEquipment,
@@ -111,6 +112,7 @@ def _upsert_equipment_stats(club_id, club_equipment_id, date, deltas: dict):
     if not deltas:
         return
 
+    ReportCacheService.invalidate(club_id, ReportCacheService.EQUIPMENT, date)
     f_update = {field: F(field) + value for field, value in deltas.items()}
 
     # Hot path: row exists -> 1 UPDATE.
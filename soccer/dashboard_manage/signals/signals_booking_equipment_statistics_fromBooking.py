@@ -51,6 +51,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from dashboard_manage.models import ClubEquipmentStatistics
+from dashboard_manage.services.ReportCacheService import ReportCacheService
 from player_booking.models import (
     Booking,
     BookingEquipment,
@@ -108,6 +109,7 @@ def _bulk_apply_equipment(club_id, date, items: list, by_owner: bool, multiplier
     if not items:
         return
 
+    ReportCacheService.invalidate(club_id, ReportCacheService.EQUIPMENT, date)
     deltas = _build_deltas(items, by_owner, multiplier)
     equipment_ids = list(deltas.keys())
 
@@ -44,6 +44,12 @@ from player_booking.models import (
     Coupon,
     PayStatus
 )
+from dashboard_manage.services.ReportCacheService import ReportCacheService
+
+_REPORT_OF = {
+    BookingNumStatistics:   ReportCacheService.BOOKINGS,
+    BookingPriceStatistics: ReportCacheService.REVENUE,
+}
 
 
 # ─────────────────────────────────────────────────────────────
@@ -244,6 +250,7 @@ def _upsert(model_class, club_id, day, deltas: dict):
     if not deltas:
         return
 
+    ReportCacheService.invalidate(club_id, _REPORT_OF[model_class], day)
     f_updates = {field: F(field) + value for field, value in deltas.items()}
 
     if model_class.objects.filter(club_id=club_id, day=day).update(**f_updates):
@@ -262,6 +269,7 @@ def _upsert_hourly(club_id, pitch_id, date, hour_minutes: dict[int, int], multip
     multiplier = +1 → booking became COMPLETED
     multiplier = -1 → booking left COMPLETED state
     """
+    ReportCacheService.invalidate(club_id, ReportCacheService.HOURLY, date)
     for hour, minutes in hour_minutes.items():
         delta = minutes * multiplier
         if delta == 0:
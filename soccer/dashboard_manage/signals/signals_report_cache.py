@@ -0,0 +1,28 @@
+"""
+Invalidates the cached hourly utilisation report when the opening hours it
+was computed from change (ReportCacheService).
+
+  ClubPricing type=2 (date override)   → that date
+  ClubPricing type=1 (weekday rule)    → every day — the rule applies to all history
+  ClubOpeningTimeHistory               → its created_at (applies from that day on)
+
+The statistics writers invalidate their own reports where they upsert rows.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from dashboard_manage.models import ClubOpeningTimeHistory, ClubPricing
+from dashboard_manage.services.ReportCacheService import ReportCacheService
+
+
+@receiver(post_save, sender=ClubPricing, dispatch_uid="report_cache_pricing_saved")
+@receiver(post_delete, sender=ClubPricing, dispatch_uid="report_cache_pricing_deleted")
+def report_cache_pricing_changed(sender, instance, **kwargs):
+    day = instance.date if instance.type == 2 else None
+    ReportCacheService.invalidate(instance.club_id, ReportCacheService.HOURLY, day)
+
+
+@receiver(post_save, sender=ClubOpeningTimeHistory, dispatch_uid="report_cache_opening_saved")
+@receiver(post_delete, sender=ClubOpeningTimeHistory, dispatch_uid="report_cache_opening_deleted")
+def report_cache_opening_changed(sender, instance, **kwargs):
+    ReportCacheService.invalidate(instance.club_id, ReportCacheService.HOURLY, instance.created_at)
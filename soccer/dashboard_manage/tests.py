@@ -1,3 +1,28 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from core.replica import REPLICA, ReplicaRouter, _read_alias
+from dashboard_manage.services.ReportCacheService import ReportCacheService
+from player_booking.models import Booking
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ReportCacheReadsTests(SimpleTestCase):
+
+    def test_cached_history_is_computed_on_the_primary(self):
+        routed = []
+
+        def compute(club_id, date_from, date_to):
+            routed.append((date_from, ReplicaRouter().db_for_read(Booking)))
+            return {}
+
+        today = timezone.localdate()
+        token = _read_alias.set(REPLICA)
+        try:
+            ReportCacheService.get(1, ReportCacheService.REVENUE, today - timedelta(days=3), today, compute)
+        finally:
+            _read_alias.reset(token)
+
+        self.assertEqual(routed, [(today - timedelta(days=3), None), (today, REPLICA)])
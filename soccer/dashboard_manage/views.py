@@ -22,6 +22,9 @@ from dashboard_manage.models import (
 from collections import defaultdict
 
 from core.permission import IsPlayerPermission, IsClubOwnerPermission, IsClubStaffOrOwnerPermission
+from core.response_cache import CachedResponseMixin
+from core.replica import UseReplicaMixin
+from player_booking.services.ClubCardService import ClubCardService
 
 from .models import Club, ClubPricing, Pitch, Equipment, ClubEquipment, BookingDuration, PitchTypes, ClubDeposit
 from .serializers import (ClubManagerSerializer, WeekdayPricingSerializer,
@@ -174,13 +177,14 @@ class DatePricingViewSet(_BasePricingViewSet):
 
         )
 
-class GetPitchesTypesView(APIView):
+class GetPitchesTypesView(CachedResponseMixin, APIView):
+    cache_max_age = 60 * 60 * 24
+
     def get(self, request):
-        types = [
+        return self.cached_response(request, lambda: [
             { "name": label}
             for value, label in PitchTypes.choices
-        ]
-        return Response(types)
+        ])
 
 class PitchViewSet(viewsets.ModelViewSet):
     permission_classes = [IsClubStaffOrOwnerPermission]
@@ -251,12 +255,15 @@ class PitchViewSet(viewsets.ModelViewSet):
                 club_id = self.request.auth.get('club_id')
                 Club.objects.filter(id=club_id).update(is_active=False,
                                                     updated_at=timezone.now())
+                # .update() skips the signals — take the club off the player list too
+                ClubCardService.refresh_on_commit([club_id])
       
         return Response(serializer.validated_data, status=status.HTTP_200_OK)
     
 
-class EquipmentGenericsList(generics.ListAPIView):
+class EquipmentGenericsList(CachedResponseMixin, generics.ListAPIView):
     permission_classes = [IsClubStaffOrOwnerPermission]
+    cache_models = ('dashboard_manage.Equipment',)
     serializer_class = ReadEquipmentSerializer
     queryset = Equipment.objects.all()
 
@@ -316,12 +323,13 @@ URLs (add to your urlconf):
 # Shared helpers
 # ─────────────────────────────────────────────────────────────
 from .helpers import _parse_date_range, _get_club, _decimal, _int, _available_minutes_per_hour, _build_opening_map
+from .services.ReportCacheService import ReportCacheService
 
 # ─────────────────────────────────────────────────────────────
 # 1. Revenue Report  — BookingPriceStatistics
 # ─────────────────────────────────────────────────────────────
 
-class RevenueReportView(APIView):
+class RevenueReportView(UseReplicaMixin, APIView):
     """
     GET /dashboard/revenue/?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
 
@@ -352,13 +360,11 @@ class RevenueReportView(APIView):
     """
     permission_classes = [IsClubOwnerPermission]
 
-    def get(self, request):
-        club = _get_club(request)
-        date_from, date_to = _parse_date_range(request)
-
+    @staticmethod
+    def _totals(club_id, date_from, date_to) -> dict:
         agg = (
             BookingPriceStatistics.objects
-            .filter(club=club, day__gte=date_from, day__lte=date_to)
+            .filter(club_id=club_id, day__gte=date_from, day__lte=date_to)
             .aggregate(
                 completed_owner=Sum("money_from_completed_owner"),
                 completed_player=Sum("money_from_completed_player"),
@@ -366,6 +372,13 @@ class RevenueReportView(APIView):
                 pending_player=Sum("money_from_pending_pay_player"),
             )
         )
+        return {k: _decimal(v) for k, v in agg.items()}
+
+    def get(self, request):
+        club = _get_club(request)
+        date_from, date_to = _parse_date_range(request)
+
+        agg = ReportCacheService.get(club.id, ReportCacheService.REVENUE, date_from, date_to, self._totals)
 
         completed_owner  = _decimal(agg["completed_owner"])
         completed_player = _decimal(agg["completed_player"])
@@ -397,7 +410,7 @@ class RevenueReportView(APIView):
 # 2. Booking Counts Report  — BookingNumStatistics
 # ─────────────────────────────────────────────────────────────
 
-class BookingCountsReportView(APIView):
+class BookingCountsReportView(UseReplicaMixin, APIView):
     """
     GET /dashboard/bookings/?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
 
@@ -436,13 +449,11 @@ class BookingCountsReportView(APIView):
     """
     permission_classes = [IsClubOwnerPermission]
 
-    def get(self, request):
-        club = _get_club(request)
-        date_from, date_to = _parse_date_range(request)
-
+    @staticmethod
+    def _totals(club_id, date_from, date_to) -> dict:
         agg = (
             BookingNumStatistics.objects
-            .filter(club=club, day__gte=date_from, day__lte=date_to)
+            .filter(club_id=club_id, day__gte=date_from, day__lte=date_to)
             .aggregate(
                 completed_num_player=Sum("completed_num"), # from player
                 completed_num_owner=Sum("completed_num_owner"),
@@ -460,6 +471,13 @@ class BookingCountsReportView(APIView):
                 expired_num=Sum("expired_num"),
             )
         )
+        return {k: _int(v) for k, v in agg.items()}
+
+    def get(self, request):
+        club = _get_club(request)
+        date_from, date_to = _parse_date_range(request)
+
+        agg = ReportCacheService.get(club.id, ReportCacheService.BOOKINGS, date_from, date_to, self._totals)
 
         completed_player = _int(agg["completed_num_player"]) # from player
         completed_owner = _int(agg["completed_num_owner"])
@@ -506,7 +524,7 @@ class BookingCountsReportView(APIView):
 # ─────────────────────────────────────────────────────────────
 # 3. Hourly Utilisation Report  — ClubHourlyStatistics
 # ─────────────────────────────────────────────────────────────
-class HourlyUtilisationReportView(APIView):
+class HourlyUtilisationReportView(UseReplicaMixin, APIView):
     """
     GET /dashboard/hourly/?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
 
@@ -540,19 +558,17 @@ class HourlyUtilisationReportView(APIView):
     }
     """
     permission_classes = [IsClubStaffOrOwnerPermission]
-    def get(self, request):
-        club               = _get_club(request)
-        date_from, date_to = _parse_date_range(request)
-        days_in_range      = (date_to - date_from).days + 1
 
+    @staticmethod
+    def _totals(club_id, date_from, date_to) -> dict:
         # ── Queries 1 & 2: true opening window per day ────────────────────
-        opening_map        = _build_opening_map(club.id, date_from, date_to)
+        opening_map        = _build_opening_map(club_id, date_from, date_to)
         available_per_hour = _available_minutes_per_hour(opening_map)
 
         # ── Query 3: booked minutes by hour + pitch ───────────────────────
         rows = (
             ClubHourlyStatistics.objects
-            .filter(club=club, date__gte=date_from, date__lte=date_to)
+            .filter(club_id=club_id, date__gte=date_from, date__lte=date_to)
             .values("hour", "pitch_id")
             .annotate(booked_minutes=Sum("booked_minutes"))
             .order_by("hour", "pitch_id")
@@ -562,6 +578,17 @@ class HourlyUtilisationReportView(APIView):
         for row in rows:
             hour_map[row["hour"]][str(row["pitch_id"])] = row["booked_minutes"]
 
+        return {"available": dict(available_per_hour), "booked": dict(hour_map)}
+
+    def get(self, request):
+        club               = _get_club(request)
+        date_from, date_to = _parse_date_range(request)
+        days_in_range      = (date_to - date_from).days + 1
+
+        totals = ReportCacheService.get(club.id, ReportCacheService.HOURLY, date_from, date_to, self._totals)
+        available_per_hour = totals.get("available", {})
+        hour_map           = totals.get("booked", {})
+
         by_hour = []
         for hour in sorted(hour_map.keys()):
             pitch_data      = hour_map[hour]
@@ -596,7 +623,7 @@ class HourlyUtilisationReportView(APIView):
 # 4. Equipment Sales Report  — ClubEquipmentStatistics
 # ─────────────────────────────────────────────────────────────
 
-class EquipmentSalesReportView(APIView):
+class EquipmentSalesReportView(UseReplicaMixin, APIView):
     """
     GET /dashboard/equipment/?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
 
@@ -631,13 +658,11 @@ class EquipmentSalesReportView(APIView):
     """
     permission_classes = [IsClubOwnerPermission]
 
-    def get(self, request):
-        club = _get_club(request)
-        date_from, date_to = _parse_date_range(request)
-
+    @staticmethod
+    def _totals(club_id, date_from, date_to) -> dict:
         rows = (
             ClubEquipmentStatistics.objects
-            .filter(club=club, date__gte=date_from, date__lte=date_to)
+            .filter(club_id=club_id, date__gte=date_from, date__lte=date_to)
             .values("club_equipment_id", "club_equipment__equipment__name")   # ← add this
             .annotate(
                 qty_owner=Sum("quantity_by_ower"),      # model typo preserved
@@ -647,6 +672,22 @@ class EquipmentSalesReportView(APIView):
             )
             .order_by("club_equipment_id")
         )
+        return {
+            str(row["club_equipment_id"]): {
+                "name":       row["club_equipment__equipment__name"],
+                "qty_owner":  _int(row["qty_owner"]),
+                "rev_owner":  _decimal(row["rev_owner"]),
+                "qty_player": _int(row["qty_player"]),
+                "rev_player": _decimal(row["rev_player"]),
+            }
+            for row in rows
+        }
+
+    def get(self, request):
+        club = _get_club(request)
+        date_from, date_to = _parse_date_range(request)
+
+        totals = ReportCacheService.get(club.id, ReportCacheService.EQUIPMENT, date_from, date_to, self._totals)
 
         by_equipment = []
         total_qty_owner  = 0
@@ -654,11 +695,11 @@ class EquipmentSalesReportView(APIView):
         total_qty_player = 0
         total_rev_player = _decimal(None)
 
-        for row in rows:
-            qo = _int(row["qty_owner"])
-            ro = _decimal(row["rev_owner"])
-            qp = _int(row["qty_player"])
-            rp = _decimal(row["rev_player"])
+        for equipment_id, row in sorted(totals.items()):
+            qo = row["qty_owner"]
+            ro = row["rev_owner"]
+            qp = row["qty_player"]
+            rp = row["rev_player"]
 
             total_qty_owner  += qo
             total_rev_owner  += ro
@@ -666,8 +707,8 @@ class EquipmentSalesReportView(APIView):
             total_rev_player += rp
 
             by_equipment.append({
-                "club_equipment_id": str(row["club_equipment_id"]),
-                "equipment_name":    row["club_equipment__equipment__name"],   # ← add this
+                "club_equipment_id": equipment_id,
+                "equipment_name":    row["name"],
                 "quantity_by_owner":  qo,
                 "revenue_by_owner":   str(ro),
                 "quantity_by_player": qp,
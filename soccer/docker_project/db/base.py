@@ -18,9 +18,47 @@ class TransactionRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_high_water_mark(self, account: str = "default") -> str | None:
+        """
+        tx_id of the newest transaction a completed sync cycle of `account`
+        persisted — the fetcher pages back until it meets this id.
+        The default account falls back to the newest stored row;
+        None when nothing is known.
+        """
+        ...
+
+    @abstractmethod
+    def set_high_water_mark(self, tx_id: str, account: str = "default") -> None:
+        """
+        Advance the mark. Call only once every page of the cycle is saved,
+        otherwise an interrupted cycle would leave a gap behind the mark.
+        """
+        ...
+
+    def count_pending_payments(self, table: str, statuses: Sequence[int]) -> int:
+        """
+        Bookings waiting for a payment to show up (status in `statuses`,
+        today or later). Drives the adaptive poll interval; adapters whose
+        database has no bookings table keep this default.
+        """
+        return 0
+
+    def flush(self) -> int:
+        """
+        Write out anything held back by a write-behind buffer and return the
+        number of new rows. Unbuffered adapters write in save_many → 0.
+        """
+        return 0
+
     @abstractmethod
     def close(self) -> None: ...
 
+    @staticmethod
+    def _mark_key(account: str) -> str:
+        # "high_water_mark" for the default account keeps single-account state valid
+        return "high_water_mark" if account == "default" else f"high_water_mark:{account}"
+
     # ── context-manager support ──────────────────────────────────────────────
     def __enter__(self):
         return self
@@ -0,0 +1,156 @@
+"""
+db/benchmark.py
+───────────────
+save_many throughput for every adapter in db/, unbuffered and behind the
+write-behind buffer.
+
+    python -m db.benchmark [--rows 2000] [--batch 10]
+
+`--batch` is the page size one sync cycle hands save_many (SYNC_PAGE_SIZE),
+so the small default shows what incremental sync actually costs.
+
+Adapters
+────────
+sqlite     always — a throw-away file in the temp directory
+postgres   when BENCH_POSTGRES_URL (or a postgresql:// DATABASE_URL) is set;
+           writes to a scratch table that is dropped afterwards
+django     when DJANGO_SETTINGS_MODULE + DJANGO_APP_LABEL are set; the
+           benchmark rows (tx_id "bench-…") are deleted afterwards
+
+Unavailable adapters are reported as skipped, not failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable
+
+from db.base import TransactionRepository
+from db.buffered import BufferedTransactionRepository
+from models import Transaction
+
+_TABLE = "bench_transactions"
+
+
+def _rows(count: int, run_id: str) -> list[Transaction]:
+    start = datetime.combine(date.today(), datetime.min.time())
+    return [
+        Transaction(
+            tx_id     = f"bench-{run_id}-{i}",
+            name      = f"Benchmark sender {i % 50}",
+            date      = (start + timedelta(seconds=i)).date(),
+            time      = (start + timedelta(seconds=i)).time(),
+            amount    = Decimal(1000 + i % 500),
+            currency  = "SYP",
+            direction = "+",
+            notes     = "",
+        )
+        for i in range(count)
+    ]
+
+
+def _timed(repo: TransactionRepository, rows: list[Transaction], batch: int) -> tuple[float, int]:
+    started  = time.perf_counter()
+    inserted = 0
+    for i in range(0, len(rows), batch):
+        inserted += repo.save_many(rows[i:i + batch])
+    inserted += repo.flush()
+    return time.perf_counter() - started, inserted
+
+
+# ── adapters: each yields (repo factory, cleanup) or raises to skip ─────────────
+
+def _sqlite():
+    from db.sqlite_repo import SQLiteTransactionRepository
+    fd, path = tempfile.mkstemp(suffix=".sqlite3")
+    os.close(fd)
+
+    def cleanup():
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    return (lambda: SQLiteTransactionRepository(path, _TABLE)), cleanup
+
+
+def _postgres():
+    url = os.environ.get("BENCH_POSTGRES_URL") or os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql://", "postgres://")):
+        raise RuntimeError("set BENCH_POSTGRES_URL")
+    import psycopg2
+    from db.postgres_repo import PostgresTransactionRepository
+
+    def cleanup():
+        with psycopg2.connect(url) as conn, conn.cursor() as cur:
+            cur.execute(f'DROP TABLE IF EXISTS "{_TABLE}", "{_TABLE}_sync_state"')
+        conn.close()
+
+    return (lambda: PostgresTransactionRepository(url, _TABLE)), cleanup
+
+
+def _django():
+    app_label = os.environ.get("DJANGO_APP_LABEL")
+    if not (os.environ.get("DJANGO_SETTINGS_MODULE") and app_label):
+        raise RuntimeError("set DJANGO_SETTINGS_MODULE and DJANGO_APP_LABEL")
+    from db.django_repo import DjangoTransactionRepository
+    model_name = os.environ.get("DJANGO_MODEL_NAME", "Transaction")
+    repo = DjangoTransactionRepository(app_label, model_name)
+
+    def cleanup():
+        tx_field = repo._FIELD_MAP["tx_id"]
+        repo._Model.objects.filter(**{f"{tx_field}__startswith": "bench-"}).delete()
+
+    return (lambda: repo), cleanup
+
+
+_ADAPTERS: dict[str, Callable] = {
+    "sqlite":   _sqlite,
+    "postgres": _postgres,
+    "django":   _django,
+}
+
+
+def run(rows: int, batch: int, buffer_rows: int) -> None:
+    print(f"\nsave_many × {rows} rows in batches of {batch}  (buffer: {buffer_rows} rows)\n")
+    print(f"  {'adapter':<20}{'seconds':>10}{'rows/s':>12}{'inserted':>10}")
+    print(f"  {'─' * 52}")
+
+    for name, setup in _ADAPTERS.items():
+        try:
+            make_repo, cleanup = setup()
+        except Exception as exc:
+            print(f"  {name:<20}skipped — {exc}")
+            continue
+
+        try:
+            for label, wrap in (
+                (name, lambda r: r),
+                (f"{name}+buffer", lambda r: BufferedTransactionRepository(r, max_rows=buffer_rows, max_age_s=3600)),
+            ):
+                repo = wrap(make_repo())
+                elapsed, inserted = _timed(repo, _rows(rows, uuid.uuid4().hex[:8]), batch)
+                if name != "django":     # the Django adapter shares one instance
+                    repo.close()
+                print(f"  {label:<20}{elapsed:>10.3f}{rows / elapsed:>12.0f}{inserted:>10}")
+        finally:
+            cleanup()
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows",   type=int, default=2000)
+    parser.add_argument("--batch",  type=int, default=10)
+    parser.add_argument("--buffer", type=int, default=200, help="write-behind buffer size")
+    args = parser.parse_args()
+    run(args.rows, args.batch, args.buffer)
+
+
+if __name__ == "__main__":
+    main()
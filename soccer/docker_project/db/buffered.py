@@ -0,0 +1,95 @@
+"""
+db/buffered.py
+──────────────
+Write-behind buffer in front of any TransactionRepository.
+
+Incremental sync hands save_many a handful of rows per page (often 1–10),
+so each page is its own transaction. The buffer holds rows until
+
+  • max_rows are waiting, or
+  • the oldest buffered row is older than max_age_s,
+
+and then writes them through the wrapped repository as one batch.
+
+Ordering guarantees
+───────────────────
+flush() runs before every high-water-mark read / write and on close(), so
+the mark never points past a row still sitting in memory. A crash loses at
+most the un-flushed rows of the running cycle — the mark was not advanced,
+and the next cycle fetches them again.
+
+save_many returns the rows it actually inserted now; rows only buffered
+count 0 and are reported by the flush() that writes them.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Sequence
+
+from db.base import TransactionRepository
+from models import Transaction
+
+log = logging.getLogger(__name__)
+
+
+class BufferedTransactionRepository(TransactionRepository):
+
+    def __init__(
+        self,
+        inner:     TransactionRepository,
+        max_rows:  int = 200,
+        max_age_s: float = 5.0,
+    ) -> None:
+        self._inner     = inner
+        self._max_rows  = max_rows
+        self._max_age_s = max_age_s
+        self._pending: dict[str, Transaction] = {}   # tx_id → row, de-duplicated
+        self._oldest_at: float | None = None
+
+    # ── buffering ────────────────────────────────────────────────────────────
+
+    def save_many(self, transactions: Sequence[Transaction]) -> int:
+        if not transactions:
+            return 0
+        if self._oldest_at is None:
+            self._oldest_at = time.monotonic()
+        for tx in transactions:
+            self._pending.setdefault(tx.tx_id, tx)
+
+        if (
+            len(self._pending) >= self._max_rows
+            or time.monotonic() - self._oldest_at >= self._max_age_s
+        ):
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        if not self._pending:
+            return 0
+        batch = list(self._pending.values())
+        inserted = self._inner.save_many(batch)      # raises → rows stay buffered
+        self._pending.clear()
+        self._oldest_at = None
+        log.debug("Write buffer flushed %d rows (%d new)", len(batch), inserted)
+        return inserted
+
+    # ── pass-through (flush first so the mark never runs ahead) ──────────────
+
+    def get_high_water_mark(self, account: str = "default") -> str | None:
+        self.flush()
+        return self._inner.get_high_water_mark(account)
+
+    def set_high_water_mark(self, tx_id: str, account: str = "default") -> None:
+        self.flush()
+        self._inner.set_high_water_mark(tx_id, account)
+
+    def count_pending_payments(self, table: str, statuses: Sequence[int]) -> int:
+        return self._inner.count_pending_payments(table, statuses)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._inner.close()
@@ -82,6 +82,9 @@ class DjangoTransactionRepository(TransactionRepository):
         currency   CharField
         direction  CharField  ('+' or '-')
         notes      TextField
+
+    The sync high-water mark is kept outside the app's migrations, in a
+    small "<db_table>_sync_state" key/value table created on first use.
     """
 
     # Default field-name mapping  (override via env if your model uses different names)
@@ -99,12 +102,29 @@ class DjangoTransactionRepository(TransactionRepository):
     def __init__(self, app_label: str, model_name: str) -> None:
         _setup_django()
         self._Model = _get_model(app_label, model_name)
+        self._state_table = f"{self._Model._meta.db_table}_sync_state"
+        self._ensure_state_table()
         log.info(
             "DjangoTransactionRepository ready → %s.%s  (table: %s)",
             app_label, model_name,
             self._Model._meta.db_table,
         )
 
+    def _ensure_state_table(self) -> None:
+        from django.db import connection      # noqa: PLC0415
+        try:
+            with connection.cursor() as cur:
+                cur.execute(f"""
+                    CREATE TABLE IF NOT EXISTS "{self._state_table}" (
+                        key   VARCHAR(50) NOT NULL PRIMARY KEY,
+                        value VARCHAR(50) NOT NULL
+                    )
+                """)
+        except Exception as exc:
+            raise DatabaseError(
+                f"Cannot create {self._state_table}: {exc}"
+            ) from exc
+
     # ── repository interface ──────────────────────────────────────────────────
 
     def save_many(self, transactions: Sequence[ScraperTransaction]) -> int:
@@ -139,5 +159,57 @@ class DjangoTransactionRepository(TransactionRepository):
                 f"bulk_create failed on {self._Model._meta.db_table}: {exc}"
             ) from exc
 
+    def get_high_water_mark(self, account: str = "default") -> str | None:
+        from django.db import connection      # noqa: PLC0415
+        try:
+            with connection.cursor() as cur:
+                cur.execute(
+                    f'SELECT value FROM "{self._state_table}" WHERE key = %s',
+                    [self._mark_key(account)],
+                )
+                row = cur.fetchone()
+            if row is not None or account != "default":
+                return row[0] if row else None
+
+            fm = self._FIELD_MAP
+            return (
+                self._Model.objects
+                .order_by(f"-{fm['date']}", f"-{fm['time']}")
+                .values_list(fm["tx_id"], flat=True)
+                .first()
+            )
+        except Exception as exc:
+            raise DatabaseError(f"Reading the high-water mark failed: {exc}") from exc
+
+    def set_high_water_mark(self, tx_id: str, account: str = "default") -> None:
+        from django.db import connection      # noqa: PLC0415
+        try:
+            with connection.cursor() as cur:
+                cur.execute(
+                    f"""
+                    INSERT INTO "{self._state_table}" (key, value) VALUES (%s, %s)
+                    ON CONFLICT (key) DO UPDATE SET value = excluded.value
+                    """,
+                    [self._mark_key(account), tx_id],
+                )
+        except Exception as exc:
+            raise DatabaseError(f"Saving the high-water mark failed: {exc}") from exc
+
+    def count_pending_payments(self, table: str, statuses: Sequence[int]) -> int:
+        from django.db import connection      # noqa: PLC0415
+        from django.utils import timezone     # noqa: PLC0415
+        if not statuses:
+            return 0
+        marks = ", ".join(["%s"] * len(statuses))
+        try:
+            with connection.cursor() as cur:
+                cur.execute(
+                    f'SELECT COUNT(*) FROM "{table}" WHERE status IN ({marks}) AND date >= %s',
+                    [*statuses, timezone.localdate()],
+                )
+                return cur.fetchone()[0]
+        except Exception as exc:
+            raise DatabaseError(f"Counting pending payments failed: {exc}") from exc
+
     def close(self) -> None:
         pass   # Django manages its own connection pool
\ No newline at end of file
@@ -17,6 +17,15 @@ Priority
         Raw sqlite3 writes to the path in DATABASE_URL.
         Requires: DATABASE_URL  (e.g. sqlite:///data/db.sqlite3 or a plain path)
 
+Write tuning (optional)
+───────────────────────
+WRITE_BUFFER_ROWS     rows held by the write-behind buffer before a flush
+                      (default 200, 0 disables — see db/buffered.py)
+WRITE_BUFFER_AGE      seconds a buffered row may wait (default 5)
+DB_POOL_MIN/MAX       PostgreSQL connection pool bounds (default 1 / 4)
+DB_RETRIES            attempts on connection loss / "database is locked" (default 5 / 3)
+SQLITE_BUSY_TIMEOUT   ms a SQLite writer waits for the lock (default 5000)
+
 Raises
 ──────
 DatabaseError  if required env vars are missing or the connection fails
@@ -33,11 +42,28 @@ from exceptions import DatabaseError
 
 def create_repository(database_url: str, db_table: str) -> TransactionRepository:
     """
-    Return the appropriate repository instance.
+    Return the appropriate repository instance, behind the write-behind
+    buffer unless WRITE_BUFFER_ROWS=0.
 
     Call inside  `with create_repository(...) as repo:`
     so .close() is always called.
     """
+    repo = create_backend(database_url, db_table)
+
+    buffer_rows = int(os.environ.get("WRITE_BUFFER_ROWS", "200"))
+    if buffer_rows <= 0:
+        return repo
+
+    from db.buffered import BufferedTransactionRepository
+    return BufferedTransactionRepository(
+        repo,
+        max_rows  = buffer_rows,
+        max_age_s = float(os.environ.get("WRITE_BUFFER_AGE", "5")),
+    )
+
+
+def create_backend(database_url: str, db_table: str) -> TransactionRepository:
+    """The bare adapter for DATABASE_URL / DJANGO_SETTINGS_MODULE, unbuffered."""
     # ── 1. Django ORM ─────────────────────────────────────────────────────────
     if os.environ.get("DJANGO_SETTINGS_MODULE"):
         app_label  = os.environ.get("DJANGO_APP_LABEL")
@@ -55,7 +81,13 @@ def create_repository(database_url: str, db_table: str) -> TransactionRepository
     # ── 2. PostgreSQL ─────────────────────────────────────────────────────────
     if database_url.startswith("postgresql://") or database_url.startswith("postgres://"):
         from db.postgres_repo import PostgresTransactionRepository
-        return PostgresTransactionRepository(database_url, db_table)
+        return PostgresTransactionRepository(
+            database_url,
+            db_table,
+            min_conn = int(os.environ.get("DB_POOL_MIN", "1")),
+            max_conn = int(os.environ.get("DB_POOL_MAX", "4")),
+            retries  = int(os.environ.get("DB_RETRIES",  "5")),
+        )
 
     # ── 3. SQLite (default) ───────────────────────────────────────────────────
     # Accept both  sqlite:///path/to/db.sqlite3  and  a plain file path
@@ -65,7 +97,12 @@ def create_repository(database_url: str, db_table: str) -> TransactionRepository
         .removeprefix("sqlite://")
     )
     from db.sqlite_repo import SQLiteTransactionRepository
-    return SQLiteTransactionRepository(db_path, db_table)
+    return SQLiteTransactionRepository(
+        db_path,
+        db_table,
+        busy_timeout_ms = int(os.environ.get("SQLITE_BUSY_TIMEOUT", "5000")),
+        retries         = int(os.environ.get("DB_RETRIES", "3")),
+    )
 
 
 @contextmanager
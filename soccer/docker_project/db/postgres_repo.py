@@ -1,11 +1,22 @@
+import logging
+import time
+from contextlib import contextmanager
 from typing import Sequence
 
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
+import psycopg2.pool
 
 from db.base import TransactionRepository
+from exceptions import DatabaseError
 from models import Transaction
 
+log = logging.getLogger(__name__)
+
+# Connection-level failures worth a reconnect (server restart, network blip)
+_RECONNECT_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
 
 class PostgresTransactionRepository(TransactionRepository):
     """
@@ -15,17 +26,72 @@ class PostgresTransactionRepository(TransactionRepository):
     • RETURNING tx_id lets us count exactly how many rows were new.
     • execute_values batches the whole list in a single round-trip.
     • Column types match what Django's PostgreSQL backend generates exactly.
+    • The sync high-water mark lives in "<table>_sync_state".
+    • Connections come from a ThreadedConnectionPool. A broken connection is
+      discarded and the unit of work retried on a fresh one (exponential
+      back-off), so a database restart costs a few seconds, not the loop.
     """
 
-    def __init__(self, dsn: str, table: str) -> None:
-        self._conn  = psycopg2.connect(dsn)
-        self._table = table
+    def __init__(
+        self,
+        dsn:       str,
+        table:     str,
+        min_conn:  int = 1,
+        max_conn:  int = 4,
+        retries:   int = 5,
+        backoff_s: float = 0.5,
+    ) -> None:
+        self._dsn         = dsn
+        self._table       = table
+        self._state_table = f"{table}_sync_state"
+        self._retries     = retries
+        self._backoff_s   = backoff_s
+        try:
+            self._pool = psycopg2.pool.ThreadedConnectionPool(min_conn, max_conn, dsn)
+        except _RECONNECT_ERRORS as exc:
+            raise DatabaseError(f"Cannot connect to PostgreSQL: {exc}") from exc
         self._ensure_table()
 
+    # ── connection handling ──────────────────────────────────────────────────
+
+    @contextmanager
+    def _cursor(self):
+        """One transaction on a pooled connection — commit on success."""
+        conn = self._pool.getconn()
+        broken = False
+        try:
+            with conn.cursor() as cur:
+                yield cur
+            conn.commit()
+        except _RECONNECT_ERRORS:
+            broken = True
+            raise
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._pool.putconn(conn, close=broken or conn.closed != 0)
+
+    def _run(self, work):
+        """Run work(cursor) in its own transaction, retrying on connection loss."""
+        delay = self._backoff_s
+        for attempt in range(1, self._retries + 1):
+            try:
+                with self._cursor() as cur:
+                    return work(cur)
+            except _RECONNECT_ERRORS as exc:
+                if attempt == self._retries:
+                    raise DatabaseError(
+                        f"PostgreSQL unreachable after {attempt} attempts: {exc}"
+                    ) from exc
+                log.warning("PostgreSQL connection lost (%s) — retry %d in %.1fs", exc, attempt, delay)
+                time.sleep(delay)
+                delay *= 2
+
     # ── schema bootstrap ─────────────────────────────────────────────────────
 
     def _ensure_table(self) -> None:
-        with self._conn.cursor() as cur:
+        def work(cur):
             cur.execute(f"""
                 CREATE TABLE IF NOT EXISTS "{self._table}" (
                     tx_id      VARCHAR(50)     NOT NULL PRIMARY KEY,
@@ -39,7 +105,13 @@ class PostgresTransactionRepository(TransactionRepository):
                     scraped_at TIMESTAMPTZ     NOT NULL DEFAULT NOW()
                 )
             """)
-        self._conn.commit()
+            cur.execute(f"""
+                CREATE TABLE IF NOT EXISTS "{self._state_table}" (
+                    key   VARCHAR(50)  NOT NULL PRIMARY KEY,
+                    value VARCHAR(50)  NOT NULL
+                )
+            """)
+        self._run(work)
 
     # ── repository interface ─────────────────────────────────────────────────
 
@@ -61,8 +133,9 @@ class PostgresTransactionRepository(TransactionRepository):
             for tx in transactions
         ]
 
-        with self._conn.cursor() as cur:
-            psycopg2.extras.execute_values(
+        def work(cur):
+            # fetch=True collects RETURNING across every page of execute_values
+            inserted = psycopg2.extras.execute_values(
                 cur,
                 f"""
                 INSERT INTO "{self._table}"
@@ -72,11 +145,55 @@ class PostgresTransactionRepository(TransactionRepository):
                 RETURNING tx_id
                 """,
                 rows,
+                page_size=1000,
+                fetch=True,
+            )
+            return len(inserted)
+
+        return self._run(work)
+
+    def get_high_water_mark(self, account: str = "default") -> str | None:
+        def work(cur):
+            cur.execute(
+                f'SELECT value FROM "{self._state_table}" WHERE key = %s',
+                (self._mark_key(account),),
             )
-            inserted = len(cur.fetchall())
+            row = cur.fetchone()
+            if row is None and account == "default":
+                cur.execute(
+                    f'SELECT tx_id FROM "{self._table}" ORDER BY date DESC, time DESC LIMIT 1'
+                )
+                row = cur.fetchone()
+            return row[0] if row else None
+
+        return self._run(work)
+
+    def set_high_water_mark(self, tx_id: str, account: str = "default") -> None:
+        def work(cur):
+            cur.execute(
+                f"""
+                INSERT INTO "{self._state_table}" (key, value) VALUES (%s, %s)
+                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
+                """,
+                (self._mark_key(account), tx_id),
+            )
+        self._run(work)
 
-        self._conn.commit()
-        return inserted
+    def count_pending_payments(self, table: str, statuses: Sequence[int]) -> int:
+        if not statuses:
+            return 0
+
+        def work(cur):
+            cur.execute(
+                f'SELECT COUNT(*) FROM "{table}" WHERE status = ANY(%s) AND date >= CURRENT_DATE',
+                (list(statuses),),
+            )
+            return cur.fetchone()[0]
+
+        try:
+            return self._run(work)
+        except psycopg2.errors.UndefinedTable:  # standalone DB — no bookings table
+            return 0
 
     def close(self) -> None:
-        self._conn.close()
+        self._pool.closeall()
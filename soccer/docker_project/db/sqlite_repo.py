@@ -1,9 +1,14 @@
+import logging
 import sqlite3
+import time
 from typing import Sequence
 
 from db.base import TransactionRepository
+from exceptions import DatabaseError
 from models import Transaction
 
+log = logging.getLogger(__name__)
+
 
 class SQLiteTransactionRepository(TransactionRepository):
     """
@@ -14,13 +19,50 @@ class SQLiteTransactionRepository(TransactionRepository):
       first running Django migrations), while still being harmless when the
       Django-managed table already exists.
     • Column types mirror what Django's SQLite backend generates.
+    • The sync high-water mark lives in "<table>_sync_state".
+    • WAL journal: the Django app keeps reading the same file while the
+      scraper writes. busy_timeout makes a writer wait for the lock instead
+      of failing at once; a write still "locked" after that is retried.
     """
 
-    def __init__(self, db_path: str, table: str) -> None:
-        self._conn  = sqlite3.connect(db_path, check_same_thread=False)
-        self._table = table
+    def __init__(
+        self,
+        db_path:         str,
+        table:           str,
+        busy_timeout_ms: int = 5_000,
+        retries:         int = 3,
+    ) -> None:
+        self._conn        = sqlite3.connect(
+            db_path, check_same_thread=False, timeout=busy_timeout_ms / 1000,
+        )
+        self._table       = table
+        self._state_table = f"{table}_sync_state"
+        self._retries     = retries
+        self._configure(busy_timeout_ms)
         self._ensure_table()
 
+    # ── connection setup ─────────────────────────────────────────────────────
+
+    def _configure(self, busy_timeout_ms: int) -> None:
+        mode = self._conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if mode.lower() != "wal":
+            log.warning("SQLite journal_mode is %s (WAL unavailable on this filesystem?)", mode)
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA synchronous=NORMAL")     # durable enough with WAL, far fewer fsyncs
+
+    def _write(self, sql: str, params, many: bool = False) -> int:
+        """Execute + commit, retrying while another process holds the write lock."""
+        for attempt in range(1, self._retries + 1):
+            try:
+                with self._conn:                              # commit / rollback
+                    cursor = (self._conn.executemany if many else self._conn.execute)(sql, params)
+                return cursor.rowcount
+            except sqlite3.OperationalError as exc:
+                if "locked" not in str(exc) or attempt == self._retries:
+                    raise DatabaseError(f"SQLite write failed: {exc}") from exc
+                log.warning("SQLite busy — retry %d", attempt)
+                time.sleep(0.2 * attempt)
+
     # ── schema bootstrap ─────────────────────────────────────────────────────
 
     def _ensure_table(self) -> None:
@@ -37,6 +79,12 @@ class SQLiteTransactionRepository(TransactionRepository):
                 scraped_at TEXT        NOT NULL DEFAULT (datetime('now'))
             )
         """)
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS "{self._state_table}" (
+                key   TEXT NOT NULL PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
         self._conn.commit()
 
     # ── repository interface ─────────────────────────────────────────────────
@@ -59,7 +107,7 @@ class SQLiteTransactionRepository(TransactionRepository):
             for tx in transactions
         ]
 
-        cursor = self._conn.executemany(
+        return self._write(
             f"""
             INSERT OR IGNORE INTO "{self._table}"
                 (tx_id, name, date, time, amount, currency, direction, notes)
@@ -67,9 +115,41 @@ class SQLiteTransactionRepository(TransactionRepository):
                 (?, ?, ?, ?, ?, ?, ?, ?)
             """,
             rows,
+            many=True,
+        )  # rows actually inserted (skips are excluded)
+
+    def get_high_water_mark(self, account: str = "default") -> str | None:
+        row = self._conn.execute(
+            f'SELECT value FROM "{self._state_table}" WHERE key = ?',
+            (self._mark_key(account),),
+        ).fetchone()
+        if row is None and account == "default":
+            row = self._conn.execute(
+                f'SELECT tx_id FROM "{self._table}" ORDER BY date DESC, time DESC LIMIT 1'
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_high_water_mark(self, tx_id: str, account: str = "default") -> None:
+        self._write(
+            f"""
+            INSERT INTO "{self._state_table}" (key, value) VALUES (?, ?)
+            ON CONFLICT (key) DO UPDATE SET value = excluded.value
+            """,
+            (self._mark_key(account), tx_id),
         )
-        self._conn.commit()
-        return cursor.rowcount  # rows actually inserted (skips are excluded)
+
+    def count_pending_payments(self, table: str, statuses: Sequence[int]) -> int:
+        if not statuses:
+            return 0
+        marks = ", ".join("?" * len(statuses))
+        try:
+            row = self._conn.execute(
+                f'SELECT COUNT(*) FROM "{table}" WHERE status IN ({marks}) AND date >= date(\'now\')',
+                tuple(statuses),
+            ).fetchone()
+        except sqlite3.OperationalError:       # standalone DB — no bookings table
+            return 0
+        return row[0]
 
     def close(self) -> None:
         self._conn.close()
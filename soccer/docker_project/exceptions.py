@@ -23,6 +23,14 @@ class SessionExpiredError(ShamCashError):
     """
 
 
+class CookiesRejectedError(ShamCashError):
+    """
+    The HTTP fast path got 401 with the exported browser cookies.
+    Not a session expiry yet — the browser (which can refresh its tokens)
+    retries, and only a 401 there raises SessionExpiredError.
+    """
+
+
 class AuthenticationError(ShamCashError):
     """General failure to authenticate (wrong URL, network error on login, etc.)."""
 
@@ -33,6 +41,14 @@ class ScrapingError(ShamCashError):
     """Raised when all fetch strategies fail to return any data."""
 
 
+class MarkNotReachedError(ShamCashError):
+    """
+    A sync cycle stopped before meeting the high-water mark — SYNC_MAX_PAGES
+    ran out, or only a single-page fallback strategy worked. The batches it
+    yielded are valid, but the mark must not advance over the unread gap.
+    """
+
+
 class ParseError(ShamCashError):
     """A transaction row could not be parsed into a valid Transaction object."""
 
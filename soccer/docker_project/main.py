@@ -14,6 +14,21 @@ LOGIN FLOW
   expires       (The 2-minute access token is refreshed by the site's own
                  refresh logic; we only re-scan when the full session dies.)
 
+POLLING
+───────
+The interval adapts (scheduler.py): MIN while payments are arriving or
+PAY / CHECK_PAY bookings are waiting, exponential back-off up to MAX when
+idle or on ScrapingError, with jitter. Cycle latency and rows per cycle
+are logged and written to METRICS_FILE.
+
+ACCOUNTS
+────────
+ACCOUNTS="main=data/shamcash_session.json,club2=data/club2_session.json"
+runs every account in this one event loop: one shared Chromium with an
+isolated context per account, one shared repository, and per-account
+poll schedule, failure counter, high-water mark and metrics. Without
+ACCOUNTS a single "default" account uses SESSION_FILE.
+
 KEY FIX in v6
 ─────────────
 myProfile / settings always return 401 — even in a valid session.
@@ -24,23 +39,26 @@ v6 only treats 401 on Transaction/history-logs as session-expiry.
 import asyncio
 import logging
 import os
+import time
 from datetime import datetime
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from config import load_config
+from config import AccountConfig, load_config
 from db import create_repository
 from exceptions import (
     AuthenticationError,
     DatabaseError,
     LoginTimeoutError,
+    MarkNotReachedError,
     ParseError,
     ScrapingError,
     SessionExpiredError,
 )
 from models import Transaction
-from scraper import BrowserSession, fetch_transactions
+from scheduler import AdaptiveScheduler, PollMetrics
+from scraper import BrowserPool, BrowserSession, HistoryLogsClient, stream_transactions
 
 logging.basicConfig(
     level  = logging.INFO,
@@ -63,105 +81,206 @@ def _fmt(tx: Transaction) -> str:
     )
 
 
-def _print_batch(transactions: list[Transaction], new_count: int) -> None:
+def _print_batch(account: str, transactions: list[Transaction], new_count: int) -> None:
     now = datetime.now().strftime("%H:%M:%S")
     print(f"\n{'═' * 80}")
-    print(f"  {len(transactions)} transaction(s)  │  {new_count} new  │  {now}")
+    print(f"  [{account}]  {len(transactions)} transaction(s)  │  {new_count} new  │  {now}")
     print(f"{'═' * 80}")
     for tx in transactions:
         print(_fmt(tx))
     print(f"{'═' * 80}\n")
 
 
+async def _sync_once(
+    account: AccountConfig, session: BrowserSession, http: HistoryLogsClient | None, repo, cfg, tx_url: str,
+) -> tuple[int, int]:
+    """
+    One incremental cycle: stream every page newer than the account's
+    high-water mark into save_many, then advance the mark — unless the
+    stream stopped short of it (MarkNotReachedError): the rows saved are
+    kept, the old mark stays, and the next cycle walks down to it again.
+    Returns (fetched, inserted).
+    """
+    high_water_mark = repo.get_high_water_mark(account.name)
+    newest = None
+    fetched = inserted = 0
+
+    # Raises SessionExpiredError if history-logs → 401
+    try:
+        async for batch in stream_transactions(
+            session.page, tx_url, high_water_mark,
+            page_size=cfg.sync_page_size, max_pages=cfg.sync_max_pages, http=http,
+        ):
+            if newest is None:
+                newest = batch[0].tx_id      # pages arrive newest first
+            new_count = repo.save_many(batch)
+            fetched  += len(batch)
+            inserted += new_count
+            _print_batch(account.name, batch, new_count)
+    except MarkNotReachedError as exc:
+        # Advancing would skip every transaction between the last page read and the old mark
+        log.warning("[%s] %s — keeping the high-water mark", account.name, exc)
+        newest = None
+
+    # Only now is everything between the old and the new mark persisted
+    inserted += repo.flush()                 # write-behind buffer, if any
+    if newest is not None:
+        repo.set_high_water_mark(newest, account.name)
+    return fetched, inserted
+
+
 async def main() -> None:
     cfg       = load_config()
     login_url = f"{cfg.base_url}/ar/auth/login"
     tx_url    = f"{cfg.base_url}/ar/application/transaction"
 
-    async with BrowserSession(cfg.session_file, cfg.base_url) as session:
-        await _run(session, cfg, login_url, tx_url)
-
+    # ── database (one repository shared by every account) ────────────────────
+    try:
+        repo = create_repository(cfg.database_url, cfg.db_table)
+    except DatabaseError as exc:
+        log.critical("DB init failed: %s", exc)
+        print(f"\n[✗] Database error: {exc}\n")
+        return
 
-async def _run(session: BrowserSession, cfg, login_url: str, tx_url: str) -> None:
+    # ── one Chromium, one isolated context per account ───────────────────────
+    with repo:
+        async with BrowserPool() as pool:
+            print(f"[→] {len(cfg.accounts)} account(s): {', '.join(a.name for a in cfg.accounts)}\n")
+            await asyncio.gather(*(
+                _run_account(account, pool, repo, cfg, login_url, tx_url)
+                for account in cfg.accounts
+            ))
+
+
+async def _run_account(
+    account: AccountConfig, pool: BrowserPool, repo, cfg, login_url: str, tx_url: str,
+) -> None:
+    """One account's lifetime — returning never stops the other accounts."""
+    async with pool.session(account.session_file, cfg.base_url, label=account.name) as session, \
+               HistoryLogsClient(cfg.base_url) as http:
+        try:
+            await _run(account, session, http if cfg.http_fast_path else None, repo, cfg, login_url, tx_url)
+        except Exception as exc:
+            log.exception("[%s] worker crashed: %s", account.name, exc)
+            print(f"[✗] [{account.name}] stopped: {exc!r}")
+
+
+async def _load_http_cookies(session: BrowserSession, http: HistoryLogsClient | None) -> None:
+    if http is None:
+        return
+    try:
+        http.load_cookies(*await session.export_cookies())
+    except Exception as exc:
+        log.warning("Cookie export failed — polling through the browser: %s", exc)
+
+
+async def _run(
+    account: AccountConfig,
+    session: BrowserSession,
+    http: HistoryLogsClient | None,
+    repo,
+    cfg,
+    login_url: str,
+    tx_url: str,
+) -> None:
+    name = account.name
 
     # ── initial login / session restore ──────────────────────────────────────
     try:
         await session.ensure_logged_in(login_url, tx_url)
     except AuthenticationError as exc:
-        log.critical("Cannot reach site: %s", exc)
-        print(f"\n[✗] {exc}\n    Check BASE_URL and network.\n")
+        log.critical("[%s] Cannot reach site: %s", name, exc)
+        print(f"\n[✗] [{name}] {exc}\n    Check BASE_URL and network.\n")
         return
     except LoginTimeoutError:
-        print("\n[✗] QR scan timed out. Restart and try again.\n")
+        print(f"\n[✗] [{name}] QR scan timed out. Restart and try again.\n")
         return
+    await _load_http_cookies(session, http)
+
+    # Per-account schedule and counters
+    scheduler = AdaptiveScheduler(
+        base_interval = cfg.poll_interval,
+        min_interval  = cfg.poll_min_interval,
+        max_interval  = cfg.poll_max_interval,
+        jitter        = cfg.poll_jitter,
+    )
+    metrics = PollMetrics(metrics_file=account.metrics_file)
 
-    # ── database ──────────────────────────────────────────────────────────────
-    try:
-        repo = create_repository(cfg.database_url, cfg.db_table)
-    except DatabaseError as exc:
-        log.critical("DB init failed: %s", exc)
-        print(f"\n[✗] Database error: {exc}\n")
-        return
+    print(
+        f"[→] [{name}] Polling every {cfg.poll_min_interval}–{cfg.poll_max_interval}s "
+        f"(base {cfg.poll_interval}s, adaptive)  (Ctrl+C to stop)\n"
+    )
+    scrape_failures = 0
+
+    while True:
+        delay = scheduler.interval
+        pending = 0
+        try:
+            # Fetch + save page by page; the mark is left untouched on
+            # failure, so the next cycle re-walks the same range
+            try:
+                started = time.monotonic()
+                fetched, inserted = await _sync_once(account, session, http, repo, cfg, tx_url)
+                metrics.record(time.monotonic() - started, fetched, inserted)
+                scrape_failures = 0
 
-    with repo:
-        print(f"[→] Polling every {cfg.poll_interval}s  (Ctrl+C to stop)\n")
-        scrape_failures = 0
+                pending = repo.count_pending_payments(
+                    cfg.pending_bookings_table, cfg.pending_booking_statuses,
+                )
+                delay = scheduler.on_success(inserted, pending)
+                metrics.publish(delay, pending)
+            except DatabaseError as exc:
+                log.error("[%s] DB write failed (retry next cycle): %s", name, exc)
+                print(f"[!] [{name}] DB error: {exc}")
+
+            # Belt-and-suspenders URL check
+            await session.relogin_if_needed(login_url)
 
-        while True:
+        except SessionExpiredError:
+            print(f"\n[!] [{name}] Session expired — please scan the QR code again.\n")
             try:
-                # Fetch — raises SessionExpiredError if history-logs → 401
-                transactions = await fetch_transactions(session.page, tx_url)
+                await session.handle_relogin(login_url)
+                await _load_http_cookies(session, http)
                 scrape_failures = 0
-
-                # Belt-and-suspenders URL check
-                await session.relogin_if_needed(login_url)
-
-                # Save to DB
-                try:
-                    new_count = repo.save_many(transactions)
-                    _print_batch(transactions, new_count)
-                except DatabaseError as exc:
-                    log.error("DB write failed (retry next cycle): %s", exc)
-                    print(f"[!] DB error: {exc}")
-
-            except SessionExpiredError:
-                print("\n[!] Session expired — please scan the QR code again.\n")
-                try:
-                    await session.handle_relogin(login_url)
-                    scrape_failures = 0
-                except LoginTimeoutError:
-                    print("[!] Re-login timed out — will retry next cycle.")
-                except AuthenticationError as exc:
-                    log.error("Re-login failed: %s", exc)
-                    print(f"[!] {exc}  — retrying in 30 s")
-                    await asyncio.sleep(30)
-
-            except ScrapingError as exc:
-                scrape_failures += 1
-                print(f"[!] Scrape failed ({scrape_failures}/{_MAX_SCRAPE_FAILURES}): {exc}")
-                if scrape_failures >= _MAX_SCRAPE_FAILURES:
-                    log.critical("Too many consecutive scrape failures — stopping")
-                    print(
-                        f"\n[✗] Scraping failed {_MAX_SCRAPE_FAILURES} times in a row.\n"
-                        "    Page structure may have changed.\n"
-                    )
-                    return
-
-            except ParseError as exc:
-                log.warning("Parse error (row skipped): %s", exc)
-                print(f"[~] Parse warning: {exc}")
-
-            except KeyboardInterrupt:
-                print("\n[→] Stopped by user.")
+                delay = scheduler.reset()
+            except LoginTimeoutError:
+                print(f"[!] [{name}] Re-login timed out — will retry next cycle.")
+            except AuthenticationError as exc:
+                log.error("[%s] Re-login failed: %s", name, exc)
+                print(f"[!] [{name}] {exc}  — retrying in 30 s")
+                await asyncio.sleep(30)
+
+        except ScrapingError as exc:
+            scrape_failures += 1
+            metrics.record_failure()
+            delay = scheduler.on_failure()
+            print(
+                f"[!] [{name}] Scrape failed ({scrape_failures}/{_MAX_SCRAPE_FAILURES}): {exc}"
+                f"  — backing off {delay:.0f}s"
+            )
+            if scrape_failures >= _MAX_SCRAPE_FAILURES:
+                log.critical("[%s] Too many consecutive scrape failures — stopping", name)
+                print(
+                    f"\n[✗] [{name}] Scraping failed {_MAX_SCRAPE_FAILURES} times in a row.\n"
+                    "    Page structure may have changed.\n"
+                )
                 return
 
-            except Exception as exc:
-                log.exception("Unexpected error: %s", exc)
-                print(f"[!] Unexpected error: {exc!r}  — retrying in 10 s")
-                await asyncio.sleep(10)
-                continue
+        except ParseError as exc:
+            log.warning("[%s] Parse error (row skipped): %s", name, exc)
+            print(f"[~] [{name}] Parse warning: {exc}")
+
+        except KeyboardInterrupt:
+            print("\n[→] Stopped by user.")
+            return
+
+        except Exception as exc:
+            log.exception("[%s] Unexpected error: %s", name, exc)
+            print(f"[!] [{name}] Unexpected error: {exc!r}  — retrying in 10 s")
+            await asyncio.sleep(10)
+            continue
 
-            await asyncio.sleep(cfg.poll_interval)
+        await asyncio.sleep(delay)
 
 
 if __name__ == "__main__":
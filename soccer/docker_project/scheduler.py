@@ -0,0 +1,148 @@
+"""
+scheduler.py
+────────────
+Adaptive poll interval for the main loop.
+
+  new rows this cycle, or bookings waiting for payment  →  MIN interval
+  nothing happening                                     →  base × 2^(idle cycles), up to MAX
+  ScrapingError                                         →  base × 2^(failures),    up to MAX
+
+Every delay gets ±JITTER so several scrapers (or restarts) never poll in
+lock-step, and is then clamped to [MIN, MAX].
+
+PollMetrics keeps the last few cycles for the "cycle latency" and
+"rows per cycle" figures — logged every cycle and, when METRICS_FILE is
+set, written there as JSON for dashboards / health checks.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import statistics
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+
+log = logging.getLogger(__name__)
+
+
+class AdaptiveScheduler:
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval:  float,
+        max_interval:  float,
+        jitter:        float = 0.2,
+        backoff:       float = 2.0,
+    ) -> None:
+        self.base_interval = base_interval
+        self.min_interval  = min_interval
+        self.max_interval  = max_interval
+        self.jitter        = jitter
+        self.backoff       = backoff
+
+        self._idle_cycles = 0
+        self._failures    = 0
+        self.interval     = base_interval   # un-jittered value of the last decision
+
+    # ── decisions ─────────────────────────────────────────────────────────────
+
+    def on_success(self, inserted: int, pending_payments: int) -> float:
+        self._failures = 0
+        if inserted or pending_payments:
+            self._idle_cycles = 0
+            self.interval = self.min_interval
+        else:
+            self.interval = self._backed_off(self._idle_cycles)
+            self._idle_cycles += 1
+        return self._jittered()
+
+    def on_failure(self) -> float:
+        self._failures += 1
+        self.interval = self._backed_off(self._failures)
+        return self._jittered()
+
+    def reset(self) -> float:
+        """After a re-login — poll again soon, from the base interval."""
+        self._idle_cycles = self._failures = 0
+        self.interval = self.base_interval
+        return self._jittered()
+
+    # ── helpers ───────────────────────────────────────────────────────────────
+
+    def _backed_off(self, steps: int) -> float:
+        return min(self.base_interval * self.backoff ** steps, self.max_interval)
+
+    def _jittered(self) -> float:
+        spread = self.interval * self.jitter
+        delay  = self.interval + random.uniform(-spread, spread)
+        return max(self.min_interval, min(delay, self.max_interval))
+
+
+@dataclass(frozen=True)
+class CycleSample:
+    latency_s: float
+    fetched:   int
+    inserted:  int
+
+
+class PollMetrics:
+
+    def __init__(self, window: int = 60, metrics_file: str = "") -> None:
+        self._samples: deque[CycleSample] = deque(maxlen=window)
+        self._metrics_file = metrics_file
+        self.cycles   = 0
+        self.inserted = 0
+        self.failures = 0
+
+    def record(self, latency_s: float, fetched: int, inserted: int) -> None:
+        self._samples.append(CycleSample(latency_s, fetched, inserted))
+        self.cycles   += 1
+        self.inserted += inserted
+
+    def record_failure(self) -> None:
+        self.failures += 1
+
+    def snapshot(self, next_delay_s: float, pending_payments: int) -> dict:
+        latencies = sorted(s.latency_s for s in self._samples)
+        rows      = [s.inserted for s in self._samples]
+        return {
+            "cycles":            self.cycles,
+            "failures":          self.failures,
+            "inserted_total":    self.inserted,
+            "latency_p50_s":     round(_percentile(latencies, 50), 3),
+            "latency_p95_s":     round(_percentile(latencies, 95), 3),
+            "rows_per_cycle":    round(statistics.fmean(rows), 2) if rows else 0.0,
+            "pending_payments":  pending_payments,
+            "next_delay_s":      round(next_delay_s, 1),
+            "last_cycle":        asdict(self._samples[-1]) if self._samples else None,
+            "updated_at":        time.time(),
+        }
+
+    def publish(self, next_delay_s: float, pending_payments: int) -> None:
+        snap = self.snapshot(next_delay_s, pending_payments)
+        log.info(
+            "Cycle metrics → p50 %.2fs  p95 %.2fs  rows/cycle %.2f  pending %d  next in %.1fs",
+            snap["latency_p50_s"], snap["latency_p95_s"], snap["rows_per_cycle"],
+            pending_payments, next_delay_s,
+        )
+        if not self._metrics_file:
+            return
+        tmp = f"{self._metrics_file}.tmp"
+        try:
+            with open(tmp, "w") as fh:
+                json.dump(snap, fh)
+            os.replace(tmp, self._metrics_file)      # readers never see half a file
+        except OSError as exc:
+            log.warning("Cannot write %s: %s", self._metrics_file, exc)
+
+
+def _percentile(sorted_values: list[float], pct: int) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
@@ -1,4 +1,5 @@
-from scraper.browser import BrowserSession
-from scraper.fetcher import fetch_transactions
+from scraper.browser import BrowserPool, BrowserSession
+from scraper.fetcher import fetch_transactions, stream_transactions
+from scraper.http_client import HistoryLogsClient
 
-__all__ = ["BrowserSession", "fetch_transactions"]
+__all__ = ["BrowserPool", "BrowserSession", "HistoryLogsClient", "fetch_transactions", "stream_transactions"]
@@ -30,6 +30,12 @@ BUGS FIXED vs v6
   Bug 4  Session could be saved without verifying it works
          → session saved only after a confirmed-successful signal.
 
+MULTI-ACCOUNT
+─────────────
+BrowserPool launches Chromium once; BrowserPool.session() hands out
+BrowserSessions that each own an isolated context on that browser.
+A standalone BrowserSession (no pool) still launches its own browser.
+
 NOTE: myProfile / settings return 401 even in a valid session — the fetcher
 ignores those; only history-logs 401 triggers SessionExpiredError.
 """
@@ -64,33 +70,78 @@ _SESSION_CHECK    = "session/check"   # lowercase — compared against url.lower
 _DASHBOARD_MARKER = "/application/"  # present only after a real login
 
 
+_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+]
+
+
+class BrowserPool:
+    """
+    One headless Chromium shared by several accounts. Each BrowserSession
+    from session() gets its own BrowserContext — separate cookies and
+    storage — so accounts never see each other's login.
+    QR logins are serialised: one headed window at a time.
+    """
+
+    def __init__(self) -> None:
+        self._playwright: Optional[Playwright] = None
+        self._browser:    Optional[Browser]    = None
+        self._login_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "BrowserPool":
+        self._playwright = await async_playwright().start()
+        self._browser    = await self._playwright.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        if self._browser:    await self._browser.close()
+        if self._playwright: await self._playwright.stop()
+
+    def session(self, session_file: str, base_url: str, label: str = "") -> "BrowserSession":
+        if self._browser is None:
+            raise RuntimeError("BrowserPool not entered — use `async with`")
+        return BrowserSession(
+            session_file, base_url,
+            browser=self._browser, login_lock=self._login_lock, label=label,
+        )
+
+
 class BrowserSession:
 
-    def __init__(self, session_file: str, base_url: str) -> None:
+    def __init__(
+        self,
+        session_file: str,
+        base_url:     str,
+        browser:      Optional[Browser] = None,
+        login_lock:   Optional[asyncio.Lock] = None,
+        label:        str = "",
+    ) -> None:
         self._session_file = session_file
         self._base_url     = base_url
+        self._label        = label
+        self._login_lock   = login_lock
+        self._owns_browser = browser is None     # standalone → launches its own Chromium
         self._playwright: Optional[Playwright]     = None
-        self._browser:    Optional[Browser]        = None
+        self._browser:    Optional[Browser]        = browser
         self._context:    Optional[BrowserContext] = None
         self._page:       Optional[Page]           = None
 
     # ── context manager ───────────────────────────────────────────────────────
 
     async def __aenter__(self) -> "BrowserSession":
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-            ],
-        )
+        if self._owns_browser:
+            self._playwright = await async_playwright().start()
+            self._browser    = await self._playwright.chromium.launch(headless=True, args=_LAUNCH_ARGS)
         await self._new_context()
         return self
 
     async def __aexit__(self, *_) -> None:
+        if not self._owns_browser:
+            if self._context: await self._context.close()
+            return
         if self._browser:    await self._browser.close()
         if self._playwright: await self._playwright.stop()
 
@@ -111,6 +162,20 @@ class BrowserSession:
 
     # ── public API ────────────────────────────────────────────────────────────
 
+    async def export_cookies(self) -> tuple[list[dict], str]:
+        """
+        (shamcash cookies, user agent) of the headless context — handed to
+        HistoryLogsClient so polling does not need the browser.
+        """
+        if self._context is None:
+            raise RuntimeError("BrowserSession not entered — use `async with`")
+        cookies = [
+            c for c in await self._context.cookies()
+            if "shamcash" in c.get("domain", "")
+        ]
+        user_agent = await self.page.evaluate("navigator.userAgent")
+        return cookies, user_agent
+
     async def ensure_logged_in(self, login_url: str, tx_url: str = "") -> None:
         """
         Probe the transactions page.
@@ -154,6 +219,12 @@ class BrowserSession:
     # ── QR login ──────────────────────────────────────────────────────────────
 
     async def _do_qr_login(self, login_url: str) -> None:
+        if self._login_lock is None:
+            return await self._qr_login(login_url)
+        async with self._login_lock:
+            return await self._qr_login(login_url)
+
+    async def _qr_login(self, login_url: str) -> None:
         """
         Open a headed Chromium window. Wait for QR scan using two parallel
         signals, whichever fires first:
@@ -169,6 +240,8 @@ class BrowserSession:
         print("\n" + "=" * 60)
         print("  Opening ShamCash login page in a browser window.")
         print("  Scan the QR code with your Android ShamCash app.")
+        if self._label:
+            print(f"  Account: {self._label}")
         print(f"\n  URL: {login_url}")
         print("=" * 60 + "\n")
 
@@ -23,19 +23,33 @@ Instead, api.shamcash.sy returns 401 on SOME endpoints — but NOT all:
   • Transaction/history-logs → returns 401 ONLY when the session is truly
     expired. THIS is the only 401 that must trigger SessionExpiredError.
 
+INCREMENTAL SYNC (stream_transactions)
+──────────────────────────────────────
+Each history-logs response carries a `next` cursor; POSTing it back returns
+the following (older) page. stream_transactions walks that cursor until it
+meets the repository's high-water mark — the newest tx_id a previous cycle
+persisted — and yields one batch per page, so a burst of more than 10
+payments between polls is never lost and known rows are never re-parsed.
+
 STRATEGIES (tried in order)
 ─────────────────────────────
+  0. HTTP fast path (scraper/http_client.py) — cookies exported from the
+     browser, one pooled httpx call per page. 401 → fall through to 1.
   1. Direct API call via page.evaluate() — fastest, attaches cookies automatically.
+     The only strategy that can page; 2 and 3 see the latest page only.
   2. XHR intercept on navigation — fallback.
      Fixed: case-insensitive URL match ("transaction" vs "Transaction").
   3. DOM table / card scraping — last resort.
 """
 
 import logging
+from typing import AsyncIterator, Awaitable, Callable
 
+import httpx
 from playwright.async_api import Page
 
-from exceptions import SessionExpiredError
+from exceptions import CookiesRejectedError, MarkNotReachedError, ScrapingError, SessionExpiredError
+from scraper.http_client import HistoryLogsClient
 from scraper.parser import build_transaction
 from models import Transaction
 
@@ -74,18 +88,24 @@ def _check_for_login_redirect(page: Page, context: str = "fetch") -> None:
 
 # ── strategy 1 : direct API call via page.evaluate() ─────────────────────────
 
-async def _fetch_via_direct_api(page: Page, transactions_url: str) -> list[dict]:
-    """
-    POST history-logs from inside the browser context so HttpOnly cookies
-    are attached automatically. 401 here = truly expired session.
-    """
+_FIRST_CURSOR = {"tags": ["last-transactions"]}
+
+
+async def _ensure_on_transactions_page(page: Page, transactions_url: str) -> None:
     if "application/transaction" not in page.url:
         await page.goto(transactions_url, wait_until="networkidle")
         await page.wait_for_timeout(2_000)
         _check_for_login_redirect(page, "navigation")
 
+
+async def _post_history_logs(page: Page, payload: dict):
+    """
+    POST history-logs from inside the browser context so HttpOnly cookies
+    are attached automatically. 401 here = truly expired session.
+    Returns the decoded JSON body (or None).
+    """
     result = await page.evaluate("""
-        async () => {
+        async (payload) => {
             const resp = await fetch("https://api.shamcash.sy/v4/api/Transaction/history-logs", {
                 method: "POST",
                 credentials: "include",
@@ -96,22 +116,17 @@ async def _fetch_via_direct_api(page: Page, transactions_url: str) -> list[dict]
                     "lang": "ar",
                     "x-requested-with": "XMLHttpRequest"
                 },
-                body: JSON.stringify({
-                    "limit": 10,
-                    "next": {"tags": ["last-transactions"]}
-                })
+                body: JSON.stringify(payload)
             });
             const status = resp.status;
             let body = null;
             try { body = await resp.json(); } catch(e) {}
             return { status, body };
         }
-    """)
+    """, payload)
 
     status = result.get("status")
-    body   = result.get("body")
-
-    log.debug("Direct API → status=%s", status)
+    log.debug("Direct API → status=%s  cursor=%s", status, payload.get("next"))
 
     if status == 401:
         log.warning("history-logs returned 401 → session expired")
@@ -119,12 +134,72 @@ async def _fetch_via_direct_api(page: Page, transactions_url: str) -> list[dict]
             "POST history-logs returned 401 — JWT/session expired"
         )
 
+    return result.get("body")
+
+
+async def _fetch_via_direct_api(page: Page, transactions_url: str) -> list[dict]:
+    """Single page — the 10 most recent transactions, as the web app shows them."""
+    await _ensure_on_transactions_page(page, transactions_url)
+    body = await _post_history_logs(page, {"limit": 10, "next": _FIRST_CURSOR})
     if not body:
         return []
-
     return _parse_api_body(body)
 
 
+async def _stream_pages(
+    post: Callable[[dict], Awaitable],
+    high_water_mark: str | None,
+    page_size: int,
+    max_pages: int,
+) -> AsyncIterator[list[Transaction]]:
+    """
+    Follow the `next` cursor page by page (newest first) and yield each
+    page's transactions until high_water_mark is met, the cursor runs out,
+    or max_pages pages have been read. `post` sends one history-logs body.
+
+    Raises MarkNotReachedError after the last batch when max_pages ran out
+    first — the pages past it were never read.
+    """
+    cursor = _FIRST_CURSOR
+    seen: set[str] = set()
+
+    for page_no in range(1, max_pages + 1):
+        body = await post({"limit": page_size, "next": cursor})
+        items = _parse_api_body(body) if body else []
+
+        batch, reached = _until_mark(items, high_water_mark, seen)
+        if batch:
+            yield batch
+        if reached:
+            log.debug("High-water mark %s reached on page %d", high_water_mark, page_no)
+            return
+
+        next_cursor = _extract_next(body)
+        if not items or not next_cursor or next_cursor == cursor:
+            return
+        cursor = next_cursor
+
+    if high_water_mark is not None:
+        raise MarkNotReachedError(
+            f"high-water mark {high_water_mark} not found within {max_pages} pages (raise SYNC_MAX_PAGES)"
+        )
+
+
+async def _stream_via_direct_api(
+    page: Page,
+    transactions_url: str,
+    high_water_mark: str | None,
+    page_size: int,
+    max_pages: int,
+) -> AsyncIterator[list[Transaction]]:
+    await _ensure_on_transactions_page(page, transactions_url)
+    async for batch in _stream_pages(
+        lambda payload: _post_history_logs(page, payload),
+        high_water_mark, page_size, max_pages,
+    ):
+        yield batch
+
+
 # ── strategy 2 : XHR intercept ───────────────────────────────────────────────
 
 async def _fetch_via_intercept(page: Page, transactions_url: str) -> list[dict]:
@@ -251,9 +326,22 @@ def _extract_items(data) -> list:
             val = data.get(key)
             if isinstance(val, list):
                 return val
+        # {"data": {"items": [...], "next": {...}}}
+        if isinstance(data.get("data"), dict):
+            return _extract_items(data["data"])
     return []
 
 
+def _extract_next(data):
+    """The cursor to send back as `next` for the following page, or None."""
+    if not isinstance(data, dict):
+        return None
+    for container in (data, data.get("data")):
+        if isinstance(container, dict) and container.get("next"):
+            return container["next"]
+    return None
+
+
 def _parse_api_items(api_items: list) -> list[dict]:
     raw_list = []
     for tx in api_items:
@@ -286,7 +374,31 @@ def _parse_api_body(body) -> list[dict]:
     return _parse_api_items(items) if items else []
 
 
-# ── public entry point ────────────────────────────────────────────────────────
+def _until_mark(
+    raw_list: list[dict],
+    high_water_mark: str | None,
+    seen: set[str],
+) -> tuple[list[Transaction], bool]:
+    """
+    Build the transactions of one newest-first page up to (excluding) the
+    high-water mark. Returns (transactions, mark_reached).
+    Ids already yielded by an earlier page are skipped — cursors may overlap.
+    """
+    batch = []
+    for raw in raw_list:
+        tx = build_transaction(raw)
+        if tx is None:
+            continue
+        if tx.tx_id == high_water_mark:
+            return batch, True
+        if tx.tx_id in seen:
+            continue
+        seen.add(tx.tx_id)
+        batch.append(tx)
+    return batch, False
+
+
+# ── public entry points ───────────────────────────────────────────────────────
 
 async def fetch_transactions(page: Page, transactions_url: str) -> list[Transaction]:
     """
@@ -313,3 +425,96 @@ async def fetch_transactions(page: Page, transactions_url: str) -> list[Transact
             return result
 
     return []
+
+
+async def stream_transactions(
+    page: Page,
+    transactions_url: str,
+    high_water_mark: str | None,
+    page_size: int = 10,
+    max_pages: int = 50,
+    http: HistoryLogsClient | None = None,
+) -> AsyncIterator[list[Transaction]]:
+    """
+    Incremental sync — yield batches of transactions newer than
+    high_water_mark (the newest tx_id a previous cycle persisted),
+    newest batch first, so the caller can save each one as it arrives.
+
+    With a ready HistoryLogsClient the pages come over plain HTTP (fast
+    path). On 401 / transport errors it falls back to the browser:
+    cursor paging via page.evaluate(), then the single-shot strategies of
+    fetch_transactions (last 10 only). After a browser cycle the client's
+    cookies are reloaded from the page's context.
+
+    A failure after the first batch raises ScrapingError, and a cycle that
+    stopped short of high_water_mark (max_pages, or a single-shot strategy)
+    raises MarkNotReachedError after its last batch: in both cases the
+    caller must not advance its mark for that cycle.
+    Raises SessionExpiredError ONLY when the browser's history-logs returns 401.
+    """
+    yielded = False
+
+    # ── fast path ─────────────────────────────────────────────────────────────
+    if http is not None and http.ready:
+        try:
+            async for batch in _stream_pages(http.post_history_logs, high_water_mark, page_size, max_pages):
+                yielded = True
+                yield batch
+            return
+        except (CookiesRejectedError, httpx.HTTPError) as exc:
+            if yielded:
+                raise ScrapingError(f"HTTP paging interrupted: {exc}") from exc
+            http.invalidate()
+            log.info("HTTP fast path unavailable (%s) — using the browser", exc)
+
+    # ── browser ───────────────────────────────────────────────────────────────
+    try:
+        async for batch in _stream_via_direct_api(
+            page, transactions_url, high_water_mark, page_size, max_pages,
+        ):
+            yielded = True
+            yield batch
+    except (SessionExpiredError, MarkNotReachedError):
+        raise
+    except Exception as exc:
+        if yielded:
+            raise ScrapingError(f"Cursor paging interrupted: {exc}") from exc
+        log.warning("Strategy direct-api failed: %s — falling back", exc)
+    else:
+        await _refresh_http_cookies(page, http)
+        return
+
+    for strat_name, strategy in (
+        ("xhr-intercept", lambda: _fetch_via_intercept(page, transactions_url)),
+        ("dom-scrape",    lambda: _fetch_via_dom(page, transactions_url)),
+    ):
+        try:
+            raw_list = await strategy()
+        except SessionExpiredError:
+            raise
+        except Exception as exc:
+            log.warning("Strategy %s failed: %s — trying next", strat_name, exc)
+            continue
+
+        if raw_list:
+            batch, reached = _until_mark(raw_list, high_water_mark, set())
+            log.info("Strategy %s → %d new transactions", strat_name, len(batch))
+            if batch:
+                yield batch
+            await _refresh_http_cookies(page, http)
+            if high_water_mark is not None and not reached:
+                raise MarkNotReachedError(
+                    f"high-water mark {high_water_mark} not in the latest page ({strat_name})"
+                )
+            return
+
+
+async def _refresh_http_cookies(page: Page, http: HistoryLogsClient | None) -> None:
+    """The browser just talked to history-logs successfully — its cookies are fresh."""
+    if http is None:
+        return
+    try:
+        cookies = [c for c in await page.context.cookies() if "shamcash" in c.get("domain", "")]
+        http.load_cookies(cookies)
+    except Exception as exc:
+        log.debug("Could not refresh HTTP cookies: %s", exc)
@@ -0,0 +1,91 @@
+"""
+scraper/http_client.py
+──────────────────────
+Browserless fast path for history-logs.
+
+BrowserSession logs in and keeps the cookies fresh; this client borrows
+them (BrowserSession.export_cookies) and POSTs history-logs over a pooled
+httpx.AsyncClient — one keep-alive HTTP call per page instead of a
+Chromium navigation + in-page fetch.
+
+Set-Cookie headers on the API responses update the jar, so rotated
+tokens carry over between polls. A 401 raises CookiesRejectedError and
+marks the client stale: the fetcher then goes through the browser (which
+can refresh the session itself) and reloads the cookies afterwards.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import httpx
+
+from exceptions import CookiesRejectedError
+
+log = logging.getLogger(__name__)
+
+_TX_ENDPOINT = "https://api.shamcash.sy/v4/api/Transaction/history-logs"
+
+# Same headers the web app sends (see fetcher.py)
+_HEADERS = {
+    "Accept":           "application/json",
+    "e":                "true",
+    "lang":             "ar",
+    "x-requested-with": "XMLHttpRequest",
+}
+
+
+class HistoryLogsClient:
+
+    def __init__(self, base_url: str, timeout: float = 15.0) -> None:
+        self._client = httpx.AsyncClient(
+            headers={**_HEADERS, "Origin": base_url, "Referer": f"{base_url}/"},
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=300),
+        )
+        self._ready = False
+
+    # ── context manager ───────────────────────────────────────────────────────
+
+    async def __aenter__(self) -> "HistoryLogsClient":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self._client.aclose()
+
+    # ── cookies ───────────────────────────────────────────────────────────────
+
+    @property
+    def ready(self) -> bool:
+        """True once cookies are loaded and not rejected since."""
+        return self._ready
+
+    def load_cookies(self, cookies: list[dict], user_agent: str = "") -> None:
+        jar = httpx.Cookies()
+        for c in cookies:
+            jar.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+        self._client.cookies = jar
+        if user_agent:
+            self._client.headers["User-Agent"] = user_agent
+        self._ready = bool(cookies)
+        log.debug("HTTP fast path: %d cookies loaded", len(cookies))
+
+    def invalidate(self) -> None:
+        self._ready = False
+
+    # ── API ───────────────────────────────────────────────────────────────────
+
+    async def post_history_logs(self, payload: dict):
+        """Decoded JSON body (or None). Raises CookiesRejectedError on 401."""
+        resp = await self._client.post(_TX_ENDPOINT, json=payload)
+        log.debug("HTTP fast path → status=%s  cursor=%s", resp.status_code, payload.get("next"))
+
+        if resp.status_code == 401:
+            self._ready = False
+            raise CookiesRejectedError("history-logs returned 401 to the HTTP client")
+        resp.raise_for_status()
+
+        try:
+            return resp.json()
+        except ValueError:
+            return None
@@ -4,7 +4,8 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from .models import Tag, Feature, RequestErrorLog
 
-from .models import ClubPayout
+from .models import ClubPayout, PaymentMatch
+from .services.PaymentReconciliationService import dismiss_review, resolve_review
 
 
 @admin.register(ClubPayout)
@@ -109,4 +110,36 @@ class RequestErrorLogAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request):    return False
     def has_change_permission(self, request, obj=None): return False
-    def has_delete_permission(self, request, obj=None): return False
\ No newline at end of file
+    def has_delete_permission(self, request, obj=None): return False
+
+
+
+@admin.register(PaymentMatch)
+class PaymentMatchAdmin(admin.ModelAdmin):
+    """Reconciliation results — filter on "Needs review" for the review queue."""
+
+    list_display  = ('transaction', 'status', 'reason', 'booking', 'paid_in_full', 'created_at', 'resolved_by')
+    list_filter   = ('status', 'reason', 'created_at')
+    search_fields = ('transaction__tx_id', 'transaction__name', 'transaction__notes', 'booking__id')
+    readonly_fields = ('transaction', 'reason', 'candidates', 'created_at', 'resolved_at', 'resolved_by')
+    raw_id_fields = ('booking',)
+    list_select_related = ('transaction', 'booking')
+    ordering      = ('-created_at',)
+    actions       = ('confirm_suggested_booking', 'dismiss')
+
+    @admin.action(description=_("Confirm payment of the suggested booking"))
+    def confirm_suggested_booking(self, request, queryset):
+        done = 0
+        for match in queryset.filter(booking__isnull=False):
+            try:
+                resolve_review(match.pk, match.booking_id, request.user, match.paid_in_full)
+                done += 1
+            except Exception as exc:
+                self.message_user(request, f"{match.pk}: {exc}", level='error')
+        self.message_user(request, _("%d payment(s) confirmed.") % done)
+
+    @admin.action(description=_("Dismiss (not a booking payment)"))
+    def dismiss(self, request, queryset):
+        count = dismiss_review(list(queryset.values_list('pk', flat=True)), request.user)
+        self.message_user(request, _("%d transaction(s) dismissed.") % count)
+
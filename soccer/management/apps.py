@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ManagementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'management'
+
+    def ready(self):
+        import management.signals.signals_daily_revenue
+        import management.signals.signals_club_payout_balance
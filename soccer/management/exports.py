@@ -0,0 +1,156 @@
+# management/exports.py
+
+import csv
+import zipfile
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from django.http import StreamingHttpResponse
+
+from core.replica import keep_reads
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Streaming report exports — CSV and XLSX written row by row.
+#
+# Rows come from a generator (usually over .iterator(), a server-side cursor
+# on PostgreSQL); only one chunk of encoded output is held at a time, and the
+# header goes out before the first query row is read.
+# ─────────────────────────────────────────────────────────────────────────────
+
+EXPORT_FORMATS = ('csv', 'xlsx')
+
+_CHUNK_ROWS = 200
+
+_CONTENT_TYPES = {
+    'csv':  'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+class _Sink:
+    """Write-only, non-seekable file object — zipfile then streams with data descriptors."""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+# ── CSV ──────────────────────────────────────────────────────────────────────
+
+def _stream_csv(header, rows):
+    sink = _Sink()
+
+    class _Text:
+        def write(self, line):
+            sink.write(line.encode('utf-8'))
+
+    writer = csv.writer(_Text())
+    sink.write('\ufeff'.encode('utf-8'))       # BOM — Excel then reads the Arabic names correctly
+    writer.writerow(header)
+    yield sink.drain()
+
+    for i, row in enumerate(rows, 1):
+        writer.writerow(['' if v is None else v for v in row])
+        if i % _CHUNK_ROWS == 0:
+            yield sink.drain()
+    yield sink.drain()
+
+
+# ── XLSX (minimal SpreadsheetML, inline strings, one sheet) ──────────────────
+
+_XLSX_STATIC = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+
+def _xlsx_cell(value) -> str:
+    if value is None or value == '':
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, Decimal)):
+        return f'<c><v>{value}</v></c>'
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+
+
+def _xlsx_row(values) -> bytes:
+    return ('<row>' + ''.join(_xlsx_cell(v) for v in values) + '</row>').encode('utf-8')
+
+
+def _stream_xlsx(header, rows, sheet_name):
+    sink = _Sink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, content in _XLSX_STATIC.items():
+            zf.writestr(name, content)
+        zf.writestr('xl/workbook.xml', _WORKBOOK.format(name=escape(sheet_name[:31])))
+
+        with zf.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(header))
+            yield sink.drain()
+
+            for i, row in enumerate(rows, 1):
+                sheet.write(_xlsx_row(row))
+                if i % _CHUNK_ROWS == 0:
+                    yield sink.drain()
+
+            sheet.write(b'</sheetData></worksheet>')
+    yield sink.drain()                         # central directory
+
+
+# ── Public API ───────────────────────────────────────────────────────────────
+
+def export_response(fmt: str, filename: str, header, rows) -> StreamingHttpResponse:
+    """
+    fmt      — 'csv' | 'xlsx'
+    filename — without extension
+    rows     — iterable of sequences, consumed lazily while the response is sent
+    """
+    rows = keep_reads(rows)     # streamed after the view returns — same database as the view
+    stream = _stream_csv(header, rows) if fmt == 'csv' else _stream_xlsx(header, rows, filename)
+    response = StreamingHttpResponse(stream, content_type=_CONTENT_TYPES[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{fmt}"'
+    return response
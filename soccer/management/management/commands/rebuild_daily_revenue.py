@@ -0,0 +1,31 @@
+"""
+python manage.py rebuild_daily_revenue [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+
+Recomputes club_daily_online_revenue rows from the bookings table. Needed
+after bulk Booking.objects...update(...) calls, which bypass the signals,
+or after a global coupon's discount was edited.
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management.services.DailyRevenueService import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily online revenue facts from the bookings table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="date_from", help="First day (default: no limit).")
+        parser.add_argument("--to", dest="date_to", help="Last day (default: no limit).")
+
+    def handle(self, *args, **options):
+        try:
+            date_from = date.fromisoformat(options["date_from"]) if options["date_from"] else None
+            date_to = date.fromisoformat(options["date_to"]) if options["date_to"] else None
+        except ValueError:
+            raise CommandError("Dates must be YYYY-MM-DD.")
+
+        rows = rebuild(date_from, date_to)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} club/day/status rows."))
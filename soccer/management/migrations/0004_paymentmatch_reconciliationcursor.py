@@ -0,0 +1,42 @@
+# Generated by Django 5.2.10 on 2026-10-19 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0002_clubpayout'),
+        ('management', '0003_transaction'),
+        ('player_booking', '0018_booking_booking_player_created_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReconciliationCursor',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('scraped_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PaymentMatch',
+            fields=[
+                ('transaction', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='payment_match', serialize=False, to='management.transaction')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'Matched'), (2, 'Needs review'), (3, 'No candidate'), (4, 'Resolved by staff'), (5, 'Dismissed by staff')])),
+                ('reason', models.CharField(max_length=30)),
+                ('candidates', models.JSONField(blank=True, default=list)),
+                ('paid_in_full', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('resolved_by', models.CharField(blank=True, default='', max_length=50)),
+                ('booking', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payment_matches', to='player_booking.booking')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='management__status_d32f44_idx')],
+            },
+        ),
+    ]
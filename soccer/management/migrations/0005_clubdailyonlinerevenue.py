@@ -0,0 +1,91 @@
+# Generated by Django 5.2.10 on 2026-10-19 15:20
+
+import django.db.models.deletion
+from collections import defaultdict
+from decimal import Decimal
+from django.db import migrations, models
+
+REVENUE_STATUSES = [3, 4, 7, 8]     # PENDING_PAY, COMPLETED, NO_SHOW, DISPUTED
+ONLINE, DEPOSIT_ONLINE = 3, 6        # PayStatus
+
+
+def _revenue(price, final, deposit, pay, coupon_club_id, dtype, dvalue):
+    """management.services.ClubRevenueService.booking_revenue, frozen."""
+    final = final or Decimal('0')
+    dvalue = dvalue or Decimal('0')
+    global_coupon = dtype is not None and coupon_club_id is None
+    # 100% off leaves final at 0 — the pitch price is the pre-discount price
+    original = (price or Decimal('0')) if dvalue >= 100 else final / (1 - dvalue / 100)
+
+    if pay == DEPOSIT_ONLINE:
+        base = deposit or Decimal('0')
+        if not global_coupon:
+            return base
+        if dtype == 'percentage':
+            return base + original * (min(dvalue, 100) / 100)
+        return base + dvalue
+
+    if pay == ONLINE:
+        if not global_coupon:
+            return final
+        if dtype == 'percentage':
+            return original
+        return final + dvalue
+
+    return Decimal('0')
+
+
+def backfill_daily_revenue(apps, schema_editor):
+    Booking = apps.get_model('player_booking', 'Booking')
+    ClubDailyOnlineRevenue = apps.get_model('management', 'ClubDailyOnlineRevenue')
+
+    totals = defaultdict(lambda: [Decimal('0'), 0])
+    rows = (
+        Booking.objects
+        .filter(status__in=REVENUE_STATUSES, payment_status__in=[ONLINE, DEPOSIT_ONLINE])
+        .values_list(
+            'club_id', 'date', 'status', 'price', 'final_price', 'deposit', 'payment_status',
+            'coupon__club_id', 'coupon__discount_type', 'coupon__discount_value',
+        )
+    )
+    for club_id, day, status, *money in rows.iterator():
+        bucket = totals[(club_id, day, status)]
+        bucket[0] += _revenue(*money).quantize(Decimal('0.01'))
+        bucket[1] += 1
+
+    ClubDailyOnlineRevenue.objects.bulk_create(
+        [
+            ClubDailyOnlineRevenue(club_id=club_id, day=day, status=status, revenue=revenue, count=count)
+            for (club_id, day, status), (revenue, count) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_manage', '0001_initial'),
+        ('management', '0004_paymentmatch_reconciliationcursor'),
+        ('player_booking', '0018_booking_booking_player_created_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClubDailyOnlineRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.PositiveSmallIntegerField()),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('count', models.IntegerField(default=0)),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_online_revenue', to='dashboard_manage.club')),
+            ],
+            options={
+                'db_table': 'club_daily_online_revenue',
+                'indexes': [models.Index(fields=['day', 'club'], name='club_daily__day_7217e1_idx')],
+                'constraints': [models.UniqueConstraint(fields=('club', 'day', 'status'), name='uniq_club_daily_online_revenue')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_revenue, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.10 on 2026-10-19 16:40
+
+import django.db.models.deletion
+from collections import defaultdict
+from decimal import Decimal
+from django.db import migrations, models
+
+REVENUE_STATUSES = [3, 4, 7, 8]     # PENDING_PAY, COMPLETED, NO_SHOW, DISPUTED
+ONLINE, DEPOSIT_ONLINE = 3, 6        # PayStatus
+
+
+def backfill_balances(apps, schema_editor):
+    """Fill ClubDailyOnlineRevenue.collected, then one ClubPayoutBalance per club."""
+    Booking = apps.get_model('player_booking', 'Booking')
+    ClubPayout = apps.get_model('management', 'ClubPayout')
+    ClubDailyOnlineRevenue = apps.get_model('management', 'ClubDailyOnlineRevenue')
+    ClubPayoutBalance = apps.get_model('management', 'ClubPayoutBalance')
+
+    collected = defaultdict(Decimal)
+    rows = (
+        Booking.objects
+        .filter(status__in=REVENUE_STATUSES, payment_status__in=[ONLINE, DEPOSIT_ONLINE])
+        .values_list('club_id', 'date', 'status', 'payment_status', 'deposit', 'final_price')
+    )
+    for club_id, day, status, pay, deposit, final in rows.iterator():
+        paid = deposit if pay == DEPOSIT_ONLINE else final
+        collected[(club_id, day, status)] += paid or Decimal('0')
+
+    balances = defaultdict(lambda: [Decimal('0'), Decimal('0')])
+    for (club_id, day, status), amount in collected.items():
+        ClubDailyOnlineRevenue.objects.filter(club_id=club_id, day=day, status=status).update(collected=amount)
+        balances[club_id][0] += amount
+    for club_id, amount in ClubPayout.objects.values_list('club_id', 'amount').iterator():
+        balances[club_id][1] += amount
+
+    ClubPayoutBalance.objects.bulk_create(
+        [
+            ClubPayoutBalance(club_id=club_id, collected_total=collected_total, sent_total=sent_total)
+            for club_id, (collected_total, sent_total) in balances.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_manage', '0001_initial'),
+        ('management', '0005_clubdailyonlinerevenue'),
+        ('player_booking', '0018_booking_booking_player_created_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clubdailyonlinerevenue',
+            name='collected',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.CreateModel(
+            name='ClubPayoutBalance',
+            fields=[
+                ('club', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='payout_balance', serialize=False, to='dashboard_manage.club')),
+                ('collected_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('sent_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'club_payout_balance',
+            },
+        ),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
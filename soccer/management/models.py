@@ -144,4 +144,93 @@ class ClubPayout(models.Model):
         ]
 
     def __str__(self):
-        return f"Payout {self.club.name} — {self.amount} on {self.date}"
\ No newline at end of file
+        return f"Payout {self.club.name} — {self.amount} on {self.date}"
+
+
+class PaymentMatch(models.Model):
+    """
+    Outcome of reconciling one incoming Transaction against the open
+    (PAY / CHECK_PAY) bookings — written by PaymentReconciliationService.
+    Rows in REVIEW are the staff review queue.
+    """
+
+    class Status(models.IntegerChoices):
+        MATCHED   = 1, "Matched"
+        REVIEW    = 2, "Needs review"
+        UNMATCHED = 3, "No candidate"
+        RESOLVED  = 4, "Resolved by staff"
+        DISMISSED = 5, "Dismissed by staff"
+
+    transaction = models.OneToOneField(Transaction, on_delete=models.CASCADE, primary_key=True, related_name='payment_match')
+    booking     = models.ForeignKey('player_booking.Booking', on_delete=models.SET_NULL, null=True, blank=True, related_name='payment_matches')
+    status      = models.PositiveSmallIntegerField(choices=Status.choices)
+    reason      = models.CharField(max_length=30)                 # reference | identity | amount_only | ambiguous | ...
+    candidates  = models.JSONField(default=list, blank=True)      # booking ids considered, for the reviewer
+    paid_in_full = models.BooleanField(default=True)              # False → the deposit of a DEPOSIT_ONLINE booking
+    created_at  = models.DateTimeField(auto_now_add=True)
+    resolved_at = models.DateTimeField(null=True, blank=True)
+    resolved_by = models.CharField(max_length=50, blank=True, default='')
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.transaction_id} → {self.get_status_display()}"
+
+
+class ReconciliationCursor(models.Model):
+    """High-water mark of PaymentReconciliationService — last Transaction.scraped_at consumed."""
+    name       = models.CharField(max_length=50, primary_key=True)
+    scraped_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.scraped_at}"
+
+
+class ClubDailyOnlineRevenue(models.Model):
+    """
+    Pre-aggregated online revenue — one row per (club, day, booking status),
+    kept current by management/signals/signals_daily_revenue.py.
+    The revenue report sums these rows instead of scanning bookings.
+    """
+    club    = models.ForeignKey(Club, on_delete=models.CASCADE, related_name='daily_online_revenue')
+    day     = models.DateField()
+    status  = models.PositiveSmallIntegerField()
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    collected = models.DecimalField(max_digits=14, decimal_places=2, default=0)   # paid online, no coupon adjustment
+    count   = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'club_daily_online_revenue'
+        constraints = [
+            models.UniqueConstraint(fields=['club', 'day', 'status'], name='uniq_club_daily_online_revenue'),
+        ]
+        indexes = [
+            models.Index(fields=['day', 'club']),
+        ]
+
+    def __str__(self):
+        return f"{self.club_id} {self.day} [{self.status}] {self.revenue}"
+
+
+class ClubPayoutBalance(models.Model):
+    """
+    Running payout ledger — one row per club.
+      collected_total  Σ online payments of revenue bookings (ClubDailyOnlineRevenue.collected)
+      sent_total       Σ ClubPayout.amount
+    Updated in the same transaction as the booking / payout that changes it.
+    """
+    club            = models.OneToOneField(Club, on_delete=models.CASCADE, primary_key=True, related_name='payout_balance')
+    collected_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    sent_total      = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at      = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'club_payout_balance'
+
+    def __str__(self):
+        return f"{self.club_id}: {self.collected_total} − {self.sent_total}"
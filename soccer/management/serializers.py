@@ -1,5 +1,6 @@
 from core.governorates import SyrianGovernorate   
 from rest_framework import serializers
+from .exports import EXPORT_FORMATS
 from .models import ClubPayout
 
 
@@ -12,6 +13,7 @@ class ClubRevenueFilterSerializer(serializers.Serializer):
         choices=[(g.value, g.label) for g in SyrianGovernorate],
         required=False,
     )
+    export      = serializers.ChoiceField(choices=EXPORT_FORMATS, required=False)   # stream a file instead of JSON
 
     def validate(self, attrs):
         if attrs['date_from'] > attrs['date_to']:
@@ -31,8 +33,9 @@ class RecordPayoutSerializer(serializers.Serializer):
 class ClubPayoutFilterSerializer(serializers.Serializer):
     club_name   = serializers.CharField(required=False, allow_blank=False)
     governorate = serializers.IntegerField(required=False)
-    date_from   = serializers.DateField(required=False)   # ← add
-    date_to     = serializers.DateField(required=False)   # ← add
+    date_from   = serializers.DateField(required=False)
+    date_to     = serializers.DateField(required=False)
+    export      = serializers.ChoiceField(choices=EXPORT_FORMATS, required=False)   # stream a file instead of JSON
 
     def validate(self, attrs):
         df = attrs.get('date_from')
@@ -41,4 +44,11 @@ class ClubPayoutFilterSerializer(serializers.Serializer):
             raise serializers.ValidationError(
                 {"date_from": "يجب أن يكون تاريخ البداية قبل تاريخ النهاية."}
             )
-        return attrs
\ No newline at end of file
+        return attrs
+
+class ClubPayoutHistorySerializer(serializers.ModelSerializer):
+    payout_id = serializers.UUIDField(source='id', read_only=True)
+
+    class Meta:
+        model  = ClubPayout
+        fields = ['payout_id', 'amount', 'date', 'notes', 'done_by']
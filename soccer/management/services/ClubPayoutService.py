@@ -1,114 +1,83 @@
 from decimal import Decimal
-from django.db.models import Sum, Case, When, Value, DecimalField
+from django.db import transaction
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum
 from django.db.models.functions import Coalesce
-from concurrent.futures import ThreadPoolExecutor
+from django.utils import timezone
 
-from player_booking.models import Booking, BookingStatus, PayStatus
-from management.models import ClubPayout
+from management.models import ClubPayout, ClubPayoutBalance
 from core.models import SyrianGovernorate
 from rest_framework.exceptions import ValidationError
 
-REVENUE_STATUSES = [
-    BookingStatus.PENDING_PAY,
-    BookingStatus.COMPLETED,
-    BookingStatus.NO_SHOW,
-    BookingStatus.DISPUTED,
-]
-ONLINE_PAY_STATUSES = [PayStatus.ONLINE, PayStatus.DEPOSIT_ONLINE]
-
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Path A — collected per club (unchanged, already optimal)
+# Ledger maintenance — ClubPayoutBalance, one row per club
+#
+#   collected_total ← DailyRevenueService.apply / rebuild  (booking signals)
+#                     DailyRevenueService.apply_changes    (booking admin bulk actions)
+#   sent_total      ← signals_club_payout_balance          (ClubPayout writes)
+#
+# Both run inside the transaction of the write that caused them.
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _collected_per_club(club_name, governorate) -> dict[str, dict]:
-    qs = (
-        Booking.objects
-        .filter(
-            status__in=REVENUE_STATUSES,
-            payment_status__in=ONLINE_PAY_STATUSES,
-        )
-        .annotate(
-            row_revenue=Case(
-                When(payment_status=PayStatus.DEPOSIT_ONLINE, then='deposit'),
-                When(payment_status=PayStatus.ONLINE,         then='final_price'),
-                default=Value(Decimal('0')),
-                output_field=DecimalField(),
-            )
+def _shift(club_id, field: str, amount: Decimal) -> None:
+    if not amount:
+        return
+    if amount > 0:
+        # Decrements always find their row — never create one on the way out
+        ClubPayoutBalance.objects.bulk_create(
+            [ClubPayoutBalance(club_id=club_id)],
+            ignore_conflicts=True,
         )
+    ClubPayoutBalance.objects.filter(club_id=club_id).update(
+        **{field: F(field) + amount},
+        updated_at=timezone.now(),
     )
 
-    if club_name:
-        qs = qs.filter(club__name__icontains=club_name.strip())
-    if governorate is not None:
-        qs = qs.filter(club__governorate=governorate)
 
-    rows = (
-        qs
-        .values('club_id', 'club__name', 'club__governorate')
-        .annotate(total_collected=Coalesce(Sum('row_revenue'), Decimal('0')))
-        .order_by()
-    )
+def apply_collected(club_id, amount: Decimal) -> None:
+    _shift(club_id, 'collected_total', amount)
 
-    return {
-        str(r['club_id']): {
-            'club_name':       r['club__name'],
-            'governorate':     r['club__governorate'],
-            'total_collected': r['total_collected'],
-        }
-        for r in rows
-    }
+
+def apply_sent(club_id, amount: Decimal) -> None:
+    _shift(club_id, 'sent_total', amount)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Path B — sent per club
-# ONE query instead of two, values() instead of ORM objects
+# Balances query — sent_total from the ledger, or, when the caller filters by
+# date, the payouts inside the range as a correlated subquery (payout date index)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _sent_per_club(club_name, governorate, date_from=None, date_to=None) -> dict[str, dict]:
-    qs = (
-        ClubPayout.objects
-        .values(
-            'club_id',
-            'id',
-            'amount',
-            'date',
-            'notes',
-            'done_by',
-        )
-        .order_by('club_id', '-date')
-    )
-
+def _balances(club_name, governorate, date_from, date_to):
+    qs = ClubPayoutBalance.objects.all()
     if club_name:
         qs = qs.filter(club__name__icontains=club_name.strip())
     if governorate is not None:
         qs = qs.filter(club__governorate=governorate)
-    if date_from is not None:                          # ← add
-        qs = qs.filter(date__gte=date_from)
-    if date_to is not None:                            # ← add
-        qs = qs.filter(date__lte=date_to)
 
-    totals:  dict[str, Decimal] = {}
-    history: dict[str, list]   = {}
-
-    for row in qs:
-        cid = str(row['club_id'])
-        totals[cid] = totals.get(cid, Decimal('0')) + (row['amount'] or Decimal('0'))
-        history.setdefault(cid, []).append({
-            'payout_id':  str(row['id']),
-            'amount':     row['amount'],
-            'date':       row['date'],
-            'notes':      row['notes'],
-            'done_by': row['done_by'],
-        })
-
-    return {
-        cid: {
-            'total_sent': totals[cid],
-            'history':    history[cid],
-        }
-        for cid in totals
-    }
+    if date_from is None and date_to is None:
+        sent = F('sent_total')
+    else:
+        payouts = ClubPayout.objects.filter(club_id=OuterRef('club_id'))
+        if date_from is not None:
+            payouts = payouts.filter(date__gte=date_from)
+        if date_to is not None:
+            payouts = payouts.filter(date__lte=date_to)
+        sent = Coalesce(
+            Subquery(payouts.values('club_id').annotate(total=Sum('amount')).values('total')[:1]),
+            Decimal('0'),
+            output_field=DecimalField(),
+        )
+
+    return (
+        qs
+        .annotate(sent=sent)
+        .annotate(balance_owed=F('collected_total') - F('sent'))
+        .values('club_id', 'club__name', 'club__governorate', 'collected_total', 'sent', 'balance_owed')
+    )
+
+
+def _governorate_label(gov):
+    return str(SyrianGovernorate(gov).label) if gov is not None else None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -120,76 +89,65 @@ def get_clubs_payout_summary(
     *,
     club_name:   str | None = None,
     governorate: int | None = None,
-    date_from=None,                                    # ← add
-    date_to=None,                                      # ← add
+    date_from=None,
+    date_to=None,
 ) -> list[dict]:
+    """
+    One row per club with a balance — read from ClubPayoutBalance, so the
+    cost grows with the number of clubs, not with bookings or payouts.
+    date_from / date_to restrict the sent side, as before.
+    The payouts themselves: get_club_payout_history (paginated).
+    """
+    rows = _balances(club_name, governorate, date_from, date_to).order_by('-balance_owed')
 
-    args = (club_name, governorate)
+    return [
+        {
+            'club_id':         str(r['club_id']),
+            'club_name':       r['club__name'],
+            'governorate':     _governorate_label(r['club__governorate']),
+            'total_collected': r['collected_total'],
+            'total_sent':      r['sent'],
+            'balance_owed':    r['balance_owed'],
+        }
+        for r in rows
+    ]
 
-    with ThreadPoolExecutor(max_workers=2) as pool:
-        f_collected = pool.submit(_collected_per_club, *args)
-        f_sent      = pool.submit(_sent_per_club, club_name, governorate, date_from, date_to)  # ← pass dates
-        collected   = f_collected.result()
-        sent        = f_sent.result()
 
-    all_ids = set(collected.keys()) | set(sent.keys())
-    results = []
+PAYOUT_EXPORT_HEADER = ['club_id', 'club_name', 'governorate', 'total_collected', 'total_sent', 'balance_owed']
 
-    for cid in all_ids:
-        c = collected.get(cid, {})
-        s = sent.get(cid, {'total_sent': Decimal('0'), 'history': []})
 
-        total_collected = c.get('total_collected', Decimal('0'))
-        total_sent      = s['total_sent']
-        gov             = c.get('governorate')
+def iter_clubs_payout_rows(*, club_name=None, governorate=None, date_from=None, date_to=None):
+    """PAYOUT_EXPORT_HEADER-ordered rows, streamed through .iterator()."""
+    rows = _balances(club_name, governorate, date_from, date_to).order_by('club__name', 'club_id')
+    for r in rows.iterator(chunk_size=500):
+        yield [
+            str(r['club_id']), r['club__name'], _governorate_label(r['club__governorate']),
+            r['collected_total'], r['sent'], r['balance_owed'],
+        ]
 
-        results.append({
-            'club_id':         cid,
-            'club_name':       c.get('club_name', ''),
-            'governorate':     str(SyrianGovernorate(gov).label) if gov is not None else None,
-            'total_collected': total_collected,
-            'total_sent':      total_sent,
-            'balance_owed':    total_collected - total_sent,
-            'payout_history':  s['history'],
-        })
 
-    return sorted(results, key=lambda x: x['balance_owed'], reverse=True)
+def get_club_payout_history(club_id, date_from=None, date_to=None):
+    """Payouts of one club, newest first — a queryset for the paginator or the export."""
+    qs = ClubPayout.objects.filter(club_id=club_id).only('id', 'amount', 'date', 'notes', 'done_by', 'created_at')
+    if date_from is not None:
+        qs = qs.filter(date__gte=date_from)
+    if date_to is not None:
+        qs = qs.filter(date__lte=date_to)
+    return qs.order_by('-date', '-created_at')
 
-# ─────────────────────────────────────────────────────────────────────────────
-# record_payout — targeted single-club balance check, not full summary
-# ─────────────────────────────────────────────────────────────────────────────
 
+PAYOUT_HISTORY_EXPORT_HEADER = ['payout_id', 'amount', 'date', 'notes', 'done_by']
 
-def _get_single_club_balance(club_id: str, date_from=None, date_to=None) -> Decimal:  # ← add dates
-    collected = (
-        Booking.objects
-        .filter(
-            club_id=club_id,
-            status__in=REVENUE_STATUSES,
-            payment_status__in=ONLINE_PAY_STATUSES,
-        )
-        .annotate(
-            row_revenue=Case(
-                When(payment_status=PayStatus.DEPOSIT_ONLINE, then='deposit'),
-                When(payment_status=PayStatus.ONLINE,         then='final_price'),
-                default=Value(Decimal('0')),
-                output_field=DecimalField(),
-            )
-        )
-        .aggregate(total=Coalesce(Sum('row_revenue'), Decimal('0')))
-    )['total']
 
-    sent_qs = ClubPayout.objects.filter(club_id=club_id)
-    if date_from is not None:                          # ← add
-        sent_qs = sent_qs.filter(date__gte=date_from)
-    if date_to is not None:                            # ← add
-        sent_qs = sent_qs.filter(date__lte=date_to)
+def iter_club_payout_history_rows(club_id, date_from=None, date_to=None):
+    rows = get_club_payout_history(club_id, date_from, date_to).values_list(*PAYOUT_HISTORY_EXPORT_HEADER[1:], 'id')
+    for amount, date, notes, done_by, payout_id in rows.iterator(chunk_size=500):
+        yield [str(payout_id), amount, date.isoformat(), notes, done_by]
 
-    sent = sent_qs.aggregate(
-        total=Coalesce(Sum('amount'), Decimal('0'))
-    )['total']
 
-    return collected - sent
+# ─────────────────────────────────────────────────────────────────────────────
+# record_payout — checked against the club's ledger row
+# ─────────────────────────────────────────────────────────────────────────────
 
 def record_payout(
     club_id:    str,
@@ -199,20 +157,29 @@ def record_payout(
     done_by,
 ) -> ClubPayout:
     """
-    Validates against a single-club balance check — not the full summary.
-    Before: O(all clubs). After: O(1 club) — two targeted aggregations.
+    Locks the club's balance row, so two payouts recorded at once cannot
+    both pass the check. The ClubPayout post_save signal adds the amount
+    to sent_total inside this same transaction.
     """
-    balance_owed = _get_single_club_balance(str(club_id))
-
-    if amount > balance_owed:
-        raise ValidationError({
-            'error': f"المبلغ المُدخَل ({amount}) أكبر من المستحق للنادي ({balance_owed})."
-        })
-
-    return ClubPayout.objects.create(
-        club_id    = club_id,
-        amount     = amount,
-        date       = date,
-        notes      = notes,
-        done_by = done_by,
-    )
\ No newline at end of file
+    with transaction.atomic():
+        balance = (
+            ClubPayoutBalance.objects
+            .select_for_update()
+            .filter(club_id=club_id)
+            .values_list('collected_total', 'sent_total')
+            .first()
+        )
+        balance_owed = balance[0] - balance[1] if balance else Decimal('0')
+
+        if amount > balance_owed:
+            raise ValidationError({
+                'error': f"المبلغ المُدخَل ({amount}) أكبر من المستحق للنادي ({balance_owed})."
+            })
+
+        return ClubPayout.objects.create(
+            club_id    = club_id,
+            amount     = amount,
+            date       = date,
+            notes      = notes,
+            done_by = done_by,
+        )
@@ -1,14 +1,13 @@
 # services/ClubRevenueService.py
 
 from decimal import Decimal
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
 
-from django.db.models import Sum, Count, Q, Case, When, Value, DecimalField
+from django.db.models import Sum
 from django.db.models.functions import Coalesce
 
-from player_booking.models import Booking, BookingStatus, PayStatus
+from player_booking.models import BookingStatus, PayStatus
 from core.models import SyrianGovernorate
+from management.models import ClubDailyOnlineRevenue
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -53,10 +52,20 @@ def _empty_club(club_id, name, governorate) -> dict:
     }
 
 
+def _original_price(row: dict, final: Decimal, dvalue: Decimal) -> Decimal:
+    """
+    Price before a percentage coupon. A 100% coupon leaves final_price at 0,
+    which cannot be reversed — fall back to the stored pitch price.
+    """
+    if dvalue >= 100:
+        return row['price'] or Decimal('0')
+    return final / (1 - dvalue / 100)
+
+
 def _calc_revenue_from_row(row: dict) -> Decimal:
     """
     Pure-dict revenue calculation — no ORM object, no attribute lookup overhead.
-    Called only for global-coupon rows (minority path).
+    Called only for global-coupon rows (minority path) — see booking_revenue.
     """
     pay    = row['payment_status']
     final  = row['final_price']  or Decimal('0')
@@ -67,8 +76,8 @@ def _calc_revenue_from_row(row: dict) -> Decimal:
         deposit = row['deposit'] or Decimal('0')
         # Global coupon: club gets deposit + app-covered portion
         if dtype == 'percentage':
-            original       = final / (1 - dvalue / 100)
-            discount_share = original * (dvalue / 100)
+            original       = _original_price(row, final, dvalue)
+            discount_share = original * (min(dvalue, 100) / 100)
         else:
             discount_share = dvalue
         return deposit + discount_share
@@ -76,200 +85,143 @@ def _calc_revenue_from_row(row: dict) -> Decimal:
     if pay == PayStatus.ONLINE:
         # Global coupon: reverse discount to recover original price
         if dtype == 'percentage':
-            return final / (1 - dvalue / 100)
+            return _original_price(row, final, dvalue)
         return final + dvalue
 
     return Decimal('0')
 
 
-def _base_filter(date_from, date_to, club_name, governorate):
+def booking_collected(row: dict) -> Decimal:
+    """What the booking actually paid online (what MATCH holds for the club)."""
+    if row['payment_status'] == PayStatus.DEPOSIT_ONLINE:
+        return row['deposit'] or Decimal('0')
+    if row['payment_status'] == PayStatus.ONLINE:
+        return row['final_price'] or Decimal('0')
+    return Decimal('0')
+
+
+def booking_revenue(row: dict) -> Decimal:
     """
-    Shared filter dict — applied identically to both queries.
-    Using a dict avoids re-constructing Q objects twice.
+    Online revenue one booking brings its club, from a values() row with
+    the same keys as _calc_revenue_from_row (plus coupon__club_id).
+
+      no coupon / club coupon  → deposit (DEPOSIT_ONLINE) or final_price (ONLINE)
+      global coupon            → _calc_revenue_from_row (app covers the discount)
     """
-    f: dict = {
-        'status__in':         REVENUE_STATUSES,
-        'payment_status__in': ONLINE_PAY_STATUSES,
-        'date__range':        (date_from, date_to),
-    }
-    if club_name:
-        f['club__name__icontains'] = club_name.strip()
-    if governorate is not None:
-        f['club__governorate'] = governorate
-    return f
+    if row['coupon__discount_type'] is not None and row['coupon__club_id'] is None:
+        return _calc_revenue_from_row(row)
+    return booking_collected(row)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Path A — SQL GROUP BY (standard rows: no coupon + club coupon)
+# Public API
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _run_path_a(date_from, date_to, club_name, governorate) -> dict:
-    """
-    Single aggregation query — the DB sums everything, Python only
-    assembles the result dict (one iteration over grouped rows).
-    """
-    rows = (
-        Booking.objects
-        .filter(
-            **_base_filter(date_from, date_to, club_name, governorate),
-        )
-        .filter(
-            Q(coupon__isnull=True) | Q(coupon__club_id__isnull=False)
-        )
-        .annotate(
-            row_revenue=Case(
-                When(payment_status=PayStatus.DEPOSIT_ONLINE, then='deposit'),
-                When(payment_status=PayStatus.ONLINE,         then='final_price'),
-                default=Value(Decimal('0')),
-                output_field=DecimalField(),
-            )
-        )
+def _status_rows(date_from, date_to, club_name, governorate):
+    """(club, status) revenue / count over the fact table — GROUP BY, unordered."""
+    f: dict = {'day__range': (date_from, date_to), 'count__gt': 0}
+    if club_name:
+        f['club__name__icontains'] = club_name.strip()
+    if governorate is not None:
+        f['club__governorate'] = governorate
+
+    return (
+        ClubDailyOnlineRevenue.objects
+        .filter(**f)
         .values('club_id', 'club__name', 'club__governorate', 'status')
         .annotate(
-            status_revenue=Coalesce(Sum('row_revenue'), Decimal('0')),
-            status_count=Count('id'),
+            status_revenue=Coalesce(Sum('revenue'), Decimal('0')),
+            status_count=Coalesce(Sum('count'), 0),
         )
         .order_by()   # required — clears default ordering before GROUP BY
     )
 
-    clubs: dict[str, dict] = {}
 
-    for row in rows:
-        cid = str(row['club_id'])
+def _add_status_row(clubs: dict, row: dict) -> None:
+    cid = str(row['club_id'])
 
-        if cid not in clubs:
-            clubs[cid] = _empty_club(cid, row['club__name'], row['club__governorate'])
+    if cid not in clubs:
+        clubs[cid] = _empty_club(cid, row['club__name'], row['club__governorate'])
 
-        label = STATUS_LABEL[row['status']]
-        rev   = row['status_revenue']
+    label = STATUS_LABEL[row['status']]
+    rev   = row['status_revenue']
 
-        clubs[cid]['total_revenue']         += rev
-        clubs[cid]['booking_count']         += row['status_count']
-        clubs[cid]['by_status'][label]      += rev
+    clubs[cid]['total_revenue']    += rev
+    clubs[cid]['booking_count']    += row['status_count']
+    clubs[cid]['by_status'][label] += rev
 
-    return clubs
 
+def _governorate_label(gov):
+    return SyrianGovernorate(gov).label if gov is not None else None
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Path B — values() dict loop (global coupon rows only)
-# ─────────────────────────────────────────────────────────────────────────────
 
-def _run_path_b(date_from, date_to, club_name, governorate) -> dict:
-    """
-    Uses .values() instead of model instances — eliminates Python object
-    instantiation entirely. Coupon fields are joined at DB level so there
-    is still only 1 query, no select_related overhead.
+def get_clubs_revenue(
+    date_from,
+    date_to,
+    *,
+    club_name:   str | None = None,
+    governorate: int | None = None,
+) -> list[dict]:
     """
-    rows = (
-        Booking.objects
-        .filter(
-            **_base_filter(date_from, date_to, club_name, governorate),
-            coupon__isnull=False,
-            coupon__club_id__isnull=True,    # global coupon only
-        )
-        .values(
-            'club_id',
-            'club__name',
-            'club__governorate',
-            'status',
-            'final_price',
-            'deposit',
-            'payment_status',
-            'coupon__discount_type',
-            'coupon__discount_value',
-        )
-        # .iterator() streams rows — avoids loading all into memory at once
-        # chunk_size controls how many rows are fetched per DB round-trip
-    )
+    Returns a list of dicts — one per club — sorted by total_revenue DESC.
 
+    Reads the club_daily_online_revenue fact table (DailyRevenueService),
+    so the cost is one GROUP BY over at most clubs × days × 4 rows,
+    whatever the number of bookings in the range.
+    """
     clubs: dict[str, dict] = {}
 
-    for row in rows.iterator(chunk_size=500):
-        cid = str(row['club_id'])
-
-        if cid not in clubs:
-            clubs[cid] = _empty_club(cid, row['club__name'], row['club__governorate'])
+    for row in _status_rows(date_from, date_to, club_name, governorate):
+        _add_status_row(clubs, row)
 
-        rev   = _calc_revenue_from_row(row)
-        label = STATUS_LABEL[row['status']]
-
-        clubs[cid]['total_revenue']    += rev
-        clubs[cid]['booking_count']    += 1
-        clubs[cid]['by_status'][label] += rev
+    # Format governorate label once per club — not per booking
+    results = []
+    for club in clubs.values():
+        club['governorate'] = _governorate_label(club['governorate'])
+        results.append(club)
 
-    return clubs
+    return sorted(results, key=lambda x: x['total_revenue'], reverse=True)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Merge helper
+# Export — same numbers, one flat row per club, streamed
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _merge_into(base: dict, extra: dict) -> None:
-    """
-    Merges extra into base in-place.
-    A club that exists only in extra (global-coupon-only club) is added.
-    A club in both gets its numbers summed.
-    """
-    for cid, extra_club in extra.items():
-        if cid not in base:
-            base[cid] = extra_club
-            continue
-
-        base[cid]['total_revenue'] += extra_club['total_revenue']
-        base[cid]['booking_count'] += extra_club['booking_count']
-
-        for label, amount in extra_club['by_status'].items():
-            base[cid]['by_status'][label] += amount
-
+REVENUE_EXPORT_HEADER = [
+    'club_id', 'club_name', 'governorate', 'total_revenue', 'booking_count',
+    *STATUS_LABEL.values(),
+]
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Public API
-# ─────────────────────────────────────────────────────────────────────────────
 
-def get_clubs_revenue(
+def iter_clubs_revenue_rows(
     date_from,
     date_to,
     *,
     club_name:   str | None = None,
     governorate: int | None = None,
-) -> list[dict]:
+):
     """
-    Returns a list of dicts — one per club — sorted by total_revenue DESC.
-
-    Performance:
-      - 2 independent DB queries run in PARALLEL via ThreadPoolExecutor
-      - Path A: pure SQL aggregation  — no Python loop over raw rows
-      - Path B: .values() dict loop   — no ORM object instantiation
-      - STATUS_LABEL pre-built dict   — no enum lookup per row
-      - Results merged and sorted in O(n) Python
-
-    Recommended DB indexes (add if not present):
-        Booking: (status, payment_status, date)
-        Booking: (club_id)
-        Booking: (coupon_id)
+    Yields REVENUE_EXPORT_HEADER-ordered rows, ordered by club name.
+    The grouped rows arrive sorted by club, so only the current club is
+    held in memory and the query is read through .iterator().
     """
-    args = (date_from, date_to, club_name, governorate)
-
-    # Run Path A and Path B concurrently — they are fully independent queries.
-    # ThreadPoolExecutor releases the GIL during DB I/O, so both queries
-    # are in-flight at the same time. Wall time ≈ max(A, B) instead of A + B.
-    with ThreadPoolExecutor(max_workers=2) as pool:
-        future_a = pool.submit(_run_path_a, *args)
-        future_b = pool.submit(_run_path_b, *args)
-
-        clubs_a = future_a.result()   # blocks until Path A done
-        clubs_b = future_b.result()   # blocks until Path B done
+    rows = (
+        _status_rows(date_from, date_to, club_name, governorate)
+        .order_by('club__name', 'club_id')
+        .iterator(chunk_size=500)
+    )
 
-    # Merge global-coupon results into the main dict
-    _merge_into(clubs_a, clubs_b)
+    def flat(club):
+        return [
+            club['club_id'], club['club_name'], str(_governorate_label(club['governorate']) or ''),
+            club['total_revenue'], club['booking_count'],
+            *club['by_status'].values(),
+        ]
 
-    # Format governorate label once per club — not per booking
-    results = []
-    for club in clubs_a.values():
-        gov = club['governorate']
-        club['governorate'] = (
-            SyrianGovernorate(gov).label if gov is not None else None
-        )
-        results.append(club)
-
-    return sorted(results, key=lambda x: x['total_revenue'], reverse=True)
\ No newline at end of file
+    current: dict[str, dict] = {}
+    for row in rows:
+        if current and str(row['club_id']) not in current:
+            yield flat(current.popitem()[1])
+        _add_status_row(current, row)
+    if current:
+        yield flat(current.popitem()[1])
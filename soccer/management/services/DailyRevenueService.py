@@ -0,0 +1,163 @@
+# services/DailyRevenueService.py
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from player_booking.models import Booking
+from management.models import ClubDailyOnlineRevenue
+from .ClubPayoutService import apply_collected
+from .ClubRevenueService import REVENUE_STATUSES, ONLINE_PAY_STATUSES, booking_collected, booking_revenue
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# club_daily_online_revenue — one row per (club, day, status)
+#
+#   revenue   = Σ booking_revenue(b)     count = number of bookings
+#   collected = Σ booking_collected(b)
+#   over bookings with status in REVENUE_STATUSES and an online payment.
+#
+# Every change to `collected` is mirrored into ClubPayoutBalance.
+# Kept current by management/signals/signals_daily_revenue.py. Bulk .update()
+# calls bypass signals: read booking_contributions() before and after and
+# apply_changes(), or rebuild() the range afterwards.
+# ─────────────────────────────────────────────────────────────────────────────
+
+_CENT = Decimal('0.01')
+
+_ROW_FIELDS = (
+    'club_id',
+    'date',
+    'status',
+    'price',
+    'final_price',
+    'deposit',
+    'payment_status',
+    'coupon__club_id',
+    'coupon__discount_type',
+    'coupon__discount_value',
+)
+
+
+def _qualifying():
+    return Booking.objects.filter(
+        status__in=REVENUE_STATUSES,
+        payment_status__in=ONLINE_PAY_STATUSES,
+    )
+
+
+def _row_contribution(row: dict) -> tuple:
+    return (
+        row['club_id'],
+        row['date'],
+        row['status'],
+        booking_revenue(row).quantize(_CENT),
+        booking_collected(row),
+    )
+
+
+def booking_contribution(booking_id) -> tuple | None:
+    """
+    (club_id, day, status, revenue, collected) the booking currently adds
+    to the fact table, or None when it does not count — 1 query.
+    """
+    row = _qualifying().filter(pk=booking_id).values(*_ROW_FIELDS).first()
+    return _row_contribution(row) if row else None
+
+
+def booking_contributions(booking_ids) -> dict:
+    """{booking_id: contribution} for the bookings that count — 1 query."""
+    rows = _qualifying().filter(pk__in=booking_ids).values('pk', *_ROW_FIELDS)
+    return {row['pk']: _row_contribution(row) for row in rows}
+
+
+def apply(contribution: tuple | None, multiplier: int = 1, balance: bool = True) -> None:
+    """
+    multiplier = +1 → add the booking,  -1 → remove it.
+    Runs inside the caller's transaction; F() increments keep concurrent
+    bookings of the same club / day from overwriting each other.
+    balance=False leaves ClubPayoutBalance to the caller.
+    """
+    if contribution is None:
+        return
+    club_id, day, status, revenue, collected = contribution
+
+    if multiplier > 0:
+        # A removal always finds its row — never create one on the way out
+        # (the club itself may be in the middle of a cascade delete)
+        ClubDailyOnlineRevenue.objects.bulk_create(
+            [ClubDailyOnlineRevenue(club_id=club_id, day=day, status=status)],
+            ignore_conflicts=True,
+        )
+    ClubDailyOnlineRevenue.objects.filter(club_id=club_id, day=day, status=status).update(
+        revenue=F('revenue') + revenue * multiplier,
+        collected=F('collected') + collected * multiplier,
+        count=F('count') + multiplier,
+    )
+    if balance:
+        apply_collected(club_id, collected * multiplier)
+
+
+def apply_changes(old: dict, new: dict) -> None:
+    """
+    Move the fact rows from `old` to `new`, two booking_contributions() taken
+    around a bulk .update() — inside the caller's transaction. Each club's
+    ClubPayoutBalance is shifted once, by its net change in `collected`.
+    """
+    delta = defaultdict(Decimal)
+    for booking_id in old.keys() | new.keys():
+        before, after = old.get(booking_id), new.get(booking_id)
+        if before == after:
+            continue
+        for contribution, multiplier in ((before, -1), (after, 1)):
+            if contribution is not None:
+                apply(contribution, multiplier, balance=False)
+                delta[contribution[0]] += contribution[4] * multiplier
+
+    for club_id in sorted(delta):
+        apply_collected(club_id, delta[club_id])
+
+
+def rebuild(date_from=None, date_to=None) -> int:
+    """Recompute every fact row in [date_from, date_to] from the bookings table."""
+    bookings = _qualifying()
+    facts = ClubDailyOnlineRevenue.objects.all()
+    if date_from:
+        bookings = bookings.filter(date__gte=date_from)
+        facts = facts.filter(day__gte=date_from)
+    if date_to:
+        bookings = bookings.filter(date__lte=date_to)
+        facts = facts.filter(day__lte=date_to)
+
+    totals = defaultdict(lambda: [Decimal('0'), Decimal('0'), 0])
+    for row in bookings.values(*_ROW_FIELDS).iterator(chunk_size=2000):
+        club_id, day, status, revenue, collected = _row_contribution(row)
+        bucket = totals[(club_id, day, status)]
+        bucket[0] += revenue
+        bucket[1] += collected
+        bucket[2] += 1
+
+    with transaction.atomic():
+        # Shift each club's balance by what the range now collects minus what it held
+        delta = defaultdict(Decimal)
+        for club_id, collected in facts.values_list('club_id', 'collected'):
+            delta[club_id] -= collected
+        for (club_id, _, _), (_, collected, _) in totals.items():
+            delta[club_id] += collected
+
+        facts.delete()
+        ClubDailyOnlineRevenue.objects.bulk_create(
+            [
+                ClubDailyOnlineRevenue(
+                    club_id=club_id, day=day, status=status,
+                    revenue=revenue, collected=collected, count=count,
+                )
+                for (club_id, day, status), (revenue, collected, count) in totals.items()
+            ],
+            batch_size=1000,
+        )
+        for club_id, amount in delta.items():
+            apply_collected(club_id, amount)
+    return len(totals)
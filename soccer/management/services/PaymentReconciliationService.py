@@ -0,0 +1,315 @@
+# services/PaymentReconciliationService.py
+"""
+Links scraped ShamCash transfers (management.Transaction) to the bookings
+waiting for them (PAY / CHECK_PAY) and confirms those bookings.
+
+  1. Consume incoming transactions after the ReconciliationCursor
+     high-water mark (Transaction.scraped_at).
+  2. Index the open bookings by expected amount — deposit for
+     DEPOSIT_ONLINE bookings, final_price for everyone — in a dict of
+     amount buckets, so each transaction is an O(1) lookup.
+  3. Among the amount candidates, decide by evidence:
+        booking reference in the transfer notes        → MATCHED
+        payer name / phone is the booking's player      → MATCHED
+        exactly one candidate, amount only              → REVIEW (or MATCHED
+                                                          if PAYMENT_MATCH_AMOUNT_ONLY)
+        several candidates                              → REVIEW
+        none                                            → UNMATCHED
+  4. Confirm every MATCHED booking in one BookingService call, record a
+     PaymentMatch per transaction and advance the cursor — one transaction.
+
+Runs every minute from django-q (core/schedule.py).
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from core.services.notification_service import NotificationService
+from dashboard_booking.services.BookingService import BookingService
+from management.models import PaymentMatch, ReconciliationCursor, Transaction
+from player_booking.models import Booking, BookingStatus, PayStatus
+from player_competition.models import ChallengePlayerBooking
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Constants
+# ─────────────────────────────────────────────────────────────────────────────
+
+CURSOR_NAME = 'shamcash'
+OPEN_STATUSES = [BookingStatus.PAY, BookingStatus.CHECK_PAY]
+
+# Rows written by a concurrent scrape may land with a scraped_at slightly
+# behind the mark — re-read this much (already matched rows are excluded).
+CURSOR_OVERLAP = timedelta(minutes=2)
+
+BATCH_SIZE = 500
+
+_ARABIC_MARKS = re.compile(r'[\u064B-\u0652\u0640]')      # harakat + tatweel
+_ARABIC_FOLD = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ة': 'ه', 'ى': 'ي', 'ؤ': 'و', 'ئ': 'ي'})
+_NON_WORD = re.compile(r'[^\w]+')
+_PHONE = re.compile(r'(?:\+?963|0)?(9\d{8})')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _tolerance() -> Decimal:
+    return Decimal(str(getattr(settings, 'PAYMENT_MATCH_TOLERANCE', 0)))
+
+
+def _name_tokens(name: str) -> frozenset:
+    name = _ARABIC_MARKS.sub('', (name or '').lower()).translate(_ARABIC_FOLD)
+    return frozenset(t for t in _NON_WORD.split(name) if len(t) > 1)
+
+
+def _phones_in(text: str) -> set:
+    """'0933 123 456' / '+963-933123456' → {'0933123456'}"""
+    compact = re.sub(r'(?<=\d)[\s\-]+(?=\d)', '', text or '')
+    return {f'0{number}' for number in _PHONE.findall(compact)}
+
+
+def _same_person(tx_tokens: frozenset, player_tokens: frozenset) -> bool:
+    """All tokens of the shorter name appear in the longer one, at least two of them."""
+    if not tx_tokens or not player_tokens:
+        return False
+    shorter, longer = sorted((tx_tokens, player_tokens), key=len)
+    return len(shorter) >= 2 and shorter <= longer
+
+
+@dataclass
+class _OpenBooking:
+    id: object
+    reference: str                               # first 8 hex chars of the booking id
+    payers: list = field(default_factory=list)   # [(name tokens, phone)]
+
+
+@dataclass
+class _Decision:
+    status: int
+    reason: str
+    booking_id: object = None
+    paid_in_full: bool = True
+    candidates: list = field(default_factory=list)
+
+
+class _OpenBookingIndex:
+    """
+    {bucket: [(expected amount, paid_in_full, _OpenBooking)]}
+    bucket = amount // width, width = tolerance (or 1) → a lookup reads 3 buckets.
+    """
+
+    def __init__(self, tolerance: Decimal):
+        self.tolerance = tolerance
+        self.width = tolerance if tolerance > 0 else Decimal('1')
+        self.buckets = defaultdict(list)
+        self.consumed = set()
+
+    def add(self, amount, paid_in_full, booking: _OpenBooking):
+        if amount:
+            self.buckets[int(amount // self.width)].append((amount, paid_in_full, booking))
+
+    def candidates(self, amount) -> list:
+        key = int(amount // self.width)
+        found = {}
+        for bucket in (key - 1, key, key + 1):
+            for expected, paid_in_full, booking in self.buckets.get(bucket, ()):
+                if booking.id in self.consumed or abs(expected - amount) > self.tolerance:
+                    continue
+                # Full payment wins over a deposit of the same booking
+                if booking.id not in found or paid_in_full:
+                    found[booking.id] = (booking, paid_in_full, expected == amount)
+        return list(found.values())
+
+
+def _build_index(since_date) -> _OpenBookingIndex:
+    """2 queries — open bookings with their player, then challenge players."""
+    index = _OpenBookingIndex(_tolerance())
+
+    rows = list(
+        Booking.objects
+        .filter(status__in=OPEN_STATUSES, date__gte=since_date)
+        .values('id', 'final_price', 'deposit', 'payment_status', 'is_challenge',
+                'player__full_name', 'player__phone')
+    )
+    bookings = {}
+    for row in rows:
+        booking = _OpenBooking(id=row['id'], reference=row['id'].hex[:8])
+        if row['player__phone']:
+            booking.payers.append((_name_tokens(row['player__full_name']), row['player__phone']))
+        bookings[row['id']] = booking
+
+        index.add(row['final_price'], True, booking)
+        if row['payment_status'] == PayStatus.DEPOSIT_ONLINE and row['deposit']:
+            index.add(row['deposit'], False, booking)
+
+    challenge_ids = [row['id'] for row in rows if row['is_challenge']]
+    if challenge_ids:
+        players = (
+            ChallengePlayerBooking.objects
+            .filter(booking_id__in=challenge_ids)
+            .values_list('booking_id', 'player__full_name', 'player__phone')
+        )
+        for booking_id, full_name, phone in players:
+            bookings[booking_id].payers.append((_name_tokens(full_name), phone))
+
+    return index
+
+
+def _decide(tx: Transaction, index: _OpenBookingIndex) -> _Decision:
+    candidates = index.candidates(tx.amount)
+    if not candidates:
+        return _Decision(PaymentMatch.Status.UNMATCHED, 'no_candidate')
+
+    candidate_ids = [str(booking.id) for booking, _, _ in candidates]
+    notes = (tx.notes or '').lower()
+    tx_tokens = _name_tokens(tx.name)
+    tx_phones = _phones_in(tx.notes)
+
+    by_reference = [c for c in candidates if c[0].reference in notes]
+    by_identity = [
+        c for c in candidates
+        if any(phone in tx_phones or _same_person(tx_tokens, tokens) for tokens, phone in c[0].payers)
+    ]
+
+    for reason, hits in (('reference', by_reference), ('identity', by_identity)):
+        if len(hits) == 1:
+            booking, paid_in_full, _ = hits[0]
+            return _Decision(PaymentMatch.Status.MATCHED, reason, booking.id, paid_in_full, candidate_ids)
+        if len(hits) > 1:
+            return _Decision(PaymentMatch.Status.REVIEW, 'ambiguous', candidates=candidate_ids)
+
+    if len(candidates) == 1:
+        booking, paid_in_full, exact = candidates[0]
+        status = (
+            PaymentMatch.Status.MATCHED
+            if exact and getattr(settings, 'PAYMENT_MATCH_AMOUNT_ONLY', False)
+            else PaymentMatch.Status.REVIEW
+        )
+        return _Decision(status, 'amount_only', booking.id, paid_in_full, candidate_ids)
+
+    return _Decision(PaymentMatch.Status.REVIEW, 'ambiguous', candidates=candidate_ids)
+
+
+def _notify_paid(bookings):
+    for booking in bookings:
+        if booking.is_challenge:
+            users = [cp.player for cp in ChallengePlayerBooking.objects.select_related('player').filter(booking_id=booking.id)]
+        else:
+            users = [booking.player] if booking.player_id else []
+
+        for user in users:
+            NotificationService.send_notification(
+                user=user,
+                title='تم تأكيد الدفع',
+                body=f'تم استلام دفعتك للحجز بتاريخ {booking.date} من الساعة {booking.start_time.strftime("%H:%M")}',
+                notification_type='Booking_status',
+                helper_id=booking.id,
+            )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Public API
+# ─────────────────────────────────────────────────────────────────────────────
+
+def reconcile_payments(batch_size: int = BATCH_SIZE) -> dict:
+    """Consume the next batch of incoming transactions. Returns counts per outcome."""
+    lookback = timezone.localdate() - timedelta(days=getattr(settings, 'PAYMENT_MATCH_LOOKBACK_DAYS', 3))
+    cursor, _ = ReconciliationCursor.objects.get_or_create(name=CURSOR_NAME)
+
+    qs = (
+        Transaction.objects
+        .filter(direction=Transaction.Direction.IN, date__gte=lookback)
+        .exclude(Exists(PaymentMatch.objects.filter(transaction_id=OuterRef('pk'))))
+        .order_by('scraped_at', 'tx_id')
+    )
+    if cursor.scraped_at:
+        qs = qs.filter(scraped_at__gte=cursor.scraped_at - CURSOR_OVERLAP)
+    txs = list(qs[:batch_size])
+    if not txs:
+        return {}
+
+    index = _build_index(lookback)
+    decisions = {}
+    for tx in txs:
+        decision = _decide(tx, index)
+        if decision.status == PaymentMatch.Status.MATCHED:
+            index.consumed.add(decision.booking_id)
+        decisions[tx.tx_id] = decision
+
+    with transaction.atomic():
+        matched = {
+            d.booking_id: d.paid_in_full
+            for d in decisions.values() if d.status == PaymentMatch.Status.MATCHED
+        }
+        confirmed = BookingService.confirm_online_payments(matched) if matched else []
+        confirmed_ids = {booking.pk for booking in confirmed}
+
+        rows = []
+        for tx in txs:
+            d = decisions[tx.tx_id]
+            if d.status == PaymentMatch.Status.MATCHED and d.booking_id not in confirmed_ids:
+                # Left PAY / CHECK_PAY between the index read and the lock
+                d.status, d.reason = PaymentMatch.Status.REVIEW, 'booking_changed'
+            rows.append(PaymentMatch(
+                transaction=tx,
+                booking_id=d.booking_id,
+                status=d.status,
+                reason=d.reason,
+                candidates=d.candidates,
+                paid_in_full=d.paid_in_full,
+            ))
+        PaymentMatch.objects.bulk_create(rows, ignore_conflicts=True)
+
+        cursor.scraped_at = max(filter(None, (cursor.scraped_at, txs[-1].scraped_at)))
+        cursor.save(update_fields=['scraped_at', 'updated_at'])
+
+    _notify_paid(confirmed)
+
+    counts = defaultdict(int)
+    for row in rows:
+        counts[PaymentMatch.Status(row.status).name.lower()] += 1
+    return dict(counts)
+
+
+@transaction.atomic
+def resolve_review(transaction_id, booking_id, done_by, paid_in_full=True) -> PaymentMatch:
+    """Staff confirms a queued transaction against a booking."""
+    match = PaymentMatch.objects.select_for_update().get(pk=transaction_id)
+    if match.status not in (PaymentMatch.Status.REVIEW, PaymentMatch.Status.UNMATCHED):
+        raise ValidationError({"error": "تمت معالجة هذه الدفعة مسبقاً."})
+
+    confirmed = BookingService.confirm_online_payments({booking_id: paid_in_full})
+    if not confirmed:
+        raise ValidationError({"error": "الحجز ليس بانتظار الدفع."})
+
+    match.booking_id = booking_id
+    match.paid_in_full = paid_in_full
+    match.status = PaymentMatch.Status.RESOLVED
+    match.resolved_at = timezone.now()
+    match.resolved_by = str(done_by)
+    match.save(update_fields=['booking', 'paid_in_full', 'status', 'resolved_at', 'resolved_by'])
+
+    transaction.on_commit(lambda: _notify_paid(confirmed))
+    return match
+
+
+def dismiss_review(transaction_ids, done_by) -> int:
+    """Staff marks queued transactions as not booking payments."""
+    return PaymentMatch.objects.filter(
+        pk__in=transaction_ids,
+        status__in=[PaymentMatch.Status.REVIEW, PaymentMatch.Status.UNMATCHED],
+    ).update(
+        status=PaymentMatch.Status.DISMISSED,
+        resolved_at=timezone.now(),
+        resolved_by=str(done_by),
+    )
@@ -0,0 +1,42 @@
+"""
+Keeps ClubPayoutBalance.sent_total in sync with ClubPayout rows.
+
+  payout created         → add its amount
+  amount / club edited   → move the difference (admin edits)
+  payout deleted         → subtract its amount
+
+collected_total follows bookings — see signals_daily_revenue.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from management.models import ClubPayout
+from management.services.ClubPayoutService import apply_sent
+
+
+@receiver(pre_save, sender=ClubPayout, dispatch_uid="club_payout_balance_pre_save")
+def club_payout_balance_pre_save(sender, instance, **kwargs):
+    instance._balance_old = (
+        ClubPayout.objects
+        .filter(pk=instance.pk)
+        .values_list("club_id", "amount")
+        .first()
+    )
+
+
+@receiver(post_save, sender=ClubPayout, dispatch_uid="club_payout_balance_post_save")
+def club_payout_balance_saved(sender, instance, created, **kwargs):
+    old = getattr(instance, "_balance_old", None)
+    if old == (instance.club_id, instance.amount):
+        return
+
+    with transaction.atomic():
+        if old:
+            apply_sent(old[0], -old[1])
+        apply_sent(instance.club_id, instance.amount)
+
+
+@receiver(post_delete, sender=ClubPayout, dispatch_uid="club_payout_balance_post_delete")
+def club_payout_balance_deleted(sender, instance, **kwargs):
+    apply_sent(instance.club_id, -instance.amount)
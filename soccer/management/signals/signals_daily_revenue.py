@@ -0,0 +1,47 @@
+"""
+Keeps club_daily_online_revenue — and through it ClubPayoutBalance.collected_total —
+in sync with the bookings it aggregates.
+
+  Booking saved   → remove its old contribution, add the new one
+                    (only when (club, day, status, revenue, collected) changed)
+  Booking deleted → remove its contribution
+
+The contribution is read back from the database on both sides of the save,
+so coupon and payment fields count exactly as the report defines them.
+Bulk .update() calls bypass signals — apply the change with
+DailyRevenueService.apply_changes (as the booking admin actions do), or run
+`rebuild_daily_revenue` after them.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from management.services.DailyRevenueService import apply, booking_contribution
+from player_booking.models import Booking
+
+
+@receiver(pre_save, sender=Booking, dispatch_uid="daily_revenue_pre_save")
+def daily_revenue_pre_save(sender, instance, **kwargs):
+    instance._revenue_old = booking_contribution(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=Booking, dispatch_uid="daily_revenue_post_save")
+def daily_revenue_post_save(sender, instance, created, **kwargs):
+    old = getattr(instance, "_revenue_old", None)
+    new = booking_contribution(instance.pk)
+    if old == new:
+        return
+
+    with transaction.atomic():
+        apply(old, multiplier=-1)
+        apply(new)
+
+
+@receiver(pre_delete, sender=Booking, dispatch_uid="daily_revenue_pre_delete")
+def daily_revenue_pre_delete(sender, instance, **kwargs):
+    instance._revenue_old = booking_contribution(instance.pk)
+
+
+@receiver(post_delete, sender=Booking, dispatch_uid="daily_revenue_post_delete")
+def daily_revenue_post_delete(sender, instance, **kwargs):
+    apply(getattr(instance, "_revenue_old", None), multiplier=-1)
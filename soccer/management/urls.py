@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ClubPayoutSummaryView, ClubRevenueView, RecordPayoutView
+from .views import ClubPayoutHistoryView, ClubPayoutSummaryView, ClubRevenueView, RecordPayoutView
 
 
 router = DefaultRouter()
@@ -9,5 +9,6 @@ urlpatterns = [
     path('', include(router.urls)),
     path("club-revenue/", ClubRevenueView.as_view(), name="club-revenue"),
     path('club-payouts/',        ClubPayoutSummaryView.as_view()),
+    path('club-payouts/<uuid:club_id>/history/', ClubPayoutHistoryView.as_view()),
     # path('club-payouts/record/', RecordPayoutView.as_view()),
 ]
\ No newline at end of file
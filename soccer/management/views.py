@@ -1,40 +1,70 @@
 from rest_framework.views import APIView
+from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 from rest_framework import status
 
-from .services.ClubPayoutService import get_clubs_payout_summary, record_payout
+from core.replica import UseReplicaMixin
+
+from .exports import export_response
+from .pagination import PayoutHistoryPagination
+from .services.ClubPayoutService import (
+    PAYOUT_EXPORT_HEADER,
+    PAYOUT_HISTORY_EXPORT_HEADER,
+    get_club_payout_history,
+    get_clubs_payout_summary,
+    iter_club_payout_history_rows,
+    iter_clubs_payout_rows,
+    record_payout,
+)
 from .serializers import (
     RecordPayoutSerializer,
     ClubPayoutFilterSerializer,
+    ClubPayoutHistorySerializer,
 )
 from .serializers import ClubRevenueFilterSerializer
-from .services.ClubRevenueService import get_clubs_revenue
+from .services.ClubRevenueService import REVENUE_EXPORT_HEADER, get_clubs_revenue, iter_clubs_revenue_rows
 
 
-class ClubRevenueView(APIView):
+class ClubRevenueView(UseReplicaMixin, APIView):
+    """
+    GET  /api/management/club-revenue/
+        ?date_from=  &date_to=  &club_name=  &governorate=  &export=csv|xlsx
+    """
 
     def get(self, request):
         serializer = ClubRevenueFilterSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
+        d = serializer.validated_data
 
-        data = get_clubs_revenue(
-            date_from   = serializer.validated_data['date_from'],
-            date_to     = serializer.validated_data['date_to'],
-            club_name   = serializer.validated_data.get('club_name'),
-            governorate = serializer.validated_data.get('governorate'),
+        filters = dict(
+            date_from   = d['date_from'],
+            date_to     = d['date_to'],
+            club_name   = d.get('club_name'),
+            governorate = d.get('governorate'),
         )
 
+        if d.get('export'):
+            return export_response(
+                d['export'],
+                f"club-revenue_{d['date_from']}_{d['date_to']}",
+                REVENUE_EXPORT_HEADER,
+                iter_clubs_revenue_rows(**filters),
+            )
+
+        data = get_clubs_revenue(**filters)
+
         return Response(data, status=status.HTTP_200_OK)
     
 
 
 
 
-class ClubPayoutSummaryView(APIView):
+class ClubPayoutSummaryView(UseReplicaMixin, APIView):
     """
     GET  /api/management/club-payouts/
-        ?club_name=  &governorate=
+        ?club_name=  &governorate=  &date_from=  &date_to=  &export=csv|xlsx
     Returns all clubs with collected / sent / owed amounts.
+    The payouts of a club: ClubPayoutHistoryView.
     """
 
     def get(self, request):
@@ -42,14 +72,53 @@ class ClubPayoutSummaryView(APIView):
         serializer.is_valid(raise_exception=True)
         d = serializer.validated_data
 
-        data = get_clubs_payout_summary(
+        filters = dict(
             club_name   = d.get('club_name'),
             governorate = d.get('governorate'),
-            date_from   = d.get('date_from'),    # ← add
-            date_to     = d.get('date_to'),      # ← add
+            date_from   = d.get('date_from'),
+            date_to     = d.get('date_to'),
         )
+
+        if d.get('export'):
+            return export_response(d['export'], 'club-payouts', PAYOUT_EXPORT_HEADER, iter_clubs_payout_rows(**filters))
+
+        data = get_clubs_payout_summary(**filters)
         return Response(data, status=status.HTTP_200_OK)
 
+
+class ClubPayoutHistoryView(UseReplicaMixin, ListAPIView):
+    """
+    GET  /api/management/club-payouts/<club_id>/history/
+        ?date_from=  &date_to=  &page=  &page_size=  &export=csv|xlsx
+    One club's payouts, newest first.
+    """
+    serializer_class = ClubPayoutHistorySerializer
+    pagination_class = PayoutHistoryPagination
+
+    def _filters(self) -> dict:
+        serializer = ClubPayoutFilterSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def get(self, request, *args, **kwargs):
+        d = self._filters()
+        if d.get('export'):
+            return export_response(
+                d['export'],
+                f"club-payouts_{self.kwargs['club_id']}",
+                PAYOUT_HISTORY_EXPORT_HEADER,
+                iter_club_payout_history_rows(self.kwargs['club_id'], d.get('date_from'), d.get('date_to')),
+            )
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        d = self._filters()
+        return get_club_payout_history(
+            club_id   = self.kwargs['club_id'],
+            date_from = d.get('date_from'),
+            date_to   = d.get('date_to'),
+        )
+
 class RecordPayoutView(APIView):
     """
     POST /api/management/club-payouts/record/
@@ -3,6 +3,11 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from .models import Booking, Review, BookingStatus, BookingEquipment, Coupon, CouponUsage
+from django.db import transaction
+from dashboard_booking.services.OccupancyService import OccupancyService
+from dashboard_booking.services.EquipmentLedgerService import EquipmentLedgerService
+from management.services.DailyRevenueService import apply_changes, booking_contributions
+from soccer.enm import BOOKING_STATUS_DENIED
 
 
 @admin.register(Coupon)
@@ -97,17 +102,33 @@ class BookingEquipmentAdmin(admin.ModelAdmin):
         return qs.select_related('booking', 'equipment', 'equipment__club', 'equipment__equipment')
 
 
+@transaction.atomic
+def _bulk_update_status(queryset, status):
+    # .update() skips the signals — refresh the occupancy bitmaps, the equipment
+    # ledger, the daily revenue facts and the clubs' payout balances by hand
+    rows = list(queryset.values_list('pk', 'status', 'pitch_id', 'date', 'start_time', 'end_time'))
+    booking_ids = [pk for pk, *_ in rows]
+    revenue_old = booking_contributions(booking_ids)
+    queryset.update(status=status)
+    OccupancyService.rebuild_many({(pitch_id, date) for _pk, _old, pitch_id, date, _start, _end in rows})
+    apply_changes(revenue_old, booking_contributions(booking_ids))
+
+    is_active = status in BOOKING_STATUS_DENIED
+    for pk, old_status, _pitch_id, date, start_time, end_time in rows:
+        if (old_status in BOOKING_STATUS_DENIED) != is_active:
+            EquipmentLedgerService.apply_booking(pk, date, start_time, end_time, multiplier=1 if is_active else -1)
+
 @admin.action(description=_('Mark selected bookings as Completed'))
 def mark_completed(modeladmin, request, queryset):
-    queryset.update(status=BookingStatus.COMPLETED)
+    _bulk_update_status(queryset, BookingStatus.COMPLETED)
 
 @admin.action(description=_('Mark selected bookings as Canceled'))
 def mark_canceled(modeladmin, request, queryset):
-    queryset.update(status=BookingStatus.CANCELED)
+    _bulk_update_status(queryset, BookingStatus.CANCELED)
 
 @admin.action(description=_('Mark selected bookings as Rejected'))
 def mark_rejected(modeladmin, request, queryset):
-    queryset.update(status=BookingStatus.REJECT)
+    _bulk_update_status(queryset, BookingStatus.REJECT)
 
 
 @admin.register(Booking)
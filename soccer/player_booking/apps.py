@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PlayerBookingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'player_booking'
+
+    def ready(self):
+        import player_booking.signals.signals_club_card
@@ -0,0 +1,17 @@
+"""
+python manage.py rebuild_club_cards
+
+Recomputes every ClubCard from the clubs, features and tags tables. Needed
+after bulk Club / Feature / Tag .update() calls, which bypass the signals.
+"""
+from django.core.management.base import BaseCommand
+
+from player_booking.services.ClubCardService import ClubCardService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the precomputed club list cards."
+
+    def handle(self, *args, **options):
+        count = ClubCardService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} club cards."))
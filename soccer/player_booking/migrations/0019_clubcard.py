@@ -0,0 +1,100 @@
+# Generated by Django 5.2.10 on 2026-10-19 18:05
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+def _decimal(value, places):
+    return f'{value.quantize(Decimal(1).scaleb(-places)):f}'
+
+
+def backfill_cards(apps, schema_editor):
+    """One ClubCard per club — the ClubCardSourceSerializer output of the time, frozen."""
+    Club = apps.get_model('dashboard_manage', 'Club')
+    Feature = apps.get_model('management', 'Feature')
+    ClubCard = apps.get_model('player_booking', 'ClubCard')
+
+    tags = {}
+    features = (
+        Feature.objects.filter(is_active=True)
+        .order_by('-created_at')
+        .values_list('club_id', 'tag__name', 'tag__logo')
+    )
+    for club_id, name, logo in features.iterator():
+        tags.setdefault(club_id, []).append({'name': name, 'logo': logo or None})
+
+    cards = []
+    for club in Club.objects.iterator():
+        cards.append(ClubCard(
+            club_id=club.id,
+            is_active=club.is_active,
+            governorate=club.governorate,
+            search_name=' '.join(club.name.split()).casefold(),
+            created_at=club.created_at,
+            card={
+                'id': str(club.id),
+                'name': club.name,
+                'description': club.description,
+                'address': club.address,
+                'latitude': _decimal(club.latitude, 6),
+                'longitude': _decimal(club.longitude, 6),
+                'open_time': club.open_time.isoformat(),
+                'close_time': club.close_time.isoformat(),
+                'rating_avg': _decimal(club.rating_avg, 2),
+                'rating_count': club.rating_count,
+                'flexible_reservation': club.flexible_reservation,
+                'governorate': str(club.get_governorate_display()),
+                'logo': club.logo.name or None,
+                'tags': tags.get(club.id, []),
+            },
+        ))
+    ClubCard.objects.bulk_create(cards, batch_size=500)
+
+
+def add_trigram_index(apps, schema_editor):
+    # ?search= is a substring match — on PostgreSQL a trigram GIN index serves it;
+    # elsewhere the table is small enough per governorate for the plain scan
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS club_card_search_trgm '
+        'ON club_cards USING gin (search_name gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS club_card_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_manage', '0020_alter_club_governorate'),
+        ('management', '0006_clubpayoutbalance'),
+        ('player_booking', '0018_booking_booking_player_created_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClubCard',
+            fields=[
+                ('club', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='dashboard_manage.club')),
+                ('is_active', models.BooleanField(default=True)),
+                ('governorate', models.PositiveSmallIntegerField()),
+                ('search_name', models.CharField(max_length=200)),
+                ('created_at', models.DateTimeField()),
+                ('card', models.JSONField(default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'club_cards',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['is_active', 'governorate', '-created_at'], name='club_card_list')],
+            },
+        ),
+        migrations.RunPython(backfill_cards, migrations.RunPython.noop),
+        migrations.RunPython(add_trigram_index, drop_trigram_index),
+    ]
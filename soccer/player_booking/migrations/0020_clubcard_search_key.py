@@ -0,0 +1,40 @@
+# Generated by Django 5.2.10 on 2026-10-19 19:10
+
+import re
+import unicodedata
+
+from django.db import migrations
+
+_ARABIC_MARKS = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+_ARABIC_FOLD = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ئ': 'ي', 'ؤ': 'و', 'ة': 'ه',
+})
+_SEPARATORS = re.compile(r'[\W_]+')
+
+
+def search_key(text):
+    """core.search.search_key at the time of this migration."""
+    text = unicodedata.normalize('NFKC', str(text or ''))
+    text = _ARABIC_MARKS.sub('', text).translate(_ARABIC_FOLD).casefold()
+    return ' '.join(word for word in _SEPARATORS.split(text) if word)
+
+
+def rekey_club_cards(apps, schema_editor):
+    """ClubCard.search_name moves from a casefolded name to the core.search key."""
+    ClubCard = apps.get_model('player_booking', 'ClubCard')
+    cards = list(ClubCard.objects.select_related('club').only('club_id', 'search_name', 'club__name'))
+    for card in cards:
+        card.search_name = search_key(card.club.name)[:200]
+    ClubCard.objects.bulk_update(cards, ['search_name'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player_booking', '0019_clubcard'),
+    ]
+
+    operations = [
+        migrations.RunPython(rekey_club_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard_manage', '0020_alter_club_governorate'),
+        ('player_booking', '0020_clubcard_search_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['club', 'date', 'start_time'], name='booking_club_date'),
+        ),
+    ]
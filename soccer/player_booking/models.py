@@ -2,6 +2,7 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import RegexValidator
+from django.core.exceptions import ValidationError
 from core.models import User
 from dashboard_manage.models import Pitch, ClubEquipment, Equipment
 from dashboard_manage.models import Club
@@ -58,6 +59,16 @@ class Coupon(models.Model):
     )
 
 
+    def clean(self):
+        super().clean()
+        # Over 100% makes the price negative; at 100% the revenue report
+        # falls back to Booking.price (ClubRevenueService._original_price)
+        if self.discount_type == 'percentage' and self.discount_value is not None:
+            try:
+                MaxValueValidator(100)(self.discount_value)
+            except ValidationError as e:
+                raise ValidationError({'discount_value': e.error_list})
+
     def is_valid(self):
         if not self.is_active:
             return False
@@ -132,6 +143,7 @@ class Booking(models.Model):
             models.Index(fields=['player_id', 'created_at']),
             models.Index(fields=['pitch', 'date']),
             models.Index(fields=['pitch', 'date','start_time']),
+            models.Index(fields=['club', 'date', 'start_time'], name='booking_club_date'),
             models.Index(fields=['player']),
             models.Index(fields=['status']),
             models.Index(
@@ -178,3 +190,29 @@ class BookingEquipment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+
+
+class ClubCard(models.Model):
+    """
+    Precomputed ActiveClubListAPIView row — one per club, kept current by
+    player_booking/signals/signals_club_card.py. `card` holds the list
+    fields already formatted; images are kept as storage names and turned
+    into URLs per request.
+    """
+    club        = models.OneToOneField(Club, on_delete=models.CASCADE, primary_key=True, related_name='card')
+    is_active   = models.BooleanField(default=True)
+    governorate = models.PositiveSmallIntegerField()
+    search_name = models.CharField(max_length=200)    # casefolded name — ?search=
+    created_at  = models.DateTimeField()              # the club's — list order
+    card        = models.JSONField(default=dict)
+    updated_at  = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'club_cards'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active', 'governorate', '-created_at'], name='club_card_list'),
+        ]
+
+    def __str__(self):
+        return f"{self.club_id} {self.search_name}"
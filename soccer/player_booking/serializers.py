@@ -3,17 +3,18 @@ from django.utils import timezone
 from dashboard_manage.models import Club, ClubPricing, Pitch, ClubDeposit
 from management.models import Feature
 from core.services.notification_service import NotificationService
-from soccer.enm import BOOKING_STATUS_DENIED
 from  player_booking.models import Booking, BookingStatus, Coupon, PayStatus, BookingEquipment,Review
 from django.db import transaction
 from django.conf import settings
 from core.services.CouponService import CouponService
 from dashboard_booking.services.PricingService import PricingService
 from dashboard_booking.services.EquipmentBookingService import EquipmentBookingService
+from dashboard_booking.services.SlotReservationService import SlotReservationService
 from player_competition.models import Challenge
 from itertools import groupby
 from player_competition.models import ChallengePlayerBooking
-from soccer.settings import MEDIA_URL
+from core.media import MediaURLField, media_url, media_urls
+from core.thumbnails import LOGO, ThumbnailURLField, thumb_url
 from datetime import datetime, date, timedelta
 from .services.BookingHistoryService import UserBookingItem
 
@@ -56,7 +57,7 @@ class PlayerInChallengeSerializer(serializers.Serializer):
     def get_image(self, obj):
         request = self.context.get('request')
         if obj.player.image:
-            return request.build_absolute_uri(obj.player.image.url) if request else obj.player.image.url
+            return media_url(obj.player.image, request)
         return None
 
 
@@ -69,7 +70,7 @@ class TeamInChallengeSerializer(serializers.Serializer):
     def get_logo(self, obj):
         request = self.context.get('request')
         if obj.logo and obj.logo.logo:
-            return request.build_absolute_uri(obj.logo.logo.url) if request else obj.logo.logo.url
+            return media_url(obj.logo.logo, request)
         return None
 
     # def get_players(self, obj):
@@ -332,9 +333,7 @@ class UserBookingSerializer(serializers.Serializer):
         request = self.context.get('request')
 
         def logo_url(path):
-            if not path:
-                return None
-            return request.build_absolute_uri(MEDIA_URL+f'{path}')
+            return media_url(path, request)
 
         return {
             'id':                     obj.challenge_id,
@@ -436,11 +435,13 @@ class EquipmentAvailabilityQueryForUserSerializer(serializers.Serializer):
 
 class TagSerializer(serializers.Serializer):
     name = serializers.CharField()
-    logo = serializers.ImageField()
+    logo = MediaURLField()
 
 
 class ClubListSerializer(serializers.ModelSerializer):
     tags = serializers.SerializerMethodField()
+    logo = MediaURLField()
+    logo_thumb_url = ThumbnailURLField(source='logo', size=LOGO)
     governorate = serializers.CharField(source='get_governorate_display')
 
 
@@ -456,6 +457,7 @@ class ClubListSerializer(serializers.ModelSerializer):
             "open_time",
             "close_time",
             "logo",
+            "logo_thumb_url",
             "rating_avg",
             "rating_count",
             "flexible_reservation",
@@ -476,6 +478,48 @@ class ClubListSerializer(serializers.ModelSerializer):
         return TagSerializer([f.tag for f in features], many=True, context=self.context).data
 
 
+class ClubCardSourceSerializer(serializers.ModelSerializer):
+    """The ClubListSerializer fields that don't depend on the request — stored in ClubCard.card."""
+    governorate = serializers.CharField(source='get_governorate_display')
+
+    class Meta:
+        model = Club
+        fields = [
+            "id",
+            "name",
+            "description",
+            "address",
+            "latitude",
+            "longitude",
+            "open_time",
+            "close_time",
+            "rating_avg",
+            "rating_count",
+            "flexible_reservation",
+            "governorate",
+        ]
+
+
+class ClubCardSerializer(serializers.BaseSerializer):
+    """ClubListSerializer output served from a precomputed ClubCard — same keys, same order."""
+
+    def to_representation(self, instance):
+        request = self.context.get('request')
+        urls = media_urls(request)
+        card = instance.card
+        data = {}
+        for field in ClubListSerializer.Meta.fields:
+            if field == 'logo':
+                data[field] = urls(card['logo'])
+            elif field == 'logo_thumb_url':
+                data[field] = thumb_url(card['logo'], LOGO, request)
+            elif field == 'tags':
+                data[field] = [{'name': tag['name'], 'logo': urls(tag['logo'])} for tag in card['tags']]
+            else:
+                data[field] = card[field]
+        return data
+
+
 class ClubIDFilterSerializer(serializers.Serializer):
     club_id = serializers.UUIDField(
         error_messages={
@@ -597,24 +641,11 @@ class BookingCreateForUserSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({"error": "هذا الملعب لا ينتمي لهذا النادي."})
         print("//////////////////////////")
 
-        # Check for overlapping bookings
-        pitch = attrs['pitch']
         date = attrs['date']
         start_time = attrs['start_time']
         end_time = attrs['end_time']
 
-        overlapping = Booking.objects.filter(
-            pitch=pitch,
-            date=date,
-            status__in=BOOKING_STATUS_DENIED
-        ).filter(
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        ).exists()
-
-        if overlapping:
-            raise serializers.ValidationError({"error": "هذا الوقت يتداخل مع حجز موجود."})
-
+        # Pitch overlap is checked in create() under the (pitch, date) lock
         #with the user himself
         player = self.context['request'].user
         overlapping = Booking.objects.filter(
@@ -658,6 +689,8 @@ class BookingCreateForUserSerializer(serializers.ModelSerializer):
 
 
         with transaction.atomic():
+            SlotReservationService.ensure_slot_free(validated_data['pitch'].id, validated_data['date'],
+                                                    validated_data['start_time'], validated_data['end_time'])
             booking = Booking.objects.create(
                 club_id=club_id,
                 player_id=user_id,
@@ -0,0 +1,85 @@
+from django.db import transaction
+
+from core import search
+from dashboard_manage.models import Club
+from management.models import Feature
+from player_booking.models import ClubCard
+
+
+class ClubCardService:
+    """
+    Keeps club_cards — one precomputed ActiveClubListAPIView row per club.
+
+    card = ClubCardSourceSerializer(club) + the logo and active tags, with
+    images as storage names (URLs depend on the request host).
+
+    Refreshed by player_booking/signals/signals_club_card.py on Club, Feature
+    and Tag writes — a new Review reaches it through the Club rating save.
+    Bulk .update() calls bypass the signals: call refresh() after them, or
+    `python manage.py rebuild_club_cards`.
+    """
+
+    CLUB_FIELDS = (
+        'id', 'name', 'description', 'address', 'latitude', 'longitude',
+        'open_time', 'close_time', 'logo', 'rating_avg', 'rating_count',
+        'flexible_reservation', 'governorate', 'is_active', 'created_at',
+    )
+
+    @staticmethod
+    def _tags_by_club(club_ids) -> dict:
+        tags = {}
+        features = (
+            Feature.objects
+            .filter(club_id__in=club_ids, is_active=True)
+            .order_by('-created_at')
+            .values_list('club_id', 'tag__name', 'tag__logo')
+        )
+        for club_id, name, logo in features:
+            tags.setdefault(club_id, []).append({'name': name, 'logo': logo or None})
+        return tags
+
+    @staticmethod
+    def _card(club, tags) -> ClubCard:
+        from player_booking.serializers import ClubCardSourceSerializer
+
+        card = dict(ClubCardSourceSerializer(club).data)
+        card['logo'] = club.logo.name or None
+        card['tags'] = tags
+        return ClubCard(
+            club_id=club.id,
+            is_active=club.is_active,
+            governorate=club.governorate,
+            search_name=search.search_key(club.name)[:200],
+            created_at=club.created_at,
+            card=card,
+        )
+
+    @classmethod
+    def refresh(cls, club_ids) -> None:
+        """Recompute the cards of club_ids — two reads and one upsert."""
+        club_ids = list(club_ids)
+        if not club_ids:
+            return
+        clubs = Club.objects.filter(id__in=club_ids).only(*cls.CLUB_FIELDS)
+        tags = cls._tags_by_club(club_ids)
+        cards = [cls._card(club, tags.get(club.id, [])) for club in clubs]
+        # A deleted club's card already went with the CASCADE
+        ClubCard.objects.bulk_create(
+            cards,
+            update_conflicts=True,
+            unique_fields=['club'],
+            update_fields=['is_active', 'governorate', 'search_name', 'created_at', 'card', 'updated_at'],
+        )
+        search.changed(ClubCard)
+
+    @classmethod
+    def refresh_on_commit(cls, club_ids) -> None:
+        club_ids = set(club_ids)
+        transaction.on_commit(lambda: cls.refresh(club_ids))
+
+    @classmethod
+    def rebuild(cls, batch_size: int = 500) -> int:
+        club_ids = list(Club.objects.values_list('id', flat=True))
+        for i in range(0, len(club_ids), batch_size):
+            cls.refresh(club_ids[i:i + batch_size])
+        return len(club_ids)
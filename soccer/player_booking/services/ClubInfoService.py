@@ -1,6 +1,5 @@
 from dashboard_manage.models import Club, ClubPricing
-from player_booking.models import Booking
-from soccer.enm import BOOKING_STATUS_DENIED
+from dashboard_booking.services.OccupancyService import OccupancyService
 from django.db.models import Q
 
 class ClubInfoService:
@@ -8,32 +7,23 @@ class ClubInfoService:
     def get_free_booking_time(cls, pitch_id, club_id, date):
         """Process the validated data"""
 
+        # Booked intervals come from the pitch's occupancy bitmap (one row read)
+        booked = OccupancyService.booked_intervals(pitch_id, date)
 
-        bookings = Booking.objects.only('start_time', 'end_time').filter(
-            pitch_id=pitch_id,
-            club_id=club_id,
-            date=date,
-            status__in=BOOKING_STATUS_DENIED
-        ).order_by('start_time')
-        
-        # consolidated_slots = self._consolidate_time_slots(bookings)
-        
-        # return Response(consolidated_slots)
         open_time, close_time=cls.get_open_close_time_club(club_id, date)
-        free_slots = cls.get_free_slots(bookings, day_start=open_time, day_end=close_time)
+        free_slots = cls.get_free_slots(booked, day_start=open_time, day_end=close_time)
 
         return free_slots
     
     @classmethod
-    def get_free_slots(cls, bookings, day_start, day_end):
+    def get_free_slots(cls, booked_intervals, day_start, day_end):
         """Return free (unbooked) time slots within the day"""
-        if not bookings.exists():
+        if not booked_intervals:
             # Whole day is free
             return [{'from': day_start.strftime('%H:%M'), 'to': day_end.strftime('%H:%M')}]
 
         # Step 1: consolidate booked slots (same logic as before)
-        time_slots = [(b.start_time, b.end_time) for b in bookings]
-        time_slots.sort(key=lambda x: x[0])
+        time_slots = sorted(booked_intervals, key=lambda x: x[0])
 
         booked = []
         current_start, current_end = time_slots[0]
@@ -3,7 +3,8 @@ from dashboard_manage.models import ClubPricing, Pitch, Club
 from django.db.models import Q
 from datetime import date, timedelta
 from rest_framework.exceptions import ValidationError
-from django.core.files.storage import default_storage
+from core.media import media_url
+from core.thumbnails import PHOTO, thumb_url
 from django.utils import timezone
 
 class ClubTimeService:
@@ -37,10 +38,7 @@ class ClubTimeService:
             - pitches: List of pitch dictionaries with adjusted prices
         """
         # Fetch all pitches for this club (ordered by type, then name)
-        pitches = Pitch.objects.filter(club_id=club_id, is_deteted=False, is_active=True).values('id', 'name', 'price_first',
-                                                                'price_second', 'time_interval', 'type',
-                                                                'size_high', 'size_width', 'image','is_active'
-                                                                ).order_by('type', 'name')  
+        pitches = cls._pitches(club_id)
         
         # Get daily configurations: for each date, get the pricing multiplier (percent) 
         # and opening/closing times based on club defaults and any exceptions
@@ -81,7 +79,8 @@ class ClubTimeService:
                     'type': pitch['type'],
                     'size_high': pitch['size_high'],
                     'size_width': pitch['size_width'],
-                    'image': request.build_absolute_uri(default_storage.url(pitch['image'])) ,
+                    'image': media_url(pitch['image'], request),
+                    'image_thumb_url': thumb_url(pitch['image'], PHOTO, request),
                     'is_active': pitch['is_active']
                 }
                 
@@ -89,7 +88,71 @@ class ClubTimeService:
 
             opening_with_prices.append(day_opening_with_prices)
         return opening_with_prices
- 
+
+    @classmethod
+    def get_opening_time_with_pitches_prices_compact(cls, club_id, number_of_day, request):
+        """
+        The same schedule with every pitch sent once (?layout=compact):
+
+            {
+              'pitches': {pitch_id: {name, type, sizes, image, base prices, ...}},
+              'days':    [{date, start_time, end_time, percent,
+                           prices: {pitch_id: [price_first, price_second]}}]
+            }
+        """
+        return cls.build_compact_schedule(
+            cls._pitches(club_id),
+            cls.get_opening_time_with_percent(club_id, number_of_day),
+            request,
+        )
+
+    @staticmethod
+    def build_compact_schedule(pitches, time_percents, request):
+        quantizer = Decimal("1.00")
+        pitches = list(pitches)
+
+        compact_pitches = {
+            str(pitch['id']): {
+                'name': pitch['name'],
+                'price_first': pitch['price_first'],
+                'price_second': pitch['price_second'],
+                'time_interval': pitch['time_interval'],
+                'type': pitch['type'],
+                'size_high': pitch['size_high'],
+                'size_width': pitch['size_width'],
+                'image': media_url(pitch['image'], request),
+                'image_thumb_url': thumb_url(pitch['image'], PHOTO, request),
+                'is_active': pitch['is_active'],
+            }
+            for pitch in pitches
+        }
+
+        days = []
+        for date_key, day_config in time_percents.items():
+            current_percent = day_config['percent']
+            days.append({
+                'date': date_key,
+                'start_time': day_config['start_time'],
+                'end_time': day_config['end_time'],
+                'percent': current_percent,
+                'prices': {
+                    str(pitch['id']): [
+                        (pitch['price_first'] * current_percent).quantize(quantizer, rounding=ROUND_HALF_UP),
+                        (pitch['price_second'] * current_percent).quantize(quantizer, rounding=ROUND_HALF_UP),
+                    ]
+                    for pitch in pitches
+                },
+            })
+
+        return {'pitches': compact_pitches, 'days': days}
+
+    @classmethod
+    def _pitches(cls, club_id):
+        return Pitch.objects.filter(club_id=club_id, is_deteted=False, is_active=True).values('id', 'name', 'price_first',
+                                                                'price_second', 'time_interval', 'type',
+                                                                'size_high', 'size_width', 'image','is_active'
+                                                                ).order_by('type', 'name')
+
     @classmethod
     def get_club_general_time(cls, club_id):
         """
@@ -3,10 +3,9 @@ from django.db.models import Q, FloatField, ExpressionWrapper, F
 from django.db.models.functions import ACos, Cos, Sin, Radians
 from dashboard_manage.models import Club
 
-from player_booking.models import Booking
 from dashboard_manage.models import ClubPricing
+from dashboard_booking.services.OccupancyService import OccupancyService
 from ..models import Pitch
-from soccer.enm import BOOKING_STATUS_DENIED
 
 
 class PitchSearchService:
@@ -76,16 +75,8 @@ class PitchSearchService:
 
     @staticmethod
     def _get_booked_pitch_ids(date, start_time, end_time):
-        return (
-            Booking.objects
-            .filter(
-                date=date,
-                status__in=BOOKING_STATUS_DENIED,
-                start_time__lt=end_time,
-                end_time__gt=start_time,
-            )
-            .values_list('pitch_id', flat=True)
-        )
+        # Bitwise test against the day's occupancy bitmaps instead of a range scan
+        return OccupancyService.busy_pitch_ids(date, start_time, end_time)
 
     # ── Private: open-day filtering ─────────────────────────────────────────
 
@@ -0,0 +1,39 @@
+"""
+Keeps ClubCard (ActiveClubListAPIView) in step with what it is built from.
+
+  Club      saved         → its card (a new Review lands here via the rating save)
+  Feature   saved/deleted → its club's card
+  Tag       saved         → the cards of every club using it
+
+A deleted club's card goes with the CASCADE. Refreshes run on commit, so a
+rolled-back write leaves the cards untouched.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from dashboard_manage.models import Club
+from management.models import Feature, Tag
+from player_booking.services.ClubCardService import ClubCardService
+
+CARD_FIELDS = frozenset(ClubCardService.CLUB_FIELDS)
+
+
+@receiver(post_save, sender=Club, dispatch_uid="club_card_club_saved")
+def club_card_club_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and CARD_FIELDS.isdisjoint(update_fields):
+        return
+    ClubCardService.refresh_on_commit([instance.id])
+
+
+@receiver(post_save, sender=Feature, dispatch_uid="club_card_feature_saved")
+@receiver(post_delete, sender=Feature, dispatch_uid="club_card_feature_deleted")
+def club_card_feature_changed(sender, instance, **kwargs):
+    ClubCardService.refresh_on_commit([instance.club_id])
+
+
+@receiver(post_save, sender=Tag, dispatch_uid="club_card_tag_saved")
+def club_card_tag_saved(sender, instance, created, **kwargs):
+    if created:
+        return
+    club_ids = Feature.objects.filter(tag=instance).values_list('club_id', flat=True).distinct()
+    ClubCardService.refresh_on_commit(club_ids)
@@ -6,16 +6,17 @@ from rest_framework import status
 from dashboard_booking.services.PricingService import PricingService
 from urllib import request
 from dashboard_manage.models import Club, BookingDuration, ClubDeposit, Pitch
-from django.db.models import Prefetch
-from management.models import Feature
-from .serializers import BookingDetailSerializer, UserBookingSerializer, BookingPriceRequestForUserSerializer, EquipmentAvailabilityQueryForUserSerializer, ClubListSerializer, ClubIDFilterSerializer, BookingCreateForUserSerializer, ConsolidatedBookingQuerySerializer
+from .serializers import BookingDetailSerializer, UserBookingSerializer, BookingPriceRequestForUserSerializer, EquipmentAvailabilityQueryForUserSerializer, ClubIDFilterSerializer, BookingCreateForUserSerializer, ConsolidatedBookingQuerySerializer, ClubCardSerializer, PendingActionSerializer, CouponSerializer, ReviewCreateSerializer, ReviewListSerializer, PitchSearchResultSerializer, PitchSearchSerializer
 from core.services.CouponService import CouponService
+from core.conditional import conditional_response, requested_layout
+from core.response_cache import CachedResponseMixin
+from core.replica import UseReplicaMixin
 from .helper import haversine_distance
-from .serializers import PendingActionSerializer, BookingPriceRequestForUserSerializer, CouponSerializer,ReviewCreateSerializer, ReviewListSerializer,  EquipmentAvailabilityQueryForUserSerializer, ClubListSerializer, ClubIDFilterSerializer, BookingCreateForUserSerializer, ConsolidatedBookingQuerySerializer, PitchSearchResultSerializer, PitchSearchSerializer
 from player_booking.services.ClubTimeService import ClubTimeService
 from rest_framework.generics import get_object_or_404
 from rest_framework.views import APIView
-from .models import Booking, Coupon, Review
+from .models import Booking, ClubCard, Coupon, Review
+from core.search import ranked_search
 from .services.ClubInfoService import ClubInfoService
 from dashboard_booking.services.EquipmentBookingService import EquipmentBookingService
 from django.conf import settings
@@ -101,7 +102,7 @@ class UserBookingDetailView(generics.RetrieveAPIView):
 
 
 
-class UserBookingListView(generics.GenericAPIView):
+class UserBookingListView(UseReplicaMixin, generics.GenericAPIView):
     permission_classes = [IsPlayerPermission]
     serializer_class = UserBookingSerializer
     pagination_class = MyBookingPagination
@@ -163,46 +164,23 @@ class UserBookingListView(generics.GenericAPIView):
     #         raise ValidationError({'status': f'Invalid status. Valid choices: {valid}'})
     #     return value   
 
-class StatusKeysForUserBookingListAPIView(APIView):
+class StatusKeysForUserBookingListAPIView(CachedResponseMixin, APIView):
+    cache_max_age = 60 * 60 * 24
+
     def get(self, request):
   
-        return Response({
+        return self.cached_response(request, lambda: {
             "statuses": list(ARABIC_STATUS_MAP.keys())
         })
 
 class ActiveClubListAPIView(generics.ListAPIView):
+    """Served from the precomputed ClubCard rows — one indexed read per page, no joins."""
     permission_classes = [IsPlayerPermission]
-    serializer_class = ClubListSerializer
+    serializer_class = ClubCardSerializer
     pagination_class = ClubPagination
 
     def get_queryset(self):
-        queryset = (
-            Club.objects.filter(is_active=True)
-            .prefetch_related(
-                Prefetch(
-                    "feature_set",
-                    queryset=Feature.objects.filter(is_active=True)
-                    .select_related("tag")
-                    .only("club_id", "tag__name", "tag__logo"),
-                    to_attr="active_features",
-                )
-            )
-            .only(
-                "id",
-                "name",
-                "description",
-                "address",
-                "latitude",
-                "longitude",
-                "open_time",
-                "close_time",
-                "logo",
-                "rating_avg",
-                "rating_count",
-                "flexible_reservation",
-                "governorate",
-            )
-        )
+        queryset = ClubCard.objects.filter(is_active=True).only("club_id", "card")
 
         governorate = self.request.query_params.get("governorate")
         if governorate is not None:
@@ -216,7 +194,7 @@ class ActiveClubListAPIView(generics.ListAPIView):
             search = search.strip()
             if not search:
                 raise ValidationError({"search": "لا يمكن أن يكون البحث فارغاً."})
-            queryset = queryset.filter(name__icontains=search)
+            queryset = ranked_search(queryset, search)
 
         return queryset    
 
@@ -224,6 +202,7 @@ class ActiveClubListAPIView(generics.ListAPIView):
 def ClubOpeningPrices(request):
     """
     GET: for list all opening time and the price for each pitch for club for next X days
+    ?layout=compact (or Accept: application/json; layout=compact) sends each pitch once
     """
     permission_classes = [IsPlayerPermission]
     input_serializer = ClubIDFilterSerializer(data=request.query_params)
@@ -231,8 +210,11 @@ def ClubOpeningPrices(request):
     params = input_serializer.validated_data
     
     
-    opening_time_with_pitches_prices = ClubTimeService.get_opening_time_with_pitches_prices(params['club_id'], settings.MAX_NUM_DAY_BEFORE_BOOKING, request)
-    return Response(opening_time_with_pitches_prices)
+    if requested_layout(request) == 'compact':
+        opening_time_with_pitches_prices = ClubTimeService.get_opening_time_with_pitches_prices_compact(params['club_id'], settings.MAX_NUM_DAY_BEFORE_BOOKING, request)
+    else:
+        opening_time_with_pitches_prices = ClubTimeService.get_opening_time_with_pitches_prices(params['club_id'], settings.MAX_NUM_DAY_BEFORE_BOOKING, request)
+    return conditional_response(request, opening_time_with_pitches_prices, headers={'Vary': 'Accept'})
 
 
 
@@ -264,20 +246,28 @@ class CouponCreateView(APIView):
         coupon = serializer.save(club=club)
         return Response(CouponSerializer(coupon).data, status=status.HTTP_201_CREATED)
 
-class ShowBookingDurationForClub(APIView):
+class ShowBookingDurationForClub(CachedResponseMixin, APIView):
     permission_classes = [IsPlayerPermission]
-    def get(self, request, club_id):
-        duration = BookingDuration.objects.values("duration").filter(club_id=club_id)
+    cache_models = ('dashboard_manage.BookingDuration',)
 
-        return Response(duration)
+    def get(self, request, club_id):
+        return self.cached_response(
+            request,
+            lambda: list(BookingDuration.objects.values("duration").filter(club_id=club_id)),
+            club_id,
+        )
 
 
-class ShowBookingDepositForClub(APIView):
+class ShowBookingDepositForClub(CachedResponseMixin, APIView):
     permission_classes = [IsPlayerPermission]
-    def get(self, request, club_id):
-        duration = ClubDeposit.objects.values("deposit_percent", "id").filter(club_id=club_id)
+    cache_models = ('dashboard_manage.ClubDeposit',)
 
-        return Response(duration)
+    def get(self, request, club_id):
+        return self.cached_response(
+            request,
+            lambda: list(ClubDeposit.objects.values("deposit_percent", "id").filter(club_id=club_id)),
+            club_id,
+        )
 # class PitchSearchView(APIView):
 
 #     def post(self, request):
@@ -1,5 +1,6 @@
 from django.utils import timezone
 from rest_framework import serializers
+from core.media import media_url
 from player_team.models import Team, TeamMember
 from player_booking.models import BookingStatus
 from .models import Challenge, ChallengePlayerBooking, ScoreSubmission, ChallengeStatus
@@ -24,7 +25,7 @@ class TeamSnippetSerializer(serializers.Serializer):
     def get_logo(self, obj):
         request = self.context.get('request')
         if obj.logo and obj.logo.logo:
-            return request.build_absolute_uri(obj.logo.logo.url) if request else obj.logo.logo.url
+            return media_url(obj.logo.logo, request)
         return None
 
 
@@ -146,7 +147,7 @@ class PlayerSerializer(serializers.Serializer):
     def get_image(self, obj):
         request = self.context.get('request')
         if obj.player.image:
-            return request.build_absolute_uri(obj.player.image.url) if request else obj.player.image.url
+            return media_url(obj.player.image, request)
         return None
 
 
@@ -159,7 +160,7 @@ class TeamWithPlayersSerializer(serializers.Serializer):
     def get_logo(self, obj):
         request = self.context.get('request')
         if obj.logo and obj.logo.logo:
-            return request.build_absolute_uri(obj.logo.logo.url) if request else obj.logo.logo.url
+            return media_url(obj.logo.logo, request)
         return None
 
     def get_players(self, obj):
@@ -217,7 +218,7 @@ class TeamLogoMixin:
         request = self.context.get('request')
         logo = getattr(obj, 'logo', None)
         if logo and logo.logo:
-            return request.build_absolute_uri(logo.logo.url) if request else logo.logo.url
+            return media_url(logo.logo, request)
         return None
 
 
@@ -232,7 +233,7 @@ class PlayerInTeamSerializer(serializers.Serializer):
     def get_image(self, obj):
         request = self.context.get('request')
         if obj.player.image:
-            return request.build_absolute_uri(obj.player.image.url) if request else obj.player.image.url
+            return media_url(obj.player.image, request)
         return None
 
 
@@ -358,7 +359,7 @@ class TeamInPlayerChallengeSerializer(serializers.Serializer):
     def get_logo(self, obj):
         request = self.context.get('request')
         if obj.logo and obj.logo.logo:
-            return request.build_absolute_uri(obj.logo.logo.url) if request else obj.logo.logo.url
+            return media_url(obj.logo.logo, request)
         return None
 
 
@@ -549,7 +550,7 @@ class PlayerProfileSerializer(serializers.ModelSerializer):
     def get_image(self, obj):
         request = self.context.get('request')
         if obj.image:
-            return request.build_absolute_uri(obj.image.url) if request else obj.image.url
+            return media_url(obj.image, request)
         return None
 
     def get_challenges(self, obj):
@@ -674,7 +675,7 @@ class ShowChallengeTeamsSerializer(serializers.ModelSerializer):
     def get_logo_url(self, obj) -> str | None:
         try:
             request = self.context['request']
-            return request.build_absolute_uri(obj.logo.logo.url)
+            return media_url(obj.logo.logo, request)
         except (AttributeError, ValueError):
             return None
 
@@ -698,7 +699,7 @@ class TeamBriefSerializer(serializers.Serializer):
         image_field = obj.logo.logo          # Team.logo → TeamImage.logo (ImageField)
         if not image_field:
             return None
-        return request.build_absolute_uri(image_field.url) if request else image_field.url
+        return media_url(image_field, request)
 
 
 class PitchBriefSerializer(serializers.Serializer):
@@ -730,7 +731,7 @@ class ChallengeEquipmentSerializer(serializers.Serializer):
         if not image_field:
             return None
 
-        return request.build_absolute_uri(image_field.url) if request else image_field.url
+        return media_url(image_field, request)
 
 class PendingChallengeSerializer(serializers.ModelSerializer):
     team            = TeamBriefSerializer(read_only=True)
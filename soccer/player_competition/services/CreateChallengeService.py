@@ -1,7 +1,6 @@
 from django.db import transaction
 from django.db.models import Count, Q
 from core.services.notification_service import NotificationService
-from soccer.enm import BOOKING_STATUS_DENIED
 from django.conf import settings
 
 from ..models import Challenge, ChallengeStatus,ChallengeEquipment
@@ -9,6 +8,7 @@ from player_team.models import Team, TeamMember, MemberStatus
 from dashboard_manage.models import ClubDeposit, Pitch
 from rest_framework.exceptions import ValidationError
 from dashboard_booking.services.EquipmentBookingService import EquipmentBookingService
+from dashboard_booking.services.SlotReservationService import SlotReservationService
 
 from decimal import Decimal
 from dashboard_manage.models import ClubEquipment
@@ -144,19 +144,11 @@ class CreateChallengeService:
                 {"error": "لا يمكن إنشاء التحدي بسبب تعارض في جدول الحجز لأحد أعضاء الفريقين."}
             )
 
-        # ── Query 4: pitch booking conflict ────────────────────────────
-        overlapping = Booking.objects.filter(
-            pitch_id=pitch_id,
-            date=date,
-            status__in=BOOKING_STATUS_DENIED,
-            start_time__lt=end_time,
-            end_time__gt=start_time,
-        ).exists()
-
-        if overlapping:
-            raise ValidationError(
-                {"error": "هدا الملعب غير متاح في هذا الوقت بسبب حجز موجود بالفعل."}
-            )
+        # ── Query 4: pitch booking conflict (under the pitch/day lock) ──
+        SlotReservationService.ensure_slot_free(
+            pitch_id, date, start_time, end_time,
+            error_message="هدا الملعب غير متاح في هذا الوقت بسبب حجز موجود بالفعل.",
+        )
 
         # ── Query 5: write ─────────────────────────────────────────────
         challenge = Challenge.objects.create(
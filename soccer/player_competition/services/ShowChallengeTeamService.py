@@ -3,6 +3,7 @@ from django.db.models.functions import ExtractYear, Now
 from rest_framework.exceptions import ValidationError
 from django.conf import settings
 
+from core.search import ranked_search
 from player_team.models import Team, TeamMember, MemberStatus
  
 class ShowChallengeTeamService:
@@ -56,7 +57,7 @@ class ShowChallengeTeamService:
         )
 
         if name:
-            qs = qs.filter(name__icontains=name)
+            qs = ranked_search(qs, name)
     
         if min_avg_age is not None:
             qs = qs.filter(avg_player_age__gte=min_avg_age) 
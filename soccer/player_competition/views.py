@@ -26,6 +26,7 @@ from rest_framework.permissions import IsAuthenticated
 from .services.PlayerChallengesService import PlayerChallengesService
 from .services.TeamChallengesService import TeamChallengesService
 from core.permission import IsPlayerPermission, IsClubOwnerPermission, IsClubStaffOrOwnerPermission
+from core.replica import UseReplicaMixin
 
 VALID_RESULTS = [
             'قريباً',
@@ -98,7 +99,7 @@ class TeamDetailView(generics.RetrieveAPIView):
             team_id=self.kwargs['team_id']
         )
     
-class PlayerProfileView(generics.RetrieveAPIView):
+class PlayerProfileView(UseReplicaMixin, generics.RetrieveAPIView):
     serializer_class = PlayerProfileSerializer
     permission_classes = [IsPlayerPermission, IsClubStaffOrOwnerPermission]
     def get_object(self):
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.10 on 2026-10-19 19:10
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+_ARABIC_MARKS = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+_ARABIC_FOLD = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ئ': 'ي', 'ؤ': 'و', 'ة': 'ه',
+})
+_SEPARATORS = re.compile(r'[\W_]+')
+
+
+def search_key(text):
+    """core.search.search_key at the time of this migration."""
+    text = unicodedata.normalize('NFKC', str(text or ''))
+    text = _ARABIC_MARKS.sub('', text).translate(_ARABIC_FOLD).casefold()
+    return ' '.join(word for word in _SEPARATORS.split(text) if word)
+
+
+def backfill_search_names(apps, schema_editor):
+    Team = apps.get_model('player_team', 'Team')
+    teams = list(Team.objects.only('id', 'name'))
+    for team in teams:
+        team.search_name = search_key(team.name)[:100]
+    Team.objects.bulk_update(teams, ['search_name'], batch_size=1000)
+
+
+def add_trigram_index(apps, schema_editor):
+    # Substring search on PostgreSQL — see core.search
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS team_search_trgm '
+        'ON teams USING gin (search_name gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS team_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player_team', '0006_alter_team_governorate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='search_name',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(backfill_search_names, migrations.RunPython.noop),
+        migrations.RunPython(add_trigram_index, drop_trigram_index),
+    ]
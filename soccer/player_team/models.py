@@ -28,6 +28,7 @@ class Team(models.Model):
     time = models.CharField(max_length=255, blank=True)
     captain = models.ForeignKey(User, on_delete=models.CASCADE)
     name = models.CharField(max_length=100, unique=True)
+    search_name = models.CharField(max_length=100, blank=True, editable=False)  # core.search key of name
     logo = models.ForeignKey(TeamImage, on_delete=models.PROTECT)
     total_wins = models.PositiveBigIntegerField(default=0, validators=[MinValueValidator(0)])
     total_losses = models.PositiveBigIntegerField(default=0, validators=[MinValueValidator(0)])
@@ -1,12 +1,16 @@
 from rest_framework import serializers
 
 from core.governorates import SyrianGovernorate
+from core.media import media_url
+from core.thumbnails import LOGO, ThumbnailURLField
 from .models import Team, TeamMember, MemberStatus, Request, TeamImage
 
 class TeamImageerializer(serializers.ModelSerializer):
+    logo_thumb_url = ThumbnailURLField(source='logo', size=LOGO)
+
     class Meta:
         model = TeamImage
-        fields = ['id', 'logo']
+        fields = ['id', 'logo', 'logo_thumb_url']
 
 
 class TeamMemberSerializer(serializers.ModelSerializer):
@@ -18,6 +22,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
     full_name = serializers.CharField(source='player.full_name', read_only=True)
     username = serializers.CharField(source='player.username', read_only=True)
     image = serializers.SerializerMethodField()
+    image_thumb_url = ThumbnailURLField(source='player.image', size=LOGO)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
 
     class Meta:
@@ -28,6 +33,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
             'full_name',
             'username',
             'image',
+            'image_thumb_url',
             'status_display',
             'is_captain',
             'joined_at'
@@ -39,9 +45,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
 
             request = self.context.get('request')
             print("request", request)
-            if request:
-                return request.build_absolute_uri(image.url)
-            return image.url
+            return media_url(image, request)
         return None
 
 class UserTeamListSerializer(serializers.ModelSerializer):
@@ -52,6 +56,7 @@ class UserTeamListSerializer(serializers.ModelSerializer):
     team_id = serializers.UUIDField(source='team.id', read_only=True)
     team_name = serializers.CharField(source='team.name', read_only=True)
     team_logo = serializers.SerializerMethodField()
+    team_logo_thumb_url = ThumbnailURLField(source='team.logo.logo', size=LOGO)
     challenge_mode = serializers.BooleanField(source='team.challenge_mode', read_only=True)
     joined_at = serializers.DateTimeField(read_only=True)
     win_rate = serializers.FloatField(source='team.win_rate', read_only=True)
@@ -60,16 +65,14 @@ class UserTeamListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TeamMember
-        fields = ['team_id', 'team_name', 'team_logo', 'is_captain', 'challenge_mode', 'joined_at', 'win_rate', 'clean_sheet', 'goals_scored']
+        fields = ['team_id', 'team_name', 'team_logo', 'team_logo_thumb_url', 'is_captain', 'challenge_mode', 'joined_at', 'win_rate', 'clean_sheet', 'goals_scored']
 
     def get_team_logo(self, obj):
         """Get team logo URL, building absolute URL if request context is available"""
         if obj.team.logo.logo:
             logo = obj.team.logo.logo
             request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(logo.url)
-            return logo.url
+            return media_url(logo, request)
         return None
 
 class TeamDetailsSerializer(serializers.ModelSerializer):
@@ -80,6 +83,7 @@ class TeamDetailsSerializer(serializers.ModelSerializer):
     total_matches = serializers.IntegerField(read_only=True)
     win_rate = serializers.FloatField(read_only=True)
     logo = serializers.SerializerMethodField()
+    logo_thumb_url = ThumbnailURLField(source='logo.logo', size=LOGO)
     members = serializers.SerializerMethodField()
     members_count = serializers.SerializerMethodField()
     governorate = serializers.CharField(source='get_governorate_display')
@@ -92,6 +96,7 @@ class TeamDetailsSerializer(serializers.ModelSerializer):
             'address',
             'time',
             'logo',
+            'logo_thumb_url',
             'total_wins',
             'total_losses',
             'total_draw',
@@ -116,9 +121,7 @@ class TeamDetailsSerializer(serializers.ModelSerializer):
             logo = obj.logo.logo
 
             request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(logo.url)
-            return logo.url
+            return media_url(logo, request)
         return None
 
     def get_members(self, obj):
@@ -200,6 +203,7 @@ class InvitationRequestSerializer(serializers.ModelSerializer):
     # team_id = serializers.UUIDField(source='team.id', read_only=True)
     team_name = serializers.CharField(source='team.name', read_only=True)
     team_logo = serializers.SerializerMethodField()
+    team_logo_thumb_url = ThumbnailURLField(source='team.logo.logo', size=LOGO)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     recruitment_post_type = serializers.CharField(source='recruitment_post.get_type_display', read_only=True, allow_null=True)
     recruitment_post_description = serializers.CharField(source='recruitment_post.description', read_only=True, allow_null=True)
@@ -212,6 +216,7 @@ class InvitationRequestSerializer(serializers.ModelSerializer):
             'team_id',
             'team_name',
             'team_logo',
+            'team_logo_thumb_url',
             'status_display',
             'recruitment_post_type',
             'recruitment_post_description',
@@ -225,9 +230,7 @@ class InvitationRequestSerializer(serializers.ModelSerializer):
         """Get team logo URL, building absolute URL if request context is available"""
         if obj.team and obj.team.logo and obj.team.logo.logo:
             request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.team.logo.logo.url)
-            return obj.team.logo.logo.url
+            return media_url(obj.team.logo.logo, request)
         return None
 
 class ShowTeamInvitationSendSerializer(serializers.ModelSerializer):
@@ -260,9 +263,7 @@ class ShowTeamInvitationSendSerializer(serializers.ModelSerializer):
         """Get team logo URL, building absolute URL if request context is available"""
         if obj.team and obj.team.logo and obj.team.logo.logo:
             request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.team.logo.logo.url)
-            return obj.team.logo.logo.url
+            return media_url(obj.team.logo.logo, request)
         return None
 
 
@@ -473,9 +474,7 @@ class TeamResponseSerializer(serializers.ModelSerializer):
         """Get team logo URL, building absolute URL if request context is available"""
         if obj.logo:
             request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.logo.url)
-            return obj.logo.url
+            return media_url(obj.logo, request)
         return None
 
 
@@ -1,10 +1,13 @@
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q, Subquery
 from django.conf import settings
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
 from core.models import User
 from core.governorates import SyrianGovernorate
+from core.media import media_url
+from core.thumbnails import LOGO, thumb_url
+from core.search import ranked_search
 from ..models import Team, TeamMember, Request, MemberStatus
 from django.db.models import Count, Q
 from django.conf import settings
@@ -283,69 +286,70 @@ class TeamInvitationService:
         return invitations
     
     @classmethod
-    def search_users_by_username(cls, captain_id, current_team, username_filter, request, *, governorate=None):
+    def search_users_by_username(cls, captain_id, current_team, username_filter, *, governorate=None):
         """
         Search users by username filter.
-        Returns full list — pagination is handled at the view level.
+        Returns a values() queryset — the view paginates it in the database,
+        then formats just that page with format_user_search_page().
+        Membership and pending request come from per-row subqueries, so
+        they are only computed for the rows of the page.
         """
         if not username_filter or not username_filter.strip():
-            return []
+            return User.objects.none()
 
-        qs = (
+        qs = ranked_search(
             User.objects
-            .filter(username__icontains=username_filter.strip(), role=1, is_active=True)
+            .filter(role=1, is_active=True)
             .exclude(id=captain_id)
-            .order_by('username')
+            .order_by('username'),
+            username_filter,
         )
 
         if governorate is not None:
             qs = qs.filter(governorate=governorate)
 
-        # No [:limit] here — paginator slices the list in the view
-        users = list(qs.values('id', 'username', 'full_name', 'image', 'governorate'))
-
-        if not users:
-            return []
-
-        user_ids = [u['id'] for u in users]
-
-        member_ids = set(
-            TeamMember.objects.filter(
-                player_id__in=user_ids,
-                team_id=current_team,
-                status__in=[MemberStatus.ACTIVE, MemberStatus.INACTIVE]
-            ).values_list('player_id', flat=True)
+        in_team = TeamMember.objects.filter(
+            player_id=OuterRef('pk'),
+            team_id=current_team,
+            status__in=[MemberStatus.ACTIVE, MemberStatus.INACTIVE],
         )
+        pending_request = Request.objects.filter(
+            player_id=OuterRef('pk'),
+            team_id=current_team,
+            status=1,
+        ).order_by('-created_at')
 
-        pending_requests = dict(
-            Request.objects.filter(
-                player_id__in=user_ids,
-                team_id=current_team,
-                status=1
-            ).values_list('player_id', 'id')
-        )
+        return qs.annotate(
+            in_team=Exists(in_team),
+            pending_request_id=Subquery(pending_request.values('id')[:1]),
+        ).values('id', 'username', 'full_name', 'image', 'governorate', 'in_team', 'pending_request_id')
 
+    @staticmethod
+    def format_user_search_page(users, request):
+        """Response rows of one page of search_users_by_username()."""
+        page = []
         for user in users:
-            if user['id'] in member_ids:
-                user['connection_status'] = 'in_team'
-                user['request_id'] = None
-            elif user['id'] in pending_requests:
-                user['connection_status'] = 'pending'
-                user['request_id'] = str(pending_requests[user['id']])
+            if user['in_team']:
+                connection_status, request_id = 'in_team', None
+            elif user['pending_request_id'] is not None:
+                connection_status, request_id = 'pending', str(user['pending_request_id'])
             else:
-                user['connection_status'] = 'not'
-                user['request_id'] = None
-
-            user['image'] = (
-                request.build_absolute_uri(settings.MEDIA_URL + user['image'])
-                if user['image'] else None
-            )
-            user['governorate'] = (
-                SyrianGovernorate(user['governorate']).label
-                if user['governorate'] is not None else None
-            )
-
-        return users
+                connection_status, request_id = 'not', None
+
+            page.append({
+                'id': user['id'],
+                'username': user['username'],
+                'full_name': user['full_name'],
+                'image': media_url(user['image'], request),
+                'governorate': (
+                    SyrianGovernorate(user['governorate']).label
+                    if user['governorate'] is not None else None
+                ),
+                'connection_status': connection_status,
+                'request_id': request_id,
+                'image_thumb_url': thumb_url(user['image'], LOGO, request),
+            })
+        return page
     
     @classmethod
     def remove_player_from_team(cls, user_id, team_id, player_id_to_remove=None):
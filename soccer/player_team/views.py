@@ -25,9 +25,11 @@ from .serializers import (
 from player_team.services import TeamInvitationService, TeamService
 from .pagination import UserSearchPagination
 from core.permission import IsPlayerPermission, IsClubOwnerPermission, IsClubStaffOrOwnerPermission
+from core.response_cache import CachedResponseMixin
 
 
-class TeamImageListAPIView(generics.ListAPIView):
+class TeamImageListAPIView(CachedResponseMixin, generics.ListAPIView):
+    cache_models = ('player_team.TeamImage',)
     queryset = TeamImage.objects.all()
     serializer_class = TeamImageerializer
 
@@ -314,19 +316,21 @@ class SearchUsersView(APIView):
             captain_id,
             team_id,
             username_filter,
-            request,
             governorate=governorate,
         )
 
+        # LIMIT / OFFSET in the database — only the page is loaded and formatted
         paginator = UserSearchPagination()
         page = paginator.paginate_queryset(users, request, view=self)
 
         # paginate_queryset returns None if pagination is not configured
         # (won't happen with PageNumberPagination but safe to guard)
         if page is not None:
-            return paginator.get_paginated_response(page)
+            return paginator.get_paginated_response(
+                TeamInvitationService.format_user_search_page(page, request)
+            )
 
-        return Response(users, status=status.HTTP_200_OK)
+        return Response(TeamInvitationService.format_user_search_page(users, request), status=status.HTTP_200_OK)
     
 
 
@@ -4,6 +4,8 @@ from django.utils.timezone import now
 from django.urls import path
 from django.shortcuts import render, get_object_or_404
 
+from core.replica import use_replica
+
 
 STATUS_LABELS = {
     1:  ('Pending Club',      'bb'),
@@ -39,6 +41,7 @@ class StatsAdminSite(admin.AdminSite):
         return custom + urls
 
     # ── Club list ──────────────────────────────────────────────────
+    @use_replica
     def clubs_overview(self, request):
         from dashboard_manage.models import Club
         from player_booking.models import Booking
@@ -66,6 +69,7 @@ class StatsAdminSite(admin.AdminSite):
         return render(request, 'admin/clubs_overview.html', ctx)
 
     # ── Club detail ────────────────────────────────────────────────
+    @use_replica
     def club_detail(self, request, club_id):
         from dashboard_manage.models import Club, Pitch
         from player_booking.models import Booking
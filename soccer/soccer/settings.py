@@ -70,6 +70,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.replica.ReplicaPinMiddleware',
 ]
 
 load_dotenv()  # Load environment variables from .env file
@@ -105,12 +106,104 @@ WSGI_APPLICATION = 'soccer.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
+#
+# DB_ENGINE=sqlite (default)   development — db.sqlite3 in WAL mode, so readers
+#                              don't block the writer; writers wait instead of
+#                              failing with "database is locked"
+# DB_ENGINE=postgres           production — DB_NAME, DB_USER, DB_PASSWORD,
+#                              DB_HOST, DB_PORT
+#   DB_POOL=1                  Django's native psycopg pool (psycopg[pool]),
+#                              DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE per process
+#   DB_CONN_MAX_AGE            without the pool: seconds a connection is kept
+#                              between requests (default 60; 0 = per request)
+#   DB_REPLICA_HOST            adds a read-only 'replica' alias, same credentials
+#                              (DB_REPLICA_PORT, default DB_PORT)
+# DB_REPLICA_NAME              sqlite only — a second file as 'replica' (local testing)
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+
+
+def _postgres_database(host, port):
+    database = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('DB_NAME', 'soccer'),
+        'USER': os.environ.get('DB_USER', 'soccer'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': host,
+        'PORT': port,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    }
+    if os.environ.get('DB_POOL', '0') == '1':
+        # Pooled connections are returned at the end of each request — CONN_MAX_AGE must stay 0
+        database['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': 10,
+        }
+    else:
+        database['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+    return database
+
+
+def _sqlite_database(name):
+    return {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': name,
+        'OPTIONS': {
+            'timeout': 20,                      # busy_timeout, seconds
+            'transaction_mode': 'IMMEDIATE',    # take the write lock at BEGIN — no deadlocked upgrades
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+        },
+    }
+
+
+if DB_ENGINE == 'postgres':
+    DB_PORT = os.environ.get('DB_PORT', '5432')
+    DATABASES = {'default': _postgres_database(os.environ.get('DB_HOST', 'localhost'), DB_PORT)}
+    if os.environ.get('DB_REPLICA_HOST'):
+        DATABASES['replica'] = _postgres_database(
+            os.environ['DB_REPLICA_HOST'], os.environ.get('DB_REPLICA_PORT', DB_PORT),
+        )
+else:
+    DATABASES = {'default': _sqlite_database(os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'))}
+    if os.environ.get('DB_REPLICA_NAME'):
+        DATABASES['replica'] = _sqlite_database(os.environ['DB_REPLICA_NAME'])
+
+# Reporting / history views opt into the replica (core.replica.use_replica)
+DATABASE_ROUTERS = ['core.replica.ReplicaRouter']
+REPLICA_STICKY_SECONDS    = 10     # a user's reads stay on the primary this long after their own write
+REPLICA_MAX_LAG_SECONDS   = 5      # further behind than this → primary
+REPLICA_LAG_CHECK_SECONDS = 2      # how long a lag measurement is reused
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# Shared by every web worker and the django-q cluster: report / response
+# versions, replica pins and search index versions are bumped in one process
+# and read in all the others — a per-process LocMemCache would miss them.
+#
+# REDIS_URL=redis://host:6379/0   Redis (redis-py)
+# otherwise                       the database cache, table django_cache
+#                                 (created after migrate; or
+#                                 `python manage.py createcachetable`)
+
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            'OPTIONS': {'MAX_ENTRIES': 20000},
+        },
     }
-}
 
 TIME_ZONE = 'Asia/Damascus'  
 
@@ -175,6 +268,13 @@ USE_TZ = True
 
 IMAGE_UPDATE_INTERVAL_DAYS = 30
 
+# Profile image face check (core.utils.validate_profile_image)
+# 'sync' rejects in the request; 'deferred' checks on the django-q cluster after save
+PROFILE_IMAGE_VALIDATION = os.environ.get('PROFILE_IMAGE_VALIDATION', 'sync')
+FACE_DETECTION_WORKERS   = int(os.environ.get('FACE_DETECTION_WORKERS', 2))    # per web process; 0 = inline
+FACE_DETECTION_QUEUE     = int(os.environ.get('FACE_DETECTION_QUEUE', 4))      # waiting beyond the workers; more → busy at once
+FACE_DETECTION_TIMEOUT   = 10                                                  # seconds, queue wait included
+
 
 CORS_ALLOW_ALL_ORIGINS = True
 
@@ -206,11 +306,16 @@ MIN_NUM_DAY_BEFORE_CHALLENGE=0
 MAX_NUM_DAY_BEFORE_CHALLENGE=10
 MIN_NUM_DAY_BEFORE_BOOKING=0
 MAX_NUM_DAY_BEFORE_BOOKING=10
+CALENDAR_MAX_DAYS = 31     # longest range of the owner calendar grid
 MIN_TEAM_MEMBERS = 1
 MIN_TEAM_MEMBERS_FOR_CHALLENGE = 1
 PAYMENT_REMINDER_MINUTES = 30
 #jobs helpers
 BOOKING_EXPIRY_HOURS = 0.01
 BOOKING_NOTIFICATIONS_EXPIRY_HOURS = 2
+#payment reconciliation (management.services.PaymentReconciliationService)
+PAYMENT_MATCH_TOLERANCE = 0          # SYP either side of the expected amount
+PAYMENT_MATCH_LOOKBACK_DAYS = 3      # open bookings / transfers older than this are ignored
+PAYMENT_MATCH_AMOUNT_ONLY = False    # True → a unique exact-amount candidate is matched without payer evidence
 
 STATIC_ROOT =  os.path.join(BASE_DIR,'api/static/static_api')
\ No newline at end of file